@@ -0,0 +1,117 @@
+import asyncio
+import math
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable
+
+from fastapi import HTTPException, status
+
+
+class AdmissionGate:
+    """Bounded concurrency with a bounded wait queue for expensive calls.
+
+    Up to `max_concurrent` callers run at once and up to `max_queue` more wait (FIFO)
+    for at most `max_wait_seconds`. A full queue is rejected with 429, and a wait that
+    times out is rejected with 503. Both responses carry `Retry-After`. Waiters are
+    plain futures, so the gate is not tied to a single event loop.
+    """
+
+    def __init__(self, max_concurrent: int, max_queue: int, max_wait_seconds: float) -> None:
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.max_wait_seconds = max_wait_seconds
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self.admitted = 0
+        self.rejected_queue_full = 0
+        self.rejected_timeout = 0
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for waiter in self._waiters if not waiter.done())
+
+    async def acquire(self) -> Callable[[], None]:
+        """Wait for a slot and return an idempotent release callback."""
+        if self._in_flight < self.max_concurrent and not self.queued:
+            self._in_flight += 1
+        else:
+            await self._wait_for_slot()
+        self.admitted += 1
+        released = False
+
+        def _release() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                self._release()
+
+        return _release
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        release = await self.acquire()
+        try:
+            yield
+        finally:
+            release()
+
+    def stats(self) -> dict[str, int | float]:
+        return {
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+            "max_wait_seconds": self.max_wait_seconds,
+            "admitted": self.admitted,
+            "rejected_queue_full": self.rejected_queue_full,
+            "rejected_timeout": self.rejected_timeout,
+        }
+
+    async def _wait_for_slot(self) -> None:
+        if self.queued >= self.max_queue:
+            self.rejected_queue_full += 1
+            raise self._rejection(status.HTTP_429_TOO_MANY_REQUESTS, "Summary queue is full")
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, self.max_wait_seconds)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as exc:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over as we gave up; pass it on to the next waiter.
+                self._release()
+            else:
+                self._discard(waiter)
+            if isinstance(exc, asyncio.CancelledError):
+                raise
+            self.rejected_timeout += 1
+            raise self._rejection(
+                status.HTTP_503_SERVICE_UNAVAILABLE, "Summary capacity exhausted"
+            ) from exc
+
+    def _release(self) -> None:
+        # Hand the slot directly to the oldest live waiter; otherwise free it.
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._in_flight -= 1
+
+    def _discard(self, waiter: asyncio.Future[None]) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def _rejection(self, status_code: int, detail: str) -> HTTPException:
+        retry_after = max(math.ceil(self.max_wait_seconds), 1)
+        return HTTPException(
+            status_code=status_code,
+            detail=detail,
+            headers={"Retry-After": str(retry_after)},
+        )
@@ -1,8 +1,34 @@
+import asyncio
+import hashlib
+from contextlib import aclosing
+from typing import AsyncIterator
+
+import httpx
+import redis.asyncio as redis
 from pydantic import BaseModel
 from pydantic_ai import Agent
 from pydantic_ai.models.openai import OpenAIModel
 
-from .config import OLLAMA_API_KEY, OLLAMA_BASE_URL, OLLAMA_MODEL
+from .admission import AdmissionGate
+from .cache import ResultCache
+from .config import (
+    AI_CONNECT_TIMEOUT_SECONDS,
+    AI_KEEPALIVE_EXPIRY_SECONDS,
+    AI_MAX_CONNECTIONS,
+    AI_REQUEST_TIMEOUT_SECONDS,
+    AI_SUMMARY_CACHE_MAX_ENTRIES,
+    AI_SUMMARY_CACHE_REDIS,
+    AI_SUMMARY_CACHE_TTL_SECONDS,
+    AI_SUMMARY_CHUNK_SIZE,
+    AI_SUMMARY_MAX_CONCURRENT,
+    AI_SUMMARY_MAX_PARALLEL,
+    AI_SUMMARY_MAX_QUEUE,
+    AI_SUMMARY_MAX_WAIT_SECONDS,
+    OLLAMA_API_KEY,
+    OLLAMA_BASE_URL,
+    OLLAMA_MODEL,
+    REDIS_URL,
+)
 from .models import Series
 
 
@@ -11,11 +37,61 @@ class SummaryResult(BaseModel):
     highlights: list[str]
 
 
-def _build_agent() -> Agent[str]:
+class SummaryProgress(BaseModel):
+    """A finished map shard of a large catalog, streamed before the merged summary."""
+
+    shards_done: int
+    shards_total: int
+    partial: str
+
+
+EMPTY_CATALOG_SUMMARY = SummaryResult(
+    summary="No series yet. Add a few entries to generate insights.",
+    highlights=[],
+)
+UNAVAILABLE_SUMMARY = SummaryResult(
+    summary="AI summary unavailable (model response was invalid).",
+    highlights=[],
+)
+
+
+summary_cache = ResultCache(
+    "tvdb:ai-summary",
+    ttl_seconds=AI_SUMMARY_CACHE_TTL_SECONDS,
+    max_entries=AI_SUMMARY_CACHE_MAX_ENTRIES,
+    redis_client=(
+        redis.Redis.from_url(REDIS_URL, decode_responses=True) if AI_SUMMARY_CACHE_REDIS else None
+    ),
+)
+
+
+_http_client: httpx.AsyncClient | None = None
+_agent: Agent[str] | None = None
+
+summary_gate = AdmissionGate(
+    max_concurrent=AI_SUMMARY_MAX_CONCURRENT,
+    max_queue=AI_SUMMARY_MAX_QUEUE,
+    max_wait_seconds=AI_SUMMARY_MAX_WAIT_SECONDS,
+)
+
+
+def _build_http_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(AI_REQUEST_TIMEOUT_SECONDS, connect=AI_CONNECT_TIMEOUT_SECONDS),
+        limits=httpx.Limits(
+            max_connections=AI_MAX_CONNECTIONS,
+            max_keepalive_connections=AI_MAX_CONNECTIONS,
+            keepalive_expiry=AI_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+    )
+
+
+def _build_agent(http_client: httpx.AsyncClient | None = None) -> Agent[str]:
     model = OpenAIModel(
         model_name=OLLAMA_MODEL,
         base_url=OLLAMA_BASE_URL,
         api_key=OLLAMA_API_KEY,
+        http_client=http_client,
     )
     return Agent(
         model,
@@ -31,39 +107,196 @@ def _build_agent() -> Agent[str]:
     )
 
 
-async def generate_summary(series: list[Series]) -> SummaryResult:
-    if not series:
-        return SummaryResult(
-            summary="No series yet. Add a few entries to generate insights.",
-            highlights=[],
-        )
+def get_agent() -> Agent[str]:
+    """Return the shared agent, creating it and its pooled HTTP client on first use."""
+    global _agent, _http_client
+    if _agent is None:
+        _http_client = _build_http_client()
+        _agent = _build_agent(_http_client)
+    return _agent
+
+
+async def close_agent() -> None:
+    """Close the shared HTTP client; the next `get_agent` call starts a fresh one."""
+    global _agent, _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+    _agent = None
+    _http_client = None
+
+
+def build_prompt(series: list[Series]) -> str:
     lines = [
         f"{row.title} ({row.year}) by {row.creator} rating {row.rating}"
         if row.rating is not None
         else f"{row.title} ({row.year}) by {row.creator} rating n/a"
         for row in series
     ]
-    prompt = "Catalog:\n" + "\n".join(lines)
-    agent = _build_agent()
+    return "Catalog:\n" + "\n".join(lines)
+
+
+def parse_summary(text: str) -> SummaryResult:
+    text = text.strip()
+    summary = ""
+    highlights: list[str] = []
+    if "Summary:" in text:
+        parts = text.split("Summary:", 1)[1].split("Highlights:", 1)
+        summary = parts[0].strip().strip("-").strip()
+        if len(parts) > 1:
+            highlights_block = parts[1]
+            for line in highlights_block.splitlines():
+                line = line.strip()
+                if line.startswith("-"):
+                    highlights.append(line.lstrip("-").strip())
+    if not summary:
+        summary = text.splitlines()[0].strip() if text else "Summary unavailable."
+    return SummaryResult(summary=summary, highlights=highlights)
+
+
+def summary_cache_key(prompt: str) -> str:
+    """Hash the prompt inputs together with the model that will answer them."""
+    return hashlib.sha256(f"{OLLAMA_MODEL}\n{prompt}".encode()).hexdigest()
+
+
+def build_reduce_prompt(partials: list[SummaryResult], total_rows: int) -> str:
+    parts = []
+    for idx, partial in enumerate(partials, start=1):
+        bullets = "\n".join(f"- {item}" for item in partial.highlights)
+        parts.append(f"Part {idx}: {partial.summary}\n{bullets}".rstrip())
+    return (
+        f"Partial summaries of one catalog of {total_rows} series, "
+        "each covering a different slice. Merge them into a single summary:\n\n"
+        + "\n\n".join(parts)
+    )
+
+
+async def _summarize_prompt(prompt: str) -> SummaryResult | None:
+    """Run one prompt through the cache and the model; None when the model fails.
+
+    Cache misses hold a `summary_gate` slot for the model call, so the gate bounds
+    concurrent generations across requests and map shards alike.
+    """
+    cache_key = summary_cache_key(prompt)
+    if cached := await summary_cache.get(cache_key):
+        return SummaryResult.model_validate_json(cached)
+
+    agent = get_agent()
+    async with summary_gate.slot():
+        try:
+            result = await agent.run(prompt)
+            summary = parse_summary(result.data)
+        except Exception:
+            return None
+    await summary_cache.set(cache_key, summary.model_dump_json())
+    return summary
+
+
+def _shards(series: list[Series]) -> list[list[Series]]:
+    return [
+        series[start : start + AI_SUMMARY_CHUNK_SIZE]
+        for start in range(0, len(series), AI_SUMMARY_CHUNK_SIZE)
+    ]
+
+
+async def _iter_partials(
+    shards: list[list[Series]],
+) -> AsyncIterator[tuple[int, SummaryResult | None]]:
+    """Summarize shards in parallel, yielding `(index, partial)` as each one finishes.
+
+    Shards still running when the caller stops iterating are cancelled.
+    """
+    semaphore = asyncio.Semaphore(AI_SUMMARY_MAX_PARALLEL)
+
+    async def _map(idx: int, shard: list[Series]) -> tuple[int, SummaryResult | None]:
+        async with semaphore:
+            return idx, await _summarize_prompt(build_prompt(shard))
+
+    tasks = [asyncio.ensure_future(_map(idx, shard)) for idx, shard in enumerate(shards)]
     try:
-        result = await agent.run(prompt)
-        text = result.data.strip()
-        summary = ""
-        highlights: list[str] = []
-        if "Summary:" in text:
-            parts = text.split("Summary:", 1)[1].split("Highlights:", 1)
-            summary = parts[0].strip().strip("-").strip()
-            if len(parts) > 1:
-                highlights_block = parts[1]
-                for line in highlights_block.splitlines():
-                    line = line.strip()
-                    if line.startswith("-"):
-                        highlights.append(line.lstrip("-").strip())
-        if not summary:
-            summary = text.splitlines()[0].strip() if text else "Summary unavailable."
-        return SummaryResult(summary=summary, highlights=highlights)
-    except Exception:
-        return SummaryResult(
-            summary="AI summary unavailable (model response was invalid).",
-            highlights=[],
-        )
+        for finished in asyncio.as_completed(tasks):
+            yield await finished
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def _map_partials(series: list[Series]) -> list[SummaryResult] | None:
+    """Summarize fixed-size shards in parallel; None if any shard failed.
+
+    A merge of the surviving shards would describe an arbitrary subset of the catalog,
+    so one failed shard fails the whole summary.
+    """
+    shards = _shards(series)
+    partials: dict[int, SummaryResult] = {}
+    async with aclosing(_iter_partials(shards)) as finished:
+        async for idx, partial in finished:
+            if partial is None:
+                return None
+            partials[idx] = partial
+    return [partials[idx] for idx in range(len(shards))]
+
+
+async def _map_reduce_summary(series: list[Series]) -> SummaryResult | None:
+    """Summarize shards in parallel, then merge the partial summaries."""
+    partials = await _map_partials(series)
+    if partials is None:
+        return None
+    return await _summarize_prompt(build_reduce_prompt(partials, len(series)))
+
+
+async def generate_summary(series: list[Series]) -> SummaryResult:
+    if not series:
+        return EMPTY_CATALOG_SUMMARY
+    if len(series) > AI_SUMMARY_CHUNK_SIZE:
+        summary = await _map_reduce_summary(series)
+    else:
+        summary = await _summarize_prompt(build_prompt(series))
+    return summary or UNAVAILABLE_SUMMARY
+
+
+async def stream_summary(
+    series: list[Series],
+) -> AsyncIterator[str | SummaryProgress | SummaryResult]:
+    """Yield text deltas as the model produces them, then the parsed result last.
+
+    Large catalogs yield a `SummaryProgress` as each map shard finishes, then stream
+    the final reduce call. Cache hits and failures (including any failed shard) yield
+    just the final result.
+    """
+    if not series:
+        yield EMPTY_CATALOG_SUMMARY
+        return
+    if len(series) > AI_SUMMARY_CHUNK_SIZE:
+        shards = _shards(series)
+        partials: dict[int, SummaryResult] = {}
+        async with aclosing(_iter_partials(shards)) as finished:
+            async for idx, partial in finished:
+                if partial is None:
+                    yield UNAVAILABLE_SUMMARY
+                    return
+                partials[idx] = partial
+                yield SummaryProgress(
+                    shards_done=len(partials), shards_total=len(shards), partial=partial.summary
+                )
+        prompt = build_reduce_prompt([partials[idx] for idx in range(len(shards))], len(series))
+    else:
+        prompt = build_prompt(series)
+
+    cache_key = summary_cache_key(prompt)
+    if cached := await summary_cache.get(cache_key):
+        yield SummaryResult.model_validate_json(cached)
+        return
+
+    chunks: list[str] = []
+    async with summary_gate.slot():
+        try:
+            async with get_agent().run_stream(prompt) as result:
+                async for delta in result.stream_text(delta=True, debounce_by=0.05):
+                    chunks.append(delta)
+                    yield delta
+            summary = parse_summary("".join(chunks))
+        except Exception:
+            yield UNAVAILABLE_SUMMARY
+            return
+    await summary_cache.set(cache_key, summary.model_dump_json())
+    yield summary
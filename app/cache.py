@@ -0,0 +1,88 @@
+import logging
+import time
+from collections import OrderedDict
+
+import redis.asyncio as redis
+
+logger = logging.getLogger("tv_db.cache")
+
+
+class ResultCache:
+    """In-memory LRU cache with a TTL and an optional shared Redis tier.
+
+    Values are JSON strings so both tiers store the same payload. Redis errors are
+    logged and treated as misses; the cache never fails a request.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl_seconds: int,
+        max_entries: int,
+        redis_client: redis.Redis | None = None,
+    ) -> None:
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.redis_client = redis_client
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self.memory_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    async def get(self, key: str) -> str | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+                return value
+            del self._entries[key]
+
+        if self.redis_client is not None:
+            try:
+                value = await self.redis_client.get(f"{self.namespace}:{key}")
+            except redis.RedisError:
+                logger.warning("Redis cache read failed for %s", self.namespace, exc_info=True)
+                value = None
+            if value is not None:
+                self.redis_hits += 1
+                self._remember(key, value)
+                return value
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, value: str) -> None:
+        self._remember(key, value)
+        if self.redis_client is not None:
+            try:
+                await self.redis_client.set(f"{self.namespace}:{key}", value, ex=self.ttl_seconds)
+            except redis.RedisError:
+                logger.warning("Redis cache write failed for %s", self.namespace, exc_info=True)
+
+    def clear(self) -> None:
+        """Drop the in-memory entries and reset the counters."""
+        self._entries.clear()
+        self.memory_hits = self.redis_hits = self.misses = 0
+
+    def stats(self) -> dict[str, int | float]:
+        hits = self.memory_hits + self.redis_hits
+        lookups = hits + self.misses
+        return {
+            "hits": hits,
+            "memory_hits": self.memory_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+    def _remember(self, key: str, value: str) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
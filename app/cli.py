@@ -1,12 +1,23 @@
+import time
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from typing import Any, Iterable, Iterator
+
 import typer
 
-from sqlmodel import delete
+from sqlmodel import Session, delete, select
 
-from .db import create_db_and_tables, session_context
-from .models import SeriesCreate, SeriesDB, UserDB
+from .compression import CODECS, resolve_codec
+from .config import REPORT_COMPRESSION
+from .db import create_db_and_tables, engine, session_context
+from .models import ReportDB, SeriesCreate, SeriesDB, UserDB
 from .security import hash_password
-from .services.helpers import find_duplicate_series
+from .services.changes import prune_changes as prune_change_log
+from .services.changes import record_reset
+from .services.helpers import find_existing_series_keys, series_key
+from .services.reports import compress_content
 from .services.users import get_user_by_username
+from .synthetic import synthetic_series
 
 cli = typer.Typer(help="Utility commands for the TV Series Catalogue API")
 
@@ -63,6 +74,38 @@ def _load_full_seed_data() -> list[dict]:
     ]
 
 
+def _chunked(rows: Iterable[dict[str, Any]], size: int) -> Iterator[list[dict[str, Any]]]:
+    """Split an iterable of rows into lists of at most `size` items."""
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _without_existing(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Drop rows whose identity is already stored, using one batched key lookup."""
+    with Session(engine) as session:
+        existing = find_existing_series_keys([SeriesCreate(**row) for row in rows], session)
+    return [row for row in rows if (row["title"], row["creator"], row["year"]) not in existing]
+
+
+def _insert_new_series(session: Session, rows: list[dict]) -> tuple[int, int]:
+    """Insert rows whose identity is not already stored; return (inserted, skipped)."""
+    payloads = [SeriesCreate(**data) for data in rows]
+    seen = find_existing_series_keys(payloads, session)
+    new_rows = []
+    for payload in payloads:
+        key = series_key(payload)
+        if key in seen:
+            continue
+        seen.add(key)
+        new_rows.append(SeriesDB.model_validate(payload))
+    session.add_all(new_rows)
+    if new_rows:
+        record_reset(session)
+    session.commit()
+    return len(new_rows), len(payloads) - len(new_rows)
+
+
 @cli.command()
 def init_db() -> None:
     """Create database tables."""
@@ -80,16 +123,12 @@ def seed(
     with session_context() as session:
         if clear_existing:
             session.exec(delete(SeriesDB))
+            record_reset(session)
             session.commit()
 
-        for data in _load_seed_data():
-            series_payload = SeriesCreate(**data)
-            if find_duplicate_series(series_payload, session):
-                continue
-            session.add(SeriesDB(**data))
-        session.commit()
+        inserted, skipped = _insert_new_series(session, _load_seed_data())
 
-    typer.echo("Seed data inserted.")
+    typer.echo(f"Seed data inserted: {inserted} new, {skipped} skipped.")
 
 
 @cli.command()
@@ -102,16 +141,12 @@ def seed_search(
     with session_context() as session:
         if clear_existing:
             session.exec(delete(SeriesDB))
+            record_reset(session)
             session.commit()
 
-        for data in _load_series_search_seed_data():
-            series_payload = SeriesCreate(**data)
-            if find_duplicate_series(series_payload, session):
-                continue
-            session.add(SeriesDB(**data))
-        session.commit()
+        inserted, skipped = _insert_new_series(session, _load_series_search_seed_data())
 
-    typer.echo("Search seed data inserted.")
+    typer.echo(f"Search seed data inserted: {inserted} new, {skipped} skipped.")
 
 
 @cli.command()
@@ -127,14 +162,10 @@ def seed_full(
     with session_context() as session:
         if clear_existing:
             session.exec(delete(SeriesDB))
+            record_reset(session)
             session.commit()
 
-        for data in _load_full_seed_data():
-            series_payload = SeriesCreate(**data)
-            if find_duplicate_series(series_payload, session):
-                continue
-            session.add(SeriesDB(**data))
-        session.commit()
+        inserted, skipped = _insert_new_series(session, _load_full_seed_data())
 
         if not get_user_by_username(session, admin_username):
             user = UserDB(
@@ -148,7 +179,114 @@ def seed_full(
         else:
             typer.echo(f"User '{admin_username}' already exists.")
 
-    typer.echo("Full seed data inserted.")
+    typer.echo(f"Full seed data inserted: {inserted} new, {skipped} skipped.")
+
+
+@cli.command()
+def seed_synthetic(
+    count: int = typer.Option(10_000, min=1, help="Number of series to generate."),
+    seed: int = typer.Option(42, help="Random seed; the same seed yields the same catalog."),
+    chunk_size: int = typer.Option(
+        50_000, min=1, help="Rows per executemany batch (one transaction each)."
+    ),
+    clear_existing: bool = typer.Option(False, help="Wipe existing series before seeding."),
+    append: bool = typer.Option(
+        False, help="Add to a non-empty catalog, skipping series that already exist."
+    ),
+) -> None:
+    """Bulk-insert a large deterministic synthetic catalog for load and scale testing.
+
+    A non-empty catalog is only touched with `--clear-existing` or `--append`, so running
+    the same seed twice cannot duplicate every series.
+    """
+    create_db_and_tables()
+    skip_existing = False
+    if clear_existing:
+        with engine.begin() as connection:
+            connection.execute(delete(SeriesDB))
+    else:
+        with Session(engine) as session:
+            skip_existing = session.exec(select(SeriesDB.id).limit(1)).first() is not None
+        if skip_existing and not append:
+            typer.echo("The catalog already has series; pass --clear-existing or --append.")
+            raise typer.Exit(code=1)
+
+    insert = SeriesDB.__table__.insert()
+    inserted = 0
+    started = time.perf_counter()
+    with typer.progressbar(length=count, label="Seeding series") as progress:
+        for chunk in _chunked(synthetic_series(count, seed), chunk_size):
+            rows = _without_existing(chunk) if skip_existing else chunk
+            if rows:
+                with engine.begin() as connection:
+                    connection.execute(insert, rows)
+            inserted += len(rows)
+            progress.update(len(chunk))
+    if clear_existing or inserted:
+        with Session(engine) as session:
+            record_reset(session)
+            session.commit()
+    elapsed = time.perf_counter() - started
+
+    typer.echo(
+        f"Inserted {inserted} synthetic series ({count - inserted} skipped) in {elapsed:.1f}s "
+        f"({inserted / elapsed:,.0f} rows/s)."
+    )
+
+
+@cli.command()
+def compress_reports(
+    codec: str = typer.Option(
+        REPORT_COMPRESSION if REPORT_COMPRESSION in CODECS else "zlib",
+        help=f"Compression codec ({', '.join(CODECS)}).",
+    ),
+    batch_size: int = typer.Option(500, min=1, help="Reports per transaction."),
+) -> None:
+    """Compress stored report bodies that are still plain text and report the space saved."""
+    if codec not in CODECS:
+        raise typer.BadParameter(f"Expected one of: {', '.join(CODECS)}.", param_hint="--codec")
+    create_db_and_tables()
+    resolved = resolve_codec(codec)
+    scanned = compressed = bytes_before = bytes_saved = 0
+    last_id = 0
+    with session_context() as session:
+        while True:
+            batch = session.exec(
+                select(ReportDB)
+                .where(ReportDB.content_encoding.is_(None), ReportDB.id > last_id)
+                .order_by(ReportDB.id)
+                .limit(batch_size)
+            ).all()
+            if not batch:
+                break
+            for report in batch:
+                size = len(report.content.encode())
+                saved = compress_content(report, resolved)
+                scanned += 1
+                bytes_before += size
+                bytes_saved += saved
+                compressed += saved > 0
+            last_id = batch[-1].id
+            session.commit()
+
+    ratio = bytes_saved / bytes_before * 100 if bytes_before else 0.0
+    typer.echo(
+        f"Compressed {compressed} of {scanned} plain reports with {resolved}: "
+        f"{bytes_before:,} -> {bytes_before - bytes_saved:,} bytes "
+        f"(saved {bytes_saved:,} bytes, {ratio:.1f}%)."
+    )
+
+
+@cli.command()
+def prune_changes(
+    keep_days: float = typer.Option(7, min=0, help="Keep change-log entries this recent."),
+) -> None:
+    """Trim the series change log; clients behind the cut get 410 and resync."""
+    create_db_and_tables()
+    cutoff = datetime.now(timezone.utc) - timedelta(days=keep_days)
+    with session_context() as session:
+        removed = prune_change_log(session, before=cutoff)
+    typer.echo(f"Pruned {removed} change-log entries older than {cutoff.isoformat()}.")
 
 
 @cli.command()
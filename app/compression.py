@@ -0,0 +1,103 @@
+import logging
+import zlib
+from typing import Protocol
+
+try:
+    import zstandard
+except ImportError:  # optional: `uv add zstandard` to enable the zstd codec
+    zstandard = None
+try:
+    import brotli
+except ImportError:  # optional: `uv add brotli` to serve `br` responses
+    brotli = None
+
+logger = logging.getLogger("tv_db.compression")
+
+CODECS = ("zlib", "zstd")
+
+
+def resolve_codec(name: str) -> str | None:
+    """Map a configured codec name to one that can run here (None disables compression)."""
+    name = name.lower()
+    if name in ("", "none"):
+        return None
+    if name not in CODECS:
+        raise ValueError(f"Unknown compression codec '{name}'; expected none, zlib or zstd.")
+    if name == "zstd" and zstandard is None:
+        logger.warning("zstandard is not installed; compressing with zlib instead.")
+        return "zlib"
+    return name
+
+
+def compress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=9).compress(data)
+    return zlib.compress(data, level=9)
+
+
+def decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read zstd-compressed content.")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+class StreamCompressor(Protocol):
+    """Incremental HTTP body encoder; `flush` makes a chunk decodable as soon as it is sent."""
+
+    def compress(self, chunk: bytes, flush: bool = True) -> bytes: ...
+
+    def finish(self) -> bytes: ...
+
+
+class _Gzip:
+    def __init__(self, level: int) -> None:
+        self._zlib = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, chunk: bytes, flush: bool = True) -> bytes:
+        data = self._zlib.compress(chunk)
+        return data + self._zlib.flush(zlib.Z_SYNC_FLUSH) if flush else data
+
+    def finish(self) -> bytes:
+        return self._zlib.flush()
+
+
+class _Brotli:
+    def __init__(self, level: int) -> None:
+        self._brotli = brotli.Compressor(quality=level)
+
+    def compress(self, chunk: bytes, flush: bool = True) -> bytes:
+        data = self._brotli.process(chunk)
+        return data + self._brotli.flush() if flush else data
+
+    def finish(self) -> bytes:
+        return self._brotli.finish()
+
+
+class _Zstd:
+    def __init__(self, level: int) -> None:
+        self._zstd = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, chunk: bytes, flush: bool = True) -> bytes:
+        data = self._zstd.compress(chunk)
+        return data + self._zstd.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK) if flush else data
+
+    def finish(self) -> bytes:
+        return self._zstd.flush()
+
+
+def http_encodings(preference: list[str]) -> list[str]:
+    """Content-codings from `preference` (gzip, br, zstd) that can run here, in order."""
+    available = {"gzip": True, "br": brotli is not None, "zstd": zstandard is not None}
+    unknown = [name for name in preference if name not in available]
+    if unknown:
+        raise ValueError(f"Unknown HTTP encodings {unknown}; expected gzip, br or zstd.")
+    skipped = [name for name in preference if not available[name]]
+    if skipped:
+        logger.info("Response encodings %s need optional packages; not offering them.", skipped)
+    return [name for name in preference if available[name]]
+
+
+def stream_compressor(encoding: str, level: int) -> StreamCompressor:
+    return {"gzip": _Gzip, "br": _Brotli, "zstd": _Zstd}[encoding](level)
@@ -11,10 +11,57 @@ ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60")
 
 REDIS_URL = os.getenv("REDIS_URL", "redis://127.0.0.1:6379/0")
 REDIS_QUEUE = os.getenv("REDIS_QUEUE", "tvdb:jobs")
+JOB_RESULT_TTL_SECONDS = int(os.getenv("JOB_RESULT_TTL_SECONDS", "3600"))
+SERIES_EVENTS_CHANNEL = os.getenv("SERIES_EVENTS_CHANNEL", "tvdb:series:events")
+SERIES_EVENTS_MAX_QUEUE = int(os.getenv("SERIES_EVENTS_MAX_QUEUE", "100"))
+SERIES_EVENTS_KEEPALIVE_SECONDS = float(os.getenv("SERIES_EVENTS_KEEPALIVE_SECONDS", "15"))
+SERIES_EXPORT_BATCH_SIZE = int(os.getenv("SERIES_EXPORT_BATCH_SIZE", "10000"))
+SERIES_BATCH_GET_MAX_IDS = int(os.getenv("SERIES_BATCH_GET_MAX_IDS", "500"))
 
 RATE_LIMIT_LIMIT = int(os.getenv("RATE_LIMIT_LIMIT", "100"))
 RATE_LIMIT_WINDOW_SECONDS = int(os.getenv("RATE_LIMIT_WINDOW_SECONDS", "60"))
 
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "200"))
+
+REPORT_COMPRESSION = os.getenv("REPORT_COMPRESSION", "zlib")
+REPORT_COMPRESSION_MIN_BYTES = int(os.getenv("REPORT_COMPRESSION_MIN_BYTES", "512"))
+HTTP_COMPRESSION_ENCODINGS = [
+    name.strip()
+    for name in os.getenv("HTTP_COMPRESSION_ENCODINGS", "zstd,br,gzip").split(",")
+    if name.strip()
+]
+HTTP_COMPRESSION_MIN_BYTES = int(os.getenv("HTTP_COMPRESSION_MIN_BYTES", "1024"))
+HTTP_GZIP_LEVEL = int(os.getenv("HTTP_GZIP_LEVEL", "6"))
+HTTP_BROTLI_QUALITY = int(os.getenv("HTTP_BROTLI_QUALITY", "4"))
+HTTP_ZSTD_LEVEL = int(os.getenv("HTTP_ZSTD_LEVEL", "3"))
+
+# Outgoing calls from the worker and scripts to the API (see app/http_client.py).
+HTTP_CLIENT_TIMEOUT_SECONDS = float(os.getenv("HTTP_CLIENT_TIMEOUT_SECONDS", "10"))
+HTTP_CLIENT_CONNECT_TIMEOUT_SECONDS = float(os.getenv("HTTP_CLIENT_CONNECT_TIMEOUT_SECONDS", "5"))
+HTTP_CLIENT_MAX_CONNECTIONS = int(os.getenv("HTTP_CLIENT_MAX_CONNECTIONS", "20"))
+HTTP_CLIENT_MAX_KEEPALIVE = int(os.getenv("HTTP_CLIENT_MAX_KEEPALIVE", "10"))
+HTTP_CLIENT_KEEPALIVE_EXPIRY_SECONDS = float(
+    os.getenv("HTTP_CLIENT_KEEPALIVE_EXPIRY_SECONDS", "30")
+)
+HTTP_CLIENT_HTTP2 = os.getenv("HTTP_CLIENT_HTTP2", "false").lower() == "true"
+HTTP_CLIENT_RETRIES = int(os.getenv("HTTP_CLIENT_RETRIES", "2"))
+HTTP_CLIENT_RETRY_BACKOFF_SECONDS = float(os.getenv("HTTP_CLIENT_RETRY_BACKOFF_SECONDS", "0.4"))
+HTTP_CLIENT_SLOW_MS = float(os.getenv("HTTP_CLIENT_SLOW_MS", "1000"))
+
 OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://127.0.0.1:11434/v1")
 OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "llama3.1")
 OLLAMA_API_KEY = os.getenv("OLLAMA_API_KEY", "ollama")
+AI_REQUEST_TIMEOUT_SECONDS = float(os.getenv("AI_REQUEST_TIMEOUT_SECONDS", "120"))
+AI_CONNECT_TIMEOUT_SECONDS = float(os.getenv("AI_CONNECT_TIMEOUT_SECONDS", "5"))
+AI_MAX_CONNECTIONS = int(os.getenv("AI_MAX_CONNECTIONS", "10"))
+AI_KEEPALIVE_EXPIRY_SECONDS = float(os.getenv("AI_KEEPALIVE_EXPIRY_SECONDS", "30"))
+
+AI_SUMMARY_CACHE_TTL_SECONDS = int(os.getenv("AI_SUMMARY_CACHE_TTL_SECONDS", "300"))
+AI_SUMMARY_CACHE_MAX_ENTRIES = int(os.getenv("AI_SUMMARY_CACHE_MAX_ENTRIES", "128"))
+AI_SUMMARY_CACHE_REDIS = os.getenv("AI_SUMMARY_CACHE_REDIS", "false").lower() == "true"
+
+AI_SUMMARY_CHUNK_SIZE = int(os.getenv("AI_SUMMARY_CHUNK_SIZE", "100"))
+AI_SUMMARY_MAX_PARALLEL = int(os.getenv("AI_SUMMARY_MAX_PARALLEL", "4"))
+AI_SUMMARY_MAX_CONCURRENT = int(os.getenv("AI_SUMMARY_MAX_CONCURRENT", "2"))
+AI_SUMMARY_MAX_QUEUE = int(os.getenv("AI_SUMMARY_MAX_QUEUE", "8"))
+AI_SUMMARY_MAX_WAIT_SECONDS = float(os.getenv("AI_SUMMARY_MAX_WAIT_SECONDS", "30"))
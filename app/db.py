@@ -6,6 +6,8 @@ from typing import Iterator
 from sqlmodel import SQLModel, Session, create_engine
 from sqlalchemy import text
 
+from .telemetry import install_query_hooks
+
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./series.db")
 connect_args = {"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
 logger = logging.getLogger(__name__)
@@ -15,14 +17,18 @@ except Exception as exc:
     raise RuntimeError(
         f"Failed to create database engine for DATABASE_URL='{DATABASE_URL}'."
     ) from exc
+install_query_hooks()
 
 
 def create_db_and_tables() -> None:
     """Create database tables if they do not exist."""
     try:
         SQLModel.metadata.create_all(engine)
+        _ensure_indexes()
         if DATABASE_URL.startswith("sqlite"):
             _ensure_sqlite_column("seriesdb", "last_refreshed_at", "DATETIME")
+            _ensure_sqlite_column("reportdb", "content_encoding", "VARCHAR(16)")
+            _ensure_sqlite_column("reportdb", "content_compressed", "BLOB")
     except Exception as exc:
         logger.exception("Database initialization failed.")
         raise RuntimeError(
@@ -45,6 +51,16 @@ def _ensure_sqlite_column(table: str, column: str, column_type: str) -> None:
             connection.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}"))
 
 
+def _ensure_indexes() -> None:
+    """Create indexes declared on models that older databases are missing.
+
+    `create_all` only builds indexes together with new tables.
+    """
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+
+
 @contextmanager
 def session_context() -> Iterator[Session]:
     """Context manager for scripts/CLI usage."""
@@ -1,9 +1,8 @@
 import os
 import sys
 
-import httpx
-
 from .config import API_BASE_URL
+from .http_client import create_client
 
 
 def main() -> None:
@@ -17,7 +16,7 @@ def main() -> None:
     print("Step 2: Use this script to verify the API and queue a report.")
 
     print(f"API base: {api_base}")
-    with httpx.Client(timeout=5) as client:
+    with create_client() as client:
         health = client.get(f"{api_base}/health")
         print(f"Health: {health.status_code} {health.json()}")
 
@@ -0,0 +1,78 @@
+import json
+from collections import Counter
+from dataclasses import dataclass, field
+
+import redis.asyncio as redis
+
+from .config import REDIS_QUEUE
+from .models import Series, SeriesChange, SeriesStats
+
+DIGEST_STATE_KEY = f"{REDIS_QUEUE}:digest:stats"
+
+
+@dataclass
+class DigestStats:
+    """Running catalog aggregates, advanced one change-log entry at a time."""
+
+    seq: int = 0
+    count: int = 0
+    rated_count: int = 0
+    rating_sum: float = 0.0
+    years: Counter[int] = field(default_factory=Counter)
+
+    @classmethod
+    def from_snapshot(cls, stats: SeriesStats) -> "DigestStats":
+        return cls(
+            seq=stats.seq,
+            count=stats.count,
+            rated_count=stats.rated_count,
+            rating_sum=stats.rating_sum,
+            years=Counter(stats.years),
+        )
+
+    @property
+    def average_rating(self) -> float | None:
+        return self.rating_sum / self.rated_count if self.rated_count else None
+
+    def apply(self, change: SeriesChange) -> None:
+        """Retract the row as it was before the change and add it as it is after."""
+        if change.previous is not None:
+            self._add(change.previous, -1)
+        if change.current is not None:
+            self._add(change.current, 1)
+        self.seq = change.seq
+
+    def _add(self, row: Series, sign: int) -> None:
+        self.count += sign
+        self.years[row.year] += sign
+        if not self.years[row.year]:
+            del self.years[row.year]
+        if row.rating is not None:
+            self.rated_count += sign
+            self.rating_sum += sign * row.rating
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "seq": self.seq,
+                "count": self.count,
+                "rated_count": self.rated_count,
+                "rating_sum": self.rating_sum,
+                "years": self.years,
+            }
+        )
+
+    @classmethod
+    def from_json(cls, raw: str) -> "DigestStats":
+        data = json.loads(raw)
+        data["years"] = Counter({int(year): count for year, count in data["years"].items()})
+        return cls(**data)
+
+
+async def load_digest_stats(client: redis.Redis) -> DigestStats | None:
+    raw = await client.get(DIGEST_STATE_KEY)
+    return DigestStats.from_json(raw) if raw else None
+
+
+async def save_digest_stats(client: redis.Redis, stats: DigestStats) -> None:
+    await client.set(DIGEST_STATE_KEY, stats.to_json())
@@ -0,0 +1,130 @@
+import asyncio
+import logging
+from concurrent.futures import Future
+from contextlib import suppress
+
+import redis.asyncio as redis
+
+from .config import REDIS_URL, SERIES_EVENTS_CHANNEL, SERIES_EVENTS_MAX_QUEUE
+from .models import SeriesChange
+
+logger = logging.getLogger("tv_db.events")
+
+
+class Subscription:
+    """One listener's bounded inbox; it is marked lagged instead of growing without bound."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.queue: asyncio.Queue[SeriesChange] = asyncio.Queue(maxsize)
+        self.lagged = False
+
+    def push(self, change: SeriesChange) -> None:
+        if self.lagged:
+            return
+        try:
+            self.queue.put_nowait(change)
+        except asyncio.QueueFull:
+            self.lagged = True
+
+
+class EventBroker:
+    """Fan series changes out to local subscribers via a Redis pub/sub channel.
+
+    Every API process publishes its writes to the channel and relays whatever arrives
+    on it to its own subscribers, so a client sees changes made through any process.
+    If Redis is unreachable, events are still delivered within the publishing process.
+    """
+
+    def __init__(self, channel: str, max_queue: int) -> None:
+        self.channel = channel
+        self.max_queue = max_queue
+        self._subscribers: set[Subscription] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._redis: redis.Redis | None = None
+        self._listener: asyncio.Task | None = None
+        self._publishing: set[asyncio.Task] = set()
+        self._redis_down = False
+
+    async def start(self, client: redis.Redis | None = None) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._redis = client or redis.Redis.from_url(REDIS_URL, decode_responses=True)
+        self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._listener
+        if self._publishing:
+            await asyncio.gather(*self._publishing, return_exceptions=True)
+        if self._redis is not None:
+            await self._redis.aclose()
+        self._loop = self._redis = self._listener = None
+
+    def publish(self, change: SeriesChange) -> None:
+        """Broadcast a committed change; safe to call from sync code in worker threads."""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        payload = change.model_dump_json()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            # The loop only keeps a weak reference to tasks; hold it until it finishes.
+            task = loop.create_task(self._publish(payload))
+            self._publishing.add(task)
+            task.add_done_callback(self._published)
+        else:
+            asyncio.run_coroutine_threadsafe(self._publish(payload), loop).add_done_callback(
+                self._published
+            )
+
+    def subscribe(self) -> Subscription:
+        """Start receiving events; pair with `unsubscribe`."""
+        subscription = Subscription(self.max_queue)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscribers.discard(subscription)
+
+    def _published(self, future: asyncio.Task | Future) -> None:
+        self._publishing.discard(future)
+        if not future.cancelled() and future.exception() is not None:
+            logger.error("Publishing a series event failed.", exc_info=future.exception())
+
+    async def _publish(self, payload: str) -> None:
+        try:
+            await self._redis.publish(self.channel, payload)
+            self._redis_down = False
+        except redis.RedisError:
+            if not self._redis_down:
+                logger.warning("Redis publish failed; delivering series events locally only.")
+                self._redis_down = True
+            self._deliver(payload)
+
+    async def _listen(self) -> None:
+        failing = False
+        while True:
+            try:
+                async with self._redis.pubsub() as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    failing = False
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self._deliver(message["data"])
+            except redis.RedisError:
+                if not failing:
+                    logger.warning("Series event subscription to Redis failed; retrying.")
+                    failing = True
+                await asyncio.sleep(1)
+
+    def _deliver(self, payload: str) -> None:
+        change = SeriesChange.model_validate_json(payload)
+        for subscription in list(self._subscribers):
+            subscription.push(change)
+
+
+series_events = EventBroker(SERIES_EVENTS_CHANNEL, max_queue=SERIES_EVENTS_MAX_QUEUE)
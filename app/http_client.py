@@ -0,0 +1,210 @@
+import asyncio
+import importlib.util
+import logging
+import random
+import time
+
+import httpx
+
+from .config import (
+    HTTP_CLIENT_CONNECT_TIMEOUT_SECONDS,
+    HTTP_CLIENT_HTTP2,
+    HTTP_CLIENT_KEEPALIVE_EXPIRY_SECONDS,
+    HTTP_CLIENT_MAX_CONNECTIONS,
+    HTTP_CLIENT_MAX_KEEPALIVE,
+    HTTP_CLIENT_RETRIES,
+    HTTP_CLIENT_RETRY_BACKOFF_SECONDS,
+    HTTP_CLIENT_SLOW_MS,
+    HTTP_CLIENT_TIMEOUT_SECONDS,
+)
+
+logger = logging.getLogger("tv_db.http")
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUSES = frozenset({502, 503, 504})
+MAX_BACKOFF_SECONDS = 10.0
+
+
+class RetryPolicy:
+    """When to retry a request and how long to wait, shared by the sync and async transports.
+
+    Connection failures are retried for any method because the request never reached
+    the server. Timeouts, dropped connections and 502/503/504 are retried only for
+    `methods`, which should be safe to repeat.
+    """
+
+    def __init__(self, retries: int, backoff_seconds: float, methods: frozenset[str]) -> None:
+        self.retries = retries
+        self.backoff_seconds = backoff_seconds
+        self.methods = methods
+
+    def retry_error(self, request: httpx.Request, exc: httpx.TransportError, attempt: int) -> bool:
+        if attempt >= self.retries:
+            return False
+        # Neither error means the request reached the server, so any method may retry.
+        never_sent = isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout))
+        return never_sent or request.method in self.methods
+
+    def retry_response(
+        self, request: httpx.Request, response: httpx.Response, attempt: int
+    ) -> bool:
+        return (
+            attempt < self.retries
+            and response.status_code in RETRY_STATUSES
+            and request.method in self.methods
+        )
+
+    def delay(self, attempt: int) -> float:
+        """Full jitter: a random wait up to the exponential backoff for this attempt."""
+        return random.uniform(0, min(MAX_BACKOFF_SECONDS, self.backoff_seconds * 2**attempt))
+
+
+class AsyncRetryTransport(httpx.AsyncBaseTransport):
+    def __init__(self, transport: httpx.AsyncBaseTransport, policy: RetryPolicy) -> None:
+        self.transport = transport
+        self.policy = policy
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            try:
+                response = await self.transport.handle_async_request(request)
+            except httpx.TransportError as exc:
+                if not self.policy.retry_error(request, exc, attempt):
+                    raise
+                logger.info("Retrying %s %s after %r", request.method, request.url, exc)
+            else:
+                if not self.policy.retry_response(request, response, attempt):
+                    return response
+                await response.aclose()
+                logger.info(
+                    "Retrying %s %s after HTTP %s",
+                    request.method,
+                    request.url,
+                    response.status_code,
+                )
+            await asyncio.sleep(self.policy.delay(attempt))
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class RetryTransport(httpx.BaseTransport):
+    def __init__(self, transport: httpx.BaseTransport, policy: RetryPolicy) -> None:
+        self.transport = transport
+        self.policy = policy
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            try:
+                response = self.transport.handle_request(request)
+            except httpx.TransportError as exc:
+                if not self.policy.retry_error(request, exc, attempt):
+                    raise
+                logger.info("Retrying %s %s after %r", request.method, request.url, exc)
+            else:
+                if not self.policy.retry_response(request, response, attempt):
+                    return response
+                response.close()
+                logger.info(
+                    "Retrying %s %s after HTTP %s",
+                    request.method,
+                    request.url,
+                    response.status_code,
+                )
+            time.sleep(self.policy.delay(attempt))
+            attempt += 1
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+def _mark_start(request: httpx.Request) -> None:
+    request.extensions["tv_db_started"] = time.perf_counter()
+
+
+def _log_timing(response: httpx.Response) -> None:
+    request = response.request
+    started = request.extensions.get("tv_db_started")
+    if started is None:
+        return
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    level = logging.WARNING if elapsed_ms >= HTTP_CLIENT_SLOW_MS else logging.DEBUG
+    logger.log(
+        level,
+        "%s %s -> %s in %.1f ms",
+        request.method,
+        request.url,
+        response.status_code,
+        elapsed_ms,
+    )
+
+
+async def _mark_start_async(request: httpx.Request) -> None:
+    _mark_start(request)
+
+
+async def _log_timing_async(response: httpx.Response) -> None:
+    _log_timing(response)
+
+
+def _use_http2() -> bool:
+    if HTTP_CLIENT_HTTP2 and importlib.util.find_spec("h2") is None:
+        logger.warning("HTTP_CLIENT_HTTP2 is set but h2 is not installed; using HTTP/1.1.")
+        return False
+    return HTTP_CLIENT_HTTP2
+
+
+def _settings(timeout: float | None) -> dict:
+    return {
+        "timeout": httpx.Timeout(
+            timeout or HTTP_CLIENT_TIMEOUT_SECONDS, connect=HTTP_CLIENT_CONNECT_TIMEOUT_SECONDS
+        ),
+        "limits": httpx.Limits(
+            max_connections=HTTP_CLIENT_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_CLIENT_MAX_KEEPALIVE,
+            keepalive_expiry=HTTP_CLIENT_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+    }
+
+
+def create_async_client(
+    retries: int = HTTP_CLIENT_RETRIES,
+    retry_methods: frozenset[str] = IDEMPOTENT_METHODS,
+    timeout: float | None = None,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> httpx.AsyncClient:
+    """Async client for calls between our services, with pooling, retries and timing logs.
+
+    Pass `retry_methods` to widen retries to requests the caller knows are idempotent,
+    and `transport` to wrap something other than the network (tests, ASGI).
+    """
+    settings = _settings(timeout)
+    inner = transport or httpx.AsyncHTTPTransport(limits=settings["limits"], http2=_use_http2())
+    return httpx.AsyncClient(
+        timeout=settings["timeout"],
+        transport=AsyncRetryTransport(
+            inner, RetryPolicy(retries, HTTP_CLIENT_RETRY_BACKOFF_SECONDS, retry_methods)
+        ),
+        event_hooks={"request": [_mark_start_async], "response": [_log_timing_async]},
+    )
+
+
+def create_client(
+    retries: int = HTTP_CLIENT_RETRIES,
+    retry_methods: frozenset[str] = IDEMPOTENT_METHODS,
+    timeout: float | None = None,
+    transport: httpx.BaseTransport | None = None,
+) -> httpx.Client:
+    """Blocking counterpart of `create_async_client` for scripts."""
+    settings = _settings(timeout)
+    inner = transport or httpx.HTTPTransport(limits=settings["limits"], http2=_use_http2())
+    return httpx.Client(
+        timeout=settings["timeout"],
+        transport=RetryTransport(
+            inner, RetryPolicy(retries, HTTP_CLIENT_RETRY_BACKOFF_SECONDS, retry_methods)
+        ),
+        event_hooks={"request": [_mark_start], "response": [_log_timing]},
+    )
@@ -1,14 +1,29 @@
 import logging
 import os
-import time
-import uuid
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from .config import RATE_LIMIT_LIMIT, RATE_LIMIT_WINDOW_SECONDS
+from .ai import close_agent, get_agent
+from .compression import http_encodings
+from .config import (
+    HTTP_BROTLI_QUALITY,
+    HTTP_COMPRESSION_ENCODINGS,
+    HTTP_COMPRESSION_MIN_BYTES,
+    HTTP_GZIP_LEVEL,
+    HTTP_ZSTD_LEVEL,
+    RATE_LIMIT_LIMIT,
+    RATE_LIMIT_WINDOW_SECONDS,
+)
 from .db import create_db_and_tables
+from .events import series_events
+from .middleware import (
+    CompressionMiddleware,
+    QueryTimingMiddleware,
+    RateLimitHeadersMiddleware,
+    TraceIdMiddleware,
+)
 from .routes.admin import router as admin_router
 from .routes.ai import router as ai_router
 from .routes.auth import router as auth_router
@@ -27,8 +42,13 @@ async def lifespan(_: FastAPI):
     """Initialize application resources on startup."""
     # Initialize database tables at startup using lifespan to avoid deprecated events.
     create_db_and_tables()
+    # Build the AI agent once so every summary request reuses its keep-alive connections.
+    get_agent()
+    await series_events.start()
     logger.info("API startup complete.")
     yield
+    await series_events.stop()
+    await close_agent()
 
 
 app = FastAPI(title="TV Series Catalogue API", version="0.1.0", lifespan=lifespan)
@@ -40,25 +60,22 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
-
-
-@app.middleware("http")
-async def trace_id_header(request, call_next):
-    trace_id = request.headers.get("X-Trace-Id") or str(uuid.uuid4())
-    request.state.trace_id = trace_id
-    response = await call_next(request)
-    response.headers["X-Trace-Id"] = trace_id
-    return response
-
-
-@app.middleware("http")
-async def rate_limit_headers(request, call_next):
-    response = await call_next(request)
-    reset_epoch = int(time.time()) + RATE_LIMIT_WINDOW_SECONDS
-    response.headers["X-RateLimit-Limit"] = str(RATE_LIMIT_LIMIT)
-    response.headers["X-RateLimit-Remaining"] = str(max(RATE_LIMIT_LIMIT - 1, 0))
-    response.headers["X-RateLimit-Reset"] = str(reset_epoch)
-    return response
+# Starlette runs the last-added middleware first: rate limit, then trace ID, then
+# query timing (which needs the trace ID), then CORS.
+app.add_middleware(QueryTimingMiddleware)
+app.add_middleware(TraceIdMiddleware)
+app.add_middleware(
+    RateLimitHeadersMiddleware,
+    limit=RATE_LIMIT_LIMIT,
+    window_seconds=RATE_LIMIT_WINDOW_SECONDS,
+)
+# Added last so it is outermost and compresses the final response, headers included.
+app.add_middleware(
+    CompressionMiddleware,
+    encodings=http_encodings(HTTP_COMPRESSION_ENCODINGS),
+    minimum_size=HTTP_COMPRESSION_MIN_BYTES,
+    levels={"gzip": HTTP_GZIP_LEVEL, "br": HTTP_BROTLI_QUALITY, "zstd": HTTP_ZSTD_LEVEL},
+)
 
 
 @app.get("/health")
@@ -0,0 +1,228 @@
+import time
+import uuid
+from typing import Callable
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .compression import StreamCompressor, stream_compressor
+from .telemetry import track_queries
+
+# Already compressed, or (event streams) must reach the client without buffering.
+UNCOMPRESSED_TYPES = (
+    "text/event-stream",
+    "application/vnd.apache.parquet",
+    "application/gzip",
+    "application/zip",
+    "image/",
+    "audio/",
+    "video/",
+)
+
+
+def _adding_headers(send: Send, add: Callable[[MutableHeaders], None]) -> Send:
+    """Wrap `send` so `add` can set headers on the response start; the body is untouched."""
+
+    async def wrapped(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            add(MutableHeaders(scope=message))
+        await send(message)
+
+    return wrapped
+
+
+class TraceIdMiddleware:
+    """Tag each request with the caller's `X-Trace-Id` (or a new UUID) and echo it back.
+
+    The ID is stored as `request.state.trace_id` for inner middleware and handlers.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        trace_id = Headers(scope=scope).get("x-trace-id") or str(uuid.uuid4())
+        scope.setdefault("state", {})["trace_id"] = trace_id
+
+        def add(headers: MutableHeaders) -> None:
+            headers["X-Trace-Id"] = trace_id
+
+        await self.app(scope, receive, _adding_headers(send, add))
+
+
+class QueryTimingMiddleware:
+    """Count the SQL run for a request and report it in `X-DB-Query-Count`/`Server-Timing`.
+
+    Headers reflect the queries made before the response started; a streamed body's
+    later queries still reach the slow-query log under the request's trace ID.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with track_queries(scope.get("state", {}).get("trace_id")) as stats:
+
+            def add(headers: MutableHeaders) -> None:
+                headers["X-DB-Query-Count"] = str(stats.count)
+                headers["Server-Timing"] = stats.server_timing()
+
+            await self.app(scope, receive, _adding_headers(send, add))
+
+
+class RateLimitHeadersMiddleware:
+    """Advertise the rate-limit policy on every response."""
+
+    def __init__(self, app: ASGIApp, limit: int, window_seconds: int) -> None:
+        self.app = app
+        self.limit = str(limit)
+        self.remaining = str(max(limit - 1, 0))
+        self.window_seconds = window_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        def add(headers: MutableHeaders) -> None:
+            headers["X-RateLimit-Limit"] = self.limit
+            headers["X-RateLimit-Remaining"] = self.remaining
+            headers["X-RateLimit-Reset"] = str(int(time.time()) + self.window_seconds)
+
+        await self.app(scope, receive, _adding_headers(send, add))
+
+
+def negotiate_encoding(accept_encoding: str, offered: list[str]) -> str | None:
+    """Pick the offered coding with the highest `q` in Accept-Encoding (ties: server order)."""
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        weight = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[name] = weight
+    best, best_weight = None, 0.0
+    for name in offered:
+        weight = weights.get(name, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = name, weight
+    return best
+
+
+class CompressionMiddleware:
+    """Compress responses with the best coding the client accepts (pure ASGI).
+
+    Bodies smaller than `minimum_size`, already encoded, or of an excluded content
+    type pass through untouched. Streamed bodies are compressed chunk by chunk and
+    each chunk is flushed, so downloads such as the Arrow export keep streaming.
+    """
+
+    def __init__(
+        self, app: ASGIApp, encodings: list[str], minimum_size: int, levels: dict[str, int]
+    ) -> None:
+        self.app = app
+        self.encodings = encodings
+        self.minimum_size = minimum_size
+        self.levels = levels
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        accept = Headers(scope=scope).get("accept-encoding", "")
+        encoding = negotiate_encoding(accept, self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressingSend(send, encoding, self.levels[encoding], self.minimum_size)
+        await self.app(scope, receive, responder)
+
+
+class _CompressingSend:
+    """`send` wrapper that holds the response start until the first body chunk decides."""
+
+    def __init__(self, send: Send, encoding: str, level: int, minimum_size: int) -> None:
+        self.send = send
+        self.encoding = encoding
+        self.level = level
+        self.minimum_size = minimum_size
+        self.start: Message | None = None
+        self.compressor: StreamCompressor | None = None
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start = message
+            return
+        if message["type"] != "http.response.body":
+            await self._flush_start()
+            await self.send(message)
+            return
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.start is not None:
+            if not self._should_compress(body, more_body):
+                await self._flush_start()
+            elif not more_body:
+                await self._send_whole(body)
+                return
+            else:
+                self._begin_stream()
+                await self._flush_start()
+        if self.compressor is None:
+            await self.send(message)
+            return
+        chunk = self.compressor.compress(body)
+        if not more_body:
+            chunk += self.compressor.finish()
+        await self.send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+    def _should_compress(self, body: bytes, more_body: bool) -> bool:
+        headers = Headers(raw=self.start["headers"])
+        content_type = headers.get("content-type", "")
+        if "content-encoding" in headers or content_type.startswith(UNCOMPRESSED_TYPES):
+            return False
+        # A declared length still applies when an inner middleware re-chunks the body.
+        if "content-length" in headers:
+            return int(headers["content-length"]) >= self.minimum_size
+        return more_body or len(body) >= self.minimum_size
+
+    async def _send_whole(self, body: bytes) -> None:
+        compressor = stream_compressor(self.encoding, self.level)
+        packed = compressor.compress(body, flush=False) + compressor.finish()
+        if len(packed) >= len(body):
+            await self._flush_start()
+            await self.send({"type": "http.response.body", "body": body})
+            return
+        headers = self._encoded_headers()
+        headers["Content-Length"] = str(len(packed))
+        await self._flush_start()
+        await self.send({"type": "http.response.body", "body": packed})
+
+    def _begin_stream(self) -> None:
+        self.compressor = stream_compressor(self.encoding, self.level)
+        del self._encoded_headers()["Content-Length"]
+
+    def _encoded_headers(self) -> MutableHeaders:
+        headers = MutableHeaders(raw=self.start["headers"])
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        return headers
+
+    async def _flush_start(self) -> None:
+        if self.start is not None:
+            start, self.start = self.start, None
+            await self.send(start)
@@ -1,7 +1,10 @@
 from datetime import datetime, timezone
 
+from sqlalchemy import JSON, LargeBinary
 from sqlmodel import Field, SQLModel
 
+from .config import SERIES_BATCH_GET_MAX_IDS
+
 
 class SeriesBase(SQLModel):
     """Shared series attributes."""
@@ -41,6 +44,60 @@ class SeriesDB(SeriesBase, table=True):
     last_refreshed_at: datetime | None = Field(default=None)
 
 
+class SeriesChangeDB(SQLModel, table=True):
+    """Append-only log of series writes; `id` doubles as the change sequence number.
+
+    `previous`/`current` hold `Series` snapshots before and after the write (None for
+    creates and deletes respectively). A `reset` entry has no series and marks a bulk
+    change made outside the service layer.
+    """
+
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    id: int | None = Field(default=None, primary_key=True)
+    series_id: int | None = Field(default=None, index=True)
+    op: str = Field(max_length=16)
+    changed_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    previous: dict | None = Field(default=None, sa_type=JSON)
+    current: dict | None = Field(default=None, sa_type=JSON)
+
+
+class SeriesChange(SQLModel):
+    """Public change-log entry."""
+
+    seq: int
+    series_id: int | None
+    op: str
+    changed_at: datetime
+    previous: Series | None = None
+    current: Series | None = None
+
+
+class SeriesStats(SQLModel):
+    """Catalog aggregates as of change sequence `seq`."""
+
+    seq: int
+    count: int
+    rated_count: int
+    rating_sum: float
+    average_rating: float | None
+    years: dict[int, int]
+    top_rated: Series | None = None
+
+
+class SeriesBatchGet(SQLModel):
+    """Payload for fetching many series by ID."""
+
+    ids: list[int] = Field(min_length=1, max_length=SERIES_BATCH_GET_MAX_IDS)
+
+
+class SeriesBatch(SQLModel):
+    """Series in request order; `items` holds None where `missing` lists the ID."""
+
+    items: list[Series | None]
+    missing: list[int]
+
+
 class UserDB(SQLModel, table=True):
     """Database user for authentication."""
 
@@ -100,9 +157,24 @@ class Report(ReportBase):
     created_by: str
 
 
+class ReportSummary(SQLModel):
+    """Report listing entry without the (potentially large) content."""
+
+    id: int
+    title: str
+    created_at: datetime
+    created_by: str
+
+
 class ReportDB(ReportBase, table=True):
-    """Database report record."""
+    """Database report record.
+
+    When `content_encoding` is set, the body is stored in `content_compressed` and
+    `content` is left empty.
+    """
 
     id: int | None = Field(default=None, primary_key=True)
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), index=True)
     created_by: str = Field(min_length=1, max_length=80)
+    content_encoding: str | None = Field(default=None, max_length=16)
+    content_compressed: bytes | None = Field(default=None, sa_type=LargeBinary)
@@ -1,11 +1,11 @@
 from datetime import datetime, timezone
-from typing import AsyncIterator
+from typing import Any, AsyncIterator
 from uuid import uuid4
 
 import redis.asyncio as redis
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
-from .config import REDIS_QUEUE, REDIS_URL
+from .config import JOB_RESULT_TTL_SECONDS, REDIS_QUEUE, REDIS_URL
 
 
 class QueueMessage(BaseModel):
@@ -13,6 +13,15 @@ class QueueMessage(BaseModel):
     job_type: str
     enqueued_at: str
     requested_by: str
+    payload: dict[str, Any] = Field(default_factory=dict)
+
+
+class JobStatus(BaseModel):
+    job_id: str
+    status: str
+    updated_at: str
+    result: dict[str, Any] | None = None
+    error: str | None = None
 
 
 async def get_redis() -> AsyncIterator[redis.Redis]:
@@ -34,3 +43,48 @@ async def enqueue_report_job(client: redis.Redis, requested_by: str) -> QueueMes
     )
     await client.rpush(REDIS_QUEUE, message.model_dump_json())
     return message
+
+
+def _job_key(job_id: str) -> str:
+    return f"{REDIS_QUEUE}:status:{job_id}"
+
+
+async def set_job_status(
+    client: redis.Redis,
+    job_id: str,
+    status: str,
+    result: dict[str, Any] | None = None,
+    error: str | None = None,
+) -> JobStatus:
+    """Record a job's state so API clients can poll for it."""
+    job = JobStatus(
+        job_id=job_id,
+        status=status,
+        updated_at=datetime.now(timezone.utc).isoformat(),
+        result=result,
+        error=error,
+    )
+    await client.set(_job_key(job_id), job.model_dump_json(), ex=JOB_RESULT_TTL_SECONDS)
+    return job
+
+
+async def get_job_status(client: redis.Redis, job_id: str) -> JobStatus | None:
+    """Return a job's last recorded state, or None if it is unknown or expired."""
+    raw = await client.get(_job_key(job_id))
+    return JobStatus.model_validate_json(raw) if raw else None
+
+
+async def enqueue_summary_job(
+    client: redis.Redis, requested_by: str, series_id: int | None = None
+) -> QueueMessage:
+    """Push an AI summary job to Redis and mark it as queued."""
+    message = QueueMessage(
+        job_id=str(uuid4()),
+        job_type="summary",
+        enqueued_at=datetime.now(timezone.utc).isoformat(),
+        requested_by=requested_by,
+        payload={"series_id": series_id},
+    )
+    await set_job_status(client, message.job_id, "queued")
+    await client.rpush(REDIS_QUEUE, message.model_dump_json())
+    return message
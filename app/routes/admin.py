@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends
 from sqlalchemy import func
 from sqlmodel import Session, select
 
+from ..ai import summary_cache, summary_gate
 from ..db import get_session
 from ..models import ReportDB, SeriesDB, UserDB
 from ..security import TokenPayload, require_role
@@ -23,3 +24,19 @@ def admin_metrics(
         "reports": report_count,
         "users": user_count,
     }
+
+
+@router.get("/metrics/ai-cache")
+def ai_cache_metrics(
+    _: TokenPayload = Depends(require_role("admin")),
+) -> dict[str, int | float]:
+    """Return AI summary cache hit/miss counters for admins."""
+    return summary_cache.stats()
+
+
+@router.get("/metrics/ai-gate")
+def ai_gate_metrics(
+    _: TokenPayload = Depends(require_role("admin")),
+) -> dict[str, int | float]:
+    """Return in-flight and queued AI summary calls for admins."""
+    return summary_gate.stats()
@@ -1,16 +1,40 @@
-from typing import Annotated
+import json
+from typing import Annotated, AsyncIterator
 
-from fastapi import APIRouter, Body, Depends
+from fastapi import APIRouter, Body, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from sqlmodel import Session
 
-from ..ai import SummaryResult, generate_summary
+from ..ai import SummaryProgress, SummaryResult, generate_summary, stream_summary
 from ..db import get_session
-from ..models import SummaryRequest
+from ..models import Series, SummaryRequest
+from ..queue import JobStatus, QueueMessage, enqueue_summary_job, get_job_status, get_redis
 from ..security import TokenPayload, require_role
 from ..services import series as series_service
 
 router = APIRouter()
 SessionDep = Annotated[Session, Depends(get_session)]
+SUMMARY_PAGE_SIZE = 1000
+
+
+def _summary_rows(session: Session, payload: SummaryRequest | None) -> list[Series]:
+    if payload and payload.series_id is not None:
+        return [series_service.get_series(payload.series_id, session)]
+    # The whole catalog is summarized; sharding keeps each prompt bounded.
+    rows: list[Series] = []
+    while True:
+        page = series_service.list_series(session, offset=len(rows), limit=SUMMARY_PAGE_SIZE)
+        rows.extend(page)
+        if len(page) < SUMMARY_PAGE_SIZE:
+            return rows
+
+
+def _sse(item: str | SummaryProgress | SummaryResult) -> str:
+    if isinstance(item, SummaryResult):
+        return f"event: summary\ndata: {item.model_dump_json()}\n\n"
+    if isinstance(item, SummaryProgress):
+        return f"event: progress\ndata: {item.model_dump_json()}\n\n"
+    return f"event: token\ndata: {json.dumps({'text': item})}\n\n"
 
 
 @router.post("/summary", response_model=SummaryResult)
@@ -20,8 +44,64 @@ async def summary(
     payload: SummaryRequest | None = Body(default=None),
 ) -> SummaryResult:
     """Generate an AI summary of the series catalog."""
-    if payload and payload.series_id is not None:
-        rows = [series_service.get_series(payload.series_id, session)]
-    else:
-        rows = series_service.list_series(session, offset=0, limit=200)
-    return await generate_summary(rows)
+    return await generate_summary(_summary_rows(session, payload))
+
+
+@router.post("/summary/stream")
+async def summary_stream(
+    session: SessionDep,
+    _: TokenPayload = Depends(require_role("admin", "viewer")),
+    payload: SummaryRequest | None = Body(default=None),
+) -> StreamingResponse:
+    """Stream an AI summary as Server-Sent Events.
+
+    Emits `token` events with text deltas while the model generates, then one
+    `summary` event carrying the parsed `SummaryResult`. Catalogs summarized in
+    shards first emit a `progress` event (`SummaryProgress`) per finished shard. If
+    the admission gate sheds a later model call, the stream ends with an `error` event.
+    """
+    items = stream_summary(_summary_rows(session, payload))
+    # Wait for the first item before the response starts, so a gate rejection of the
+    # first model call still gets a proper status code.
+    first = await anext(items)
+
+    async def _events() -> AsyncIterator[str]:
+        try:
+            yield _sse(first)
+            async for item in items:
+                yield _sse(item)
+        except HTTPException as exc:  # a later model call was shed by the gate
+            error = {"status": exc.status_code, "detail": exc.detail}
+            yield f"event: error\ndata: {json.dumps(error)}\n\n"
+        finally:
+            await items.aclose()
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post("/summary/jobs", response_model=QueueMessage, status_code=status.HTTP_202_ACCEPTED)
+async def queue_summary(
+    token: TokenPayload = Depends(require_role("admin", "viewer")),
+    payload: SummaryRequest | None = Body(default=None),
+    redis=Depends(get_redis),
+) -> QueueMessage:
+    """Queue an AI summary for the worker; poll `GET /summary/{job_id}` for the result."""
+    series_id = payload.series_id if payload else None
+    return await enqueue_summary_job(redis, requested_by=token.sub, series_id=series_id)
+
+
+@router.get("/summary/{job_id}", response_model=JobStatus)
+async def summary_job_status(
+    job_id: str,
+    _: TokenPayload = Depends(require_role("admin", "viewer")),
+    redis=Depends(get_redis),
+) -> JobStatus:
+    """Return the state of a queued AI summary job."""
+    job = await get_job_status(redis, job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+    return job
@@ -0,0 +1,14 @@
+from typing import Any
+
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+
+def projected_response(content: Any, response: Response) -> JSONResponse:
+    """Send a `fields=` projection as plain JSON.
+
+    Partial rows would fail response_model validation, so they bypass it. Headers the
+    handler set on its injected `response` (`X-Change-Seq`, `X-Next-Cursor`) are kept.
+    """
+    return JSONResponse(jsonable_encoder(content), headers=dict(response.headers))
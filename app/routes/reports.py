@@ -1,13 +1,14 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlmodel import Session
 
 from ..db import get_session
-from ..models import Report, ReportCreate
+from ..models import Report, ReportCreate, ReportSummary
 from ..queue import QueueMessage, enqueue_report_job, get_redis
 from ..security import TokenPayload, require_role
 from ..services import reports as report_service
+from .helpers import projected_response
 
 router = APIRouter()
 SessionDep = Annotated[Session, Depends(get_session)]
@@ -23,13 +24,40 @@ def create_report(
     return report_service.create_report(payload, session, created_by=token.sub)
 
 
-@router.get("", response_model=list[Report])
+@router.get("", response_model=list[Report] | list[ReportSummary])
 def list_reports(
     session: SessionDep,
+    response: Response,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: str | None = Query(None, description="`X-Next-Cursor` from the previous page."),
+    summary: bool = Query(False, description="Leave out report content."),
+    fields: str | None = Query(None, description="Comma-separated fields, e.g. `id,title`."),
     token: TokenPayload = Depends(require_role("admin")),
-) -> list[Report]:
-    """List reports."""
-    return report_service.list_reports(session)
+) -> list[Report] | list[ReportSummary] | Response:
+    """List reports, newest first.
+
+    When more reports exist, the `X-Next-Cursor` header carries the cursor for the
+    next page. `fields` returns only the named fields (it takes precedence over
+    `summary`).
+    """
+    items, next_cursor = report_service.list_reports(
+        session, limit=limit, cursor=cursor, summary=summary, fields=fields
+    )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    if fields:
+        return projected_response(items, response)
+    return items
+
+
+@router.get("/{report_id}", response_model=Report)
+def get_report(
+    report_id: int,
+    session: SessionDep,
+    token: TokenPayload = Depends(require_role("admin")),
+) -> Report:
+    """Get a report with its full content."""
+    return report_service.get_report(report_id, session)
 
 
 @router.post("/queue", response_model=QueueMessage, status_code=status.HTTP_202_ACCEPTED)
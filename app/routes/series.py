@@ -1,25 +1,158 @@
-from typing import Annotated
+import asyncio
+from typing import Annotated, AsyncIterator
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlmodel import Session
+from starlette.background import BackgroundTask
 
+from ..config import SERIES_EVENTS_KEEPALIVE_SECONDS
 from ..db import get_session
-from ..models import Series, SeriesCreate, SeriesUpdate
+from ..events import series_events
+from ..models import (
+    Series,
+    SeriesBatch,
+    SeriesBatchGet,
+    SeriesChange,
+    SeriesCreate,
+    SeriesStats,
+    SeriesUpdate,
+)
+from ..services import changes as changes_service
+from ..services import export as export_service
 from ..services import series as service
+from .helpers import projected_response
 
 router = APIRouter()
 SessionDep = Annotated[Session, Depends(get_session)]
+EVENT_REPLAY_LIMIT = 1000
+FIELDS_DESCRIPTION = "Comma-separated fields to return, e.g. `id,title`."
+
+
+def _sse(change: SeriesChange) -> str:
+    return f"id: {change.seq}\nevent: {change.op}\ndata: {change.model_dump_json()}\n\n"
 
 
 @router.get("", response_model=list[Series])
 def list_series(
     session: SessionDep,
+    response: Response,
     offset: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     query: str | None = Query(None, min_length=1, max_length=120),
-) -> list[Series]:
-    """List all series entries."""
-    return service.list_series(session, offset=offset, limit=limit, query=query)
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+) -> list[Series] | Response:
+    """List all series entries.
+
+    `X-Change-Seq` is the change-log head read before the rows, so a client that
+    mirrors the catalog can continue from it with `GET /series/changes?since=`.
+    """
+    response.headers["X-Change-Seq"] = str(changes_service.head_seq(session))
+    items = service.list_series(session, offset=offset, limit=limit, query=query, fields=fields)
+    if fields:
+        return projected_response(items, response)
+    return items
+
+
+@router.get("/stats", response_model=SeriesStats)
+def series_stats(session: SessionDep) -> SeriesStats:
+    """Catalog aggregates plus the change sequence they were computed at."""
+    return changes_service.catalog_stats(session)
+
+
+@router.get("/export", response_class=StreamingResponse)
+def export_series(
+    session: SessionDep,
+    format: str = Query("parquet", pattern="^(parquet|arrow)$"),
+) -> StreamingResponse:
+    """Download the whole catalog as Parquet or an Arrow IPC stream.
+
+    The body is streamed in record batches read straight from the database, which
+    analytics clients can load without paging through JSON.
+    """
+    media_type, filename = export_service.EXPORT_FORMATS[format]
+    return StreamingResponse(
+        export_service.export_series(session, format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/changes", response_model=list[SeriesChange])
+def series_changes(
+    session: SessionDep,
+    response: Response,
+    since: int = Query(0, ge=0),
+    limit: int = Query(1000, ge=1, le=5000),
+) -> list[SeriesChange]:
+    """Series changes after sequence `since`, oldest first; deletes are tombstones.
+
+    Page by passing the last `seq` back as `since`. `X-Change-Seq` is the log head.
+    A 410 means `since` is older than the retained log: reload `GET /series`.
+    A `reset` entry (`series_id` is null, no snapshots) marks a bulk write that bypassed
+    the log: resync from `GET /series/stats` (or reload `GET /series`) and continue from
+    the `seq` it returns.
+    """
+    response.headers["X-Change-Seq"] = str(changes_service.head_seq(session))
+    return changes_service.list_changes(session, since=since, limit=limit)
+
+
+@router.get("/events")
+async def series_event_stream(
+    session: SessionDep,
+    since: int | None = Query(None, ge=0, description="Replay changes after this seq first."),
+    last_event_id: str | None = Header(None),
+) -> StreamingResponse:
+    """Stream series changes as Server-Sent Events.
+
+    Events are named after the change (`create`, `update`, `delete`, `refresh`) and carry
+    the `SeriesChange` as data and its `seq` as the event id. Reconnecting with
+    `Last-Event-ID` (or passing `since`) replays missed changes from the change log
+    first. A `reset` event means the client should reload `GET /series`.
+    """
+    resume_from = int(last_event_id) if last_event_id and last_event_id.isdigit() else since
+    # Subscribe before reading the replay so nothing committed in between is lost.
+    subscription = series_events.subscribe()
+    replay: list[SeriesChange] = []
+    reset = False
+    if resume_from is not None:
+        try:
+            replay = changes_service.list_changes(
+                session, since=resume_from, limit=EVENT_REPLAY_LIMIT + 1
+            )
+        except HTTPException:
+            reset = True
+        if len(replay) > EVENT_REPLAY_LIMIT:
+            replay, reset = [], True
+
+    async def _events() -> AsyncIterator[str]:
+        try:
+            if reset:
+                yield 'event: reset\ndata: {"reason": "replay unavailable"}\n\n'
+            replayed_to = resume_from or 0
+            for change in replay:
+                yield _sse(change)
+                replayed_to = change.seq
+            # A lagged subscriber is closed; EventSource reconnects with Last-Event-ID.
+            while not subscription.lagged:
+                try:
+                    change = await asyncio.wait_for(
+                        subscription.queue.get(), SERIES_EVENTS_KEEPALIVE_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if change.seq > replayed_to:
+                    yield _sse(change)
+        finally:
+            series_events.unsubscribe(subscription)
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        background=BackgroundTask(series_events.unsubscribe, subscription),
+    )
 
 
 @router.post("", response_model=Series, status_code=status.HTTP_201_CREATED)
@@ -28,10 +161,28 @@ def create_series(series: SeriesCreate, session: SessionDep) -> Series:
     return service.create_series(series, session)
 
 
+@router.post("/batch-get", response_model=SeriesBatch)
+def get_series_batch(payload: SeriesBatchGet, session: SessionDep) -> SeriesBatch:
+    """Get many series entries by ID in one call.
+
+    `items` follows the order of `ids` (duplicates included) with `null` for IDs that
+    do not exist; those IDs are also listed once in `missing`.
+    """
+    return service.get_series_batch(payload.ids, session)
+
+
 @router.get("/{series_id}", response_model=Series)
-def get_series(series_id: int, session: SessionDep) -> Series:
+def get_series(
+    series_id: int,
+    session: SessionDep,
+    response: Response,
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+) -> Series | Response:
     """Get a series entry by ID."""
-    return service.get_series(series_id, session)
+    series = service.get_series(series_id, session, fields=fields)
+    if fields:
+        return projected_response(series, response)
+    return series
 
 
 @router.put("/{series_id}", response_model=Series)
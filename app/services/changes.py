@@ -0,0 +1,129 @@
+from datetime import datetime
+
+from fastapi import HTTPException, status
+from sqlalchemy import func, literal, union_all
+from sqlmodel import Session, delete, select, update
+
+from ..models import Series, SeriesChange, SeriesChangeDB, SeriesDB, SeriesStats
+
+
+def snapshot(row: SeriesDB | None) -> dict | None:
+    """JSON snapshot of a row as stored in the change log."""
+    return Series.model_validate(row).model_dump(mode="json") if row is not None else None
+
+
+def record_change(
+    session: Session,
+    op: str,
+    series_id: int,
+    previous: dict | None,
+    current: SeriesDB | None,
+) -> SeriesChange:
+    """Write a change-log entry in the caller's transaction and return it.
+
+    `previous` is a `snapshot` taken before the write; `current` is the row after it.
+    """
+    row = SeriesChangeDB(series_id=series_id, op=op, previous=previous, current=snapshot(current))
+    session.add(row)
+    session.flush()
+    return SeriesChange.model_validate(row, update={"seq": row.id})
+
+
+def record_reset(session: Session) -> None:
+    """Mark a bulk write that bypassed the change log; consumers must resync."""
+    session.add(SeriesChangeDB(op="reset"))
+
+
+def head_seq(session: Session) -> int:
+    """Sequence number of the newest change (0 for an empty log)."""
+    return session.exec(select(func.coalesce(func.max(SeriesChangeDB.id), 0))).one()
+
+
+def list_changes(session: Session, since: int = 0, limit: int = 1000) -> list[SeriesChange]:
+    """Return change-log entries after sequence `since`, oldest first.
+
+    Deletes appear as tombstones (`current` is None). Raises 410 when `since` predates
+    the retained log, in which case the client has to reload the catalog.
+    """
+    oldest = session.exec(
+        select(SeriesChangeDB.id, SeriesChangeDB.op).order_by(SeriesChangeDB.id).limit(1)
+    ).first()
+    if oldest is not None and oldest.op == "pruned" and since < oldest.id:
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail=(
+                f"Changes up to seq {oldest.id} were pruned; reload GET /series and "
+                "resume from its X-Change-Seq header."
+            ),
+        )
+    rows = session.exec(
+        select(SeriesChangeDB)
+        .where(SeriesChangeDB.id > since)
+        .order_by(SeriesChangeDB.id)
+        .limit(limit)
+    ).all()
+    return [SeriesChange.model_validate(row, update={"seq": row.id}) for row in rows]
+
+
+def prune_changes(session: Session, before: datetime) -> int:
+    """Drop entries older than `before`; return how many were removed.
+
+    The newest pruned entry is kept as a payload-free `pruned` marker so the feed can
+    tell a client whose cursor falls in the removed range to resync.
+    """
+    cutoff = session.exec(
+        select(func.max(SeriesChangeDB.id)).where(SeriesChangeDB.changed_at < before)
+    ).one()
+    if cutoff is None:
+        return 0
+    removed = session.exec(delete(SeriesChangeDB).where(SeriesChangeDB.id < cutoff)).rowcount
+    session.exec(
+        update(SeriesChangeDB)
+        .where(SeriesChangeDB.id == cutoff)
+        .values(op="pruned", series_id=None, previous=None, current=None)
+    )
+    session.commit()
+    return removed + 1
+
+
+def catalog_stats(session: Session) -> SeriesStats:
+    """Aggregate the catalog and read the change sequence in a single statement.
+
+    One statement sees one snapshot, so `seq` is exactly the last change included
+    in the counts and a consumer can continue from it with `list_changes`. The
+    highest-rated series is picked in the same statement and loaded by ID.
+    """
+    seq = select(func.coalesce(func.max(SeriesChangeDB.id), 0)).scalar_subquery()
+    top_id = (
+        select(SeriesDB.id)
+        .where(SeriesDB.rating.is_not(None))
+        .order_by(SeriesDB.rating.desc(), SeriesDB.id)
+        .limit(1)
+        .scalar_subquery()
+    )
+    per_year = select(
+        SeriesDB.year,
+        func.count().label("count"),
+        func.count(SeriesDB.rating).label("rated"),
+        func.coalesce(func.sum(SeriesDB.rating), 0.0).label("rating_sum"),
+        seq.label("seq"),
+        top_id.label("top_id"),
+    ).group_by(SeriesDB.year)
+    # Guarantees one row (carrying seq) even when the catalog is empty.
+    sentinel = select(literal(None), literal(0), literal(0), literal(0.0), seq, top_id)
+    rows = session.exec(union_all(per_year, sentinel)).all()
+
+    years = {year: count for year, count, *_ in rows if year is not None}
+    count = sum(years.values())
+    rated_count = sum(row[2] for row in rows)
+    rating_sum = float(sum(row[3] for row in rows))
+    top_rated = session.get(SeriesDB, rows[0][5]) if rows[0][5] is not None else None
+    return SeriesStats(
+        seq=rows[0][4],
+        count=count,
+        rated_count=rated_count,
+        rating_sum=rating_sum,
+        average_rating=rating_sum / rated_count if rated_count else None,
+        top_rated=Series.model_validate(top_rated) if top_rated is not None else None,
+        years=years,
+    )
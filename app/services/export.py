@@ -0,0 +1,103 @@
+from typing import Iterator
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlmodel import Session, select
+
+from ..config import SERIES_EXPORT_BATCH_SIZE
+from ..models import SeriesDB
+
+EXPORT_FORMATS = {
+    "parquet": ("application/vnd.apache.parquet", "series.parquet"),
+    "arrow": ("application/vnd.apache.arrow.stream", "series.arrows"),
+}
+EXPORT_COLUMNS = (
+    SeriesDB.id,
+    SeriesDB.title,
+    SeriesDB.creator,
+    SeriesDB.year,
+    SeriesDB.rating,
+    SeriesDB.last_refreshed_at,
+)
+
+
+def export_schema() -> pa.Schema:
+    return pa.schema(
+        [
+            pa.field("id", pa.int64(), nullable=False),
+            pa.field("title", pa.string(), nullable=False),
+            pa.field("creator", pa.string(), nullable=False),
+            pa.field("year", pa.int16(), nullable=False),
+            pa.field("rating", pa.float64()),
+            pa.field("last_refreshed_at", pa.timestamp("us", tz="UTC")),
+        ]
+    )
+
+
+class _ChunkSink:
+    """Write-only file object drained after every record batch, so nothing buffers whole."""
+
+    def __init__(self) -> None:
+        self._parts: list[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data: bytes) -> int:
+        self._parts.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def take(self) -> bytes:
+        chunk = b"".join(self._parts)
+        self._parts.clear()
+        return chunk
+
+
+def _record_batches(session: Session, batch_size: int) -> Iterator[pa.RecordBatch]:
+    schema = export_schema()
+    result = session.exec(
+        select(*EXPORT_COLUMNS).order_by(SeriesDB.id).execution_options(yield_per=batch_size)
+    )
+    for rows in result.partitions():
+        columns = list(zip(*rows))
+        yield pa.RecordBatch.from_arrays(
+            [pa.array(values, type=field.type) for values, field in zip(columns, schema)],
+            schema=schema,
+        )
+
+
+def export_series(
+    session: Session, fmt: str, batch_size: int = SERIES_EXPORT_BATCH_SIZE
+) -> Iterator[bytes]:
+    """Stream the catalog as Arrow IPC or Parquet, one record batch per DB fetch.
+
+    Each batch of `batch_size` rows becomes one IPC message or Parquet row group and
+    is sent as soon as it is encoded.
+    """
+    return _encode(session, fmt, batch_size)
+
+
+def _encode(session: Session, fmt: str, batch_size: int) -> Iterator[bytes]:
+    sink = _ChunkSink()
+    schema = export_schema()
+    output = pa.PythonFile(sink, mode="w")
+    if fmt == "parquet":
+        writer = pq.ParquetWriter(output, schema, compression="zstd")
+    else:
+        writer = pa.ipc.new_stream(output, schema)
+    with writer:
+        for batch in _record_batches(session, batch_size):
+            writer.write_batch(batch)
+            if chunk := sink.take():
+                yield chunk
+    # Closing writes the Parquet footer or the IPC end-of-stream marker.
+    yield sink.take()
@@ -1,7 +1,22 @@
-from sqlmodel import Session, select
+from typing import Sequence
+
+from fastapi import HTTPException, status
+from sqlalchemy import Select, tuple_
+from sqlalchemy import select as sa_select
+from sqlmodel import Session, SQLModel, select
 
 from ..models import SeriesCreate, SeriesDB
 
+SeriesKey = tuple[str, str, int]
+
+# Three bound parameters per key keeps each IN list under SQLite's 999-variable limit.
+_KEYS_PER_QUERY = 300
+
+
+def series_key(series: SeriesCreate) -> SeriesKey:
+    """Return the identity fields used for duplicate detection."""
+    return (series.title, series.creator, series.year)
+
 
 def find_duplicate_series(series: SeriesCreate, session: Session) -> SeriesDB | None:
     """Return an existing series that matches the identity fields, if any."""
@@ -12,3 +27,45 @@ def find_duplicate_series(series: SeriesCreate, session: Session) -> SeriesDB |
             SeriesDB.year == series.year,
         )
     ).first()
+
+
+def find_existing_series_keys(series: Sequence[SeriesCreate], session: Session) -> set[SeriesKey]:
+    """Return the identity keys from a batch that already exist, using one tuple-IN query."""
+    keys = list(dict.fromkeys(series_key(item) for item in series))
+    existing: set[SeriesKey] = set()
+    for start in range(0, len(keys), _KEYS_PER_QUERY):
+        chunk = keys[start : start + _KEYS_PER_QUERY]
+        rows = session.exec(
+            select(SeriesDB.title, SeriesDB.creator, SeriesDB.year).where(
+                tuple_(SeriesDB.title, SeriesDB.creator, SeriesDB.year).in_(chunk)
+            )
+        ).all()
+        existing.update((title, creator, year) for title, creator, year in rows)
+    return existing
+
+
+def parse_fields(fields: str | None, model: type[SQLModel]) -> list[str] | None:
+    """Validate a comma-separated `fields=` projection against a public model.
+
+    Returns the selected names in the model's declared order, or None when no
+    projection was requested. Unknown names raise a 400.
+    """
+    if fields is None:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    allowed = list(model.model_fields)
+    unknown = requested.difference(allowed)
+    if unknown or not requested:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=(
+                f"Unknown fields: {', '.join(sorted(unknown)) or '(none given)'}. "
+                f"Choose from: {', '.join(allowed)}."
+            ),
+        )
+    return [name for name in allowed if name in requested]
+
+
+def select_columns(table: type[SQLModel], columns: Sequence[str]) -> Select:
+    """SELECT just the named columns; rows stay tuples even when only one is picked."""
+    return sa_select(*(getattr(table, name) for name in columns))
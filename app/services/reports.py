@@ -1,6 +1,55 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from fastapi import HTTPException, status
+from sqlalchemy import or_
 from sqlmodel import Session, select
 
-from ..models import Report, ReportCreate, ReportDB
+from ..compression import decompress, resolve_codec
+from ..compression import compress as compress_bytes
+from ..config import REPORT_COMPRESSION, REPORT_COMPRESSION_MIN_BYTES
+from ..models import Report, ReportCreate, ReportDB, ReportSummary
+from .helpers import parse_fields, select_columns
+
+SUMMARY_COLUMNS = (ReportDB.id, ReportDB.title, ReportDB.created_at, ReportDB.created_by)
+# Always read for a projection: the cursor needs the keyset, `content` needs its encoding.
+CURSOR_COLUMNS = ["id", "created_at"]
+CONTENT_COLUMNS = ["content", "content_encoding", "content_compressed"]
+NEWEST_FIRST = (ReportDB.created_at.desc(), ReportDB.id.desc())
+REPORT_CODEC = resolve_codec(REPORT_COMPRESSION)
+
+
+def compress_content(report: ReportDB, codec: str | None = REPORT_CODEC) -> int:
+    """Move a large plain `content` into `content_compressed`; return the bytes saved.
+
+    Bodies below `REPORT_COMPRESSION_MIN_BYTES`, or that do not shrink, stay as text.
+    """
+    if codec is None or report.content_encoding:
+        return 0
+    raw = report.content.encode()
+    if len(raw) < REPORT_COMPRESSION_MIN_BYTES:
+        return 0
+    packed = compress_bytes(raw, codec)
+    if len(packed) >= len(raw):
+        return 0
+    report.content = ""
+    report.content_encoding = codec
+    report.content_compressed = packed
+    return len(raw) - len(packed)
+
+
+def _content(row: ReportDB) -> str:
+    if not row.content_encoding:
+        return row.content
+    return decompress(row.content_compressed, row.content_encoding).decode()
+
+
+def _to_report(row: ReportDB) -> Report:
+    if not row.content_encoding:
+        return Report.model_validate(row)
+    return Report.model_validate(row, update={"content": _content(row)})
 
 
 def create_report(payload: ReportCreate, session: Session, created_by: str) -> Report:
@@ -11,19 +60,84 @@ def create_report(payload: ReportCreate, session: Session, created_by: str) -> R
             "created_by": created_by,
         }
     )
+    compress_content(report)
     session.add(report)
     session.commit()
     session.refresh(report)
-    return Report.model_validate(report)
+    return _to_report(report)
+
+
+def get_report(report_id: int, session: Session) -> Report:
+    """Fetch a report by ID (content decompressed) or raise a 404."""
+    report = session.get(ReportDB, report_id)
+    if report is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Report not found")
+    return _to_report(report)
+
+
+def encode_cursor(created_at: datetime, report_id: int) -> str:
+    """Opaque keyset cursor pointing just after the given report."""
+    raw = json.dumps([created_at.isoformat(), report_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, report_id = json.loads(raw)
+        return datetime.fromisoformat(created_at), int(report_id)
+    except (binascii.Error, ValueError, TypeError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        ) from exc
+
 
+def list_reports(
+    session: Session,
+    limit: int = 50,
+    cursor: str | None = None,
+    summary: bool = False,
+    fields: str | None = None,
+) -> tuple[list[Report] | list[ReportSummary] | list[dict], str | None]:
+    """Return one page of reports, newest first, plus the cursor for the next page.
 
-def list_reports(session: Session, limit: int = 50) -> list[Report]:
-    """Return the most recent reports."""
-    rows = session.exec(select(ReportDB).order_by(ReportDB.created_at.desc()).limit(limit)).all()
-    return [Report.model_validate(row) for row in rows]
+    Pages are keyset-based on (created_at, id), which the created_at index serves
+    without sorting, so deep pages cost the same as the first. In summary mode only
+    the metadata columns are selected, so content is neither read nor decompressed;
+    `fields` narrows the SELECT to the named columns and returns dicts instead.
+    """
+    columns = parse_fields(fields, Report)
+    if columns:
+        needed = CURSOR_COLUMNS + (CONTENT_COLUMNS if "content" in columns else [])
+        statement = select_columns(ReportDB, list(dict.fromkeys(columns + needed)))
+    elif summary:
+        statement = select(*SUMMARY_COLUMNS)
+    else:
+        statement = select(ReportDB)
+    if cursor:
+        created_at, report_id = decode_cursor(cursor)
+        # The redundant `<=` bound lets the index seek instead of scanning from the top.
+        statement = statement.where(
+            ReportDB.created_at <= created_at,
+            or_(ReportDB.created_at < created_at, ReportDB.id < report_id),
+        )
+    rows = session.exec(statement.order_by(*NEWEST_FIRST).limit(limit + 1)).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if columns:
+        items = [
+            {name: _content(row) if name == "content" else getattr(row, name) for name in columns}
+            for row in rows
+        ]
+    elif summary:
+        items = [ReportSummary.model_validate(row._mapping) for row in rows]
+    else:
+        items = [_to_report(row) for row in rows]
+    next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id) if has_more else None
+    return items, next_cursor
 
 
 def latest_report(session: Session) -> Report | None:
     """Return the latest report if present."""
-    row = session.exec(select(ReportDB).order_by(ReportDB.created_at.desc()).limit(1)).first()
-    return Report.model_validate(row) if row else None
+    row = session.exec(select(ReportDB).order_by(*NEWEST_FIRST).limit(1)).first()
+    return _to_report(row) if row else None
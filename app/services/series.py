@@ -4,8 +4,10 @@ from fastapi import HTTPException, status
 from sqlalchemy import func, or_
 from sqlmodel import Session, select
 
-from ..models import Series, SeriesCreate, SeriesDB, SeriesUpdate
-from .helpers import find_duplicate_series
+from ..events import series_events
+from ..models import Series, SeriesBatch, SeriesCreate, SeriesDB, SeriesUpdate
+from .changes import record_change, snapshot
+from .helpers import find_duplicate_series, parse_fields, select_columns
 
 
 def list_series(
@@ -13,9 +15,14 @@ def list_series(
     offset: int = 0,
     limit: int = 100,
     query: str | None = None,
-) -> list[Series]:
-    """Return series ordered by ID with pagination and optional query."""
-    statement = select(SeriesDB)
+    fields: str | None = None,
+) -> list[Series] | list[dict]:
+    """Return series ordered by ID with pagination and optional query.
+
+    With `fields`, only those columns are selected and rows come back as dicts.
+    """
+    columns = parse_fields(fields, Series)
+    statement = select_columns(SeriesDB, columns) if columns else select(SeriesDB)
     if query and query.strip():
         normalized = f"%{query.strip().lower()}%"
         statement = statement.where(
@@ -25,6 +32,8 @@ def list_series(
             )
         )
     rows = session.exec(statement.order_by(SeriesDB.id).offset(offset).limit(limit)).all()
+    if columns:
+        return [dict(row._mapping) for row in rows]
     return [Series.model_validate(row) for row in rows]
 
 
@@ -35,17 +44,36 @@ def create_series(series: SeriesCreate, session: Session) -> Series:
 
     db_series = SeriesDB.model_validate(series)
     session.add(db_series)
+    session.flush()
+    change = record_change(session, "create", db_series.id, None, db_series)
     session.commit()
+    series_events.publish(change)
     session.refresh(db_series)
     return Series.model_validate(db_series)
 
 
-def get_series(series_id: int, session: Session) -> Series:
-    """Fetch a series by ID or raise a 404."""
-    series = session.get(SeriesDB, series_id)
+def get_series(series_id: int, session: Session, fields: str | None = None) -> Series | dict:
+    """Fetch a series by ID or raise a 404; `fields` projects it to a dict of those columns."""
+    if columns := parse_fields(fields, Series):
+        row = session.exec(
+            select_columns(SeriesDB, columns).where(SeriesDB.id == series_id)
+        ).first()
+        series = dict(row._mapping) if row is not None else None
+    else:
+        series = session.get(SeriesDB, series_id)
     if series is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Series not found")
-    return Series.model_validate(series)
+    return series if columns else Series.model_validate(series)
+
+
+def get_series_batch(ids: list[int], session: Session) -> SeriesBatch:
+    """Fetch many series with one IN query, keeping request order and reporting misses."""
+    rows = session.exec(select(SeriesDB).where(SeriesDB.id.in_(set(ids)))).all()
+    found = {row.id: Series.model_validate(row) for row in rows}
+    return SeriesBatch(
+        items=[found.get(series_id) for series_id in ids],
+        missing=[series_id for series_id in dict.fromkeys(ids) if series_id not in found],
+    )
 
 
 def update_series(series_id: int, payload: SeriesCreate, session: Session) -> Series:
@@ -54,12 +82,15 @@ def update_series(series_id: int, payload: SeriesCreate, session: Session) -> Se
     if series is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Series not found")
 
+    previous = snapshot(series)
     series.title = payload.title
     series.creator = payload.creator
     series.year = payload.year
     series.rating = payload.rating
     session.add(series)
+    change = record_change(session, "update", series_id, previous, series)
     session.commit()
+    series_events.publish(change)
     session.refresh(series)
     return Series.model_validate(series)
 
@@ -70,12 +101,15 @@ def patch_series(series_id: int, payload: SeriesUpdate, session: Session) -> Ser
     if series is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Series not found")
 
+    previous = snapshot(series)
     updates = payload.model_dump(exclude_unset=True)
     for field, value in updates.items():
         setattr(series, field, value)
 
     session.add(series)
+    change = record_change(session, "update", series_id, previous, series)
     session.commit()
+    series_events.publish(change)
     session.refresh(series)
     return Series.model_validate(series)
 
@@ -86,8 +120,10 @@ def delete_series(series_id: int, session: Session) -> None:
     if series is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Series not found")
 
+    change = record_change(session, "delete", series_id, snapshot(series), None)
     session.delete(series)
     session.commit()
+    series_events.publish(change)
 
 
 def refresh_series(series_id: int, session: Session) -> Series:
@@ -95,8 +131,11 @@ def refresh_series(series_id: int, session: Session) -> Series:
     series = session.get(SeriesDB, series_id)
     if series is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Series not found")
+    previous = snapshot(series)
     series.last_refreshed_at = datetime.now(timezone.utc)
     session.add(series)
+    change = record_change(session, "refresh", series_id, previous, series)
     session.commit()
+    series_events.publish(change)
     session.refresh(series)
     return Series.model_validate(series)
@@ -0,0 +1,79 @@
+import random
+from typing import Any, Iterator
+
+TITLE_ADJECTIVES = tuple(
+    (
+        "Dark Silent Broken Golden Hidden Last Lost Crimson Wild Quiet Burning Frozen Hollow "
+        "Electric Northern Savage Little Endless"
+    ).split()
+)
+TITLE_NOUNS = tuple(
+    (
+        "Crown Harbor Signal Empire Station Frontier Echo Atlas Raven Summit Shadow Orbit "
+        "Canyon Legacy Tide Kingdom Bureau Garden Protocol Verdict District Dynasty Colony "
+        "Archive Outpost Republic"
+    ).split()
+)
+TITLE_PLACES = tuple(
+    (
+        "Brooklyn Marseille Oslo Havana Kyoto Lagos Glasgow Tijuana Reykjavik Baltimore "
+        "Naples Wellington Montreal Seoul Dublin"
+    ).split()
+)
+FIRST_NAMES = tuple(
+    (
+        "Alex Jordan Maria Sam Priya Tomas Chen Amara Lucas Noor Hannah Mateo Yuki Grace Omar "
+        "Ingrid Dev Sofia Ravi Claire"
+    ).split()
+)
+LAST_NAMES = tuple(
+    (
+        "Gilligan Morgan Erickson White Yost Mazin Hawley Esmail Armstrong Gilroy Okafor "
+        "Lindqvist Tanaka Moreau Castillo Novak Brennan Sato Haddad Kowalski Fischer Reyes "
+        "Abara Quinn"
+    ).split()
+)
+_ROMAN = ("II", "III", "IV", "V", "VI", "VII", "VIII", "IX", "X")
+
+
+def _title(rng: random.Random) -> str:
+    pattern = rng.random()
+    if pattern < 0.35:
+        return f"The {rng.choice(TITLE_ADJECTIVES)} {rng.choice(TITLE_NOUNS)}"
+    if pattern < 0.6:
+        return f"{rng.choice(TITLE_NOUNS)} of {rng.choice(TITLE_PLACES)}"
+    if pattern < 0.8:
+        return f"{rng.choice(TITLE_ADJECTIVES)} {rng.choice(TITLE_PLACES)}"
+    return f"{rng.choice(TITLE_NOUNS)}: {rng.choice(TITLE_ADJECTIVES)} {rng.choice(TITLE_NOUNS)}"
+
+
+def _rating(rng: random.Random) -> float | None:
+    """Ratings cluster around 7.3 with a long low tail; a few shows are unrated."""
+    if rng.random() < 0.06:
+        return None
+    return round(min(max(rng.gauss(7.3, 1.0), 1.0), 10.0), 1)
+
+
+def synthetic_series(count: int, seed: int = 42) -> Iterator[dict[str, Any]]:
+    """Yield `count` deterministic, realistic-looking series rows.
+
+    The same seed always produces the same rows, and (title, creator, year) is unique
+    across the output so it matches the API's duplicate rules.
+    """
+    rng = random.Random(seed)
+    seen: set[tuple[str, str, int]] = set()
+    creators = [f"{first} {last}" for first in FIRST_NAMES for last in LAST_NAMES]
+    for _ in range(count):
+        title = _title(rng)
+        creator = rng.choice(creators)
+        # Skew towards recent years: most catalogs are dominated by streaming-era shows.
+        year = int(rng.triangular(1950, 2026, 2019))
+        candidate = title
+        suffix = 0
+        while (candidate, creator, year) in seen:
+            candidate = (
+                f"{title} {_ROMAN[suffix]}" if suffix < len(_ROMAN) else f"{title} {suffix + 2}"
+            )
+            suffix += 1
+        seen.add((candidate, creator, year))
+        yield {"title": candidate, "creator": creator, "year": year, "rating": _rating(rng)}
@@ -0,0 +1,82 @@
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from .config import SLOW_QUERY_MS
+
+logger = logging.getLogger("tv_db.sql")
+
+
+@dataclass
+class QueryStats:
+    """Per-request SQL statement counters."""
+
+    trace_id: str | None = None
+    count: int = 0
+    total_ms: float = 0.0
+
+    def server_timing(self) -> str:
+        """Format the stats as a `Server-Timing` header value."""
+        return f'db;dur={self.total_ms:.2f};desc="{self.count} queries"'
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar("tv_db_query_stats", default=None)
+
+
+@contextmanager
+def track_queries(trace_id: str | None = None) -> Iterator[QueryStats]:
+    """Collect statement counts and DB time for everything run inside the block."""
+    stats = QueryStats(trace_id=trace_id)
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def _redacted(parameters: Any) -> str:
+    """Describe bound parameters without exposing their values."""
+    if not parameters:
+        return "none"
+    if (
+        isinstance(parameters, (list, tuple))
+        and parameters
+        and isinstance(parameters[0], (list, tuple, dict))
+    ):
+        return f"<redacted {len(parameters)} rows>"
+    return f"<redacted {len(parameters)}>"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    started = conn.info["query_start_time"].pop()
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.total_ms += elapsed_ms
+    if elapsed_ms >= SLOW_QUERY_MS:
+        logger.warning(
+            "Slow query (%.1f ms) trace_id=%s params=%s: %s",
+            elapsed_ms,
+            stats.trace_id if stats else None,
+            _redacted(parameters),
+            " ".join(statement.split()),
+        )
+
+
+def install_query_hooks() -> None:
+    """Attach statement timing hooks to every SQLAlchemy engine (idempotent)."""
+    if event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
@@ -7,17 +7,24 @@ from datetime import datetime, timezone
 import httpx
 import redis.asyncio as redis
 
+from .ai import generate_summary
 from .config import API_BASE_URL, REDIS_QUEUE, REDIS_URL
+from .digest import DigestStats, load_digest_stats, save_digest_stats
+from .http_client import create_async_client
+from .models import Series, SeriesChange, SeriesStats
+from .queue import set_job_status
 
 logger = logging.getLogger("tv_db.worker")
 logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper())
 
+CHANGES_PAGE_SIZE = 1000
+SUMMARY_PAGE_SIZE = 1000
+
 
 async def _login(client: httpx.AsyncClient, username: str, password: str) -> str:
     response = await client.post(
         f"{API_BASE_URL}/auth/login",
         json={"username": username, "password": password},
-        timeout=5,
     )
     response.raise_for_status()
     token = response.json().get("access_token")
@@ -26,34 +33,115 @@ async def _login(client: httpx.AsyncClient, username: str, password: str) -> str
     return token
 
 
-async def _build_report(client: httpx.AsyncClient) -> dict[str, str]:
-    response = await client.get(f"{API_BASE_URL}/series", timeout=10)
-    response.raise_for_status()
-    series = response.json()
-    total = len(series)
-    avg_rating = None
-    if total:
-        ratings = [row["rating"] for row in series if row.get("rating") is not None]
-        avg_rating = sum(ratings) / len(ratings) if ratings else None
+async def _apply_changes(client: httpx.AsyncClient, stats: DigestStats) -> int | None:
+    """Fold change-log entries after `stats.seq` into `stats`.
+
+    Returns how many changes were applied, or None when the aggregates must be
+    rebuilt from a fresh snapshot: after a bulk `reset`, or when the log was pruned
+    past `stats.seq` (410).
+    """
+    applied = 0
+    while True:
+        response = await client.get(
+            f"{API_BASE_URL}/series/changes",
+            params={"since": stats.seq, "limit": CHANGES_PAGE_SIZE},
+        )
+        if response.status_code == httpx.codes.GONE:
+            return None
+        response.raise_for_status()
+        page = [SeriesChange.model_validate(row) for row in response.json()]
+        for change in page:
+            if change.op == "reset":
+                return None
+            stats.apply(change)
+        applied += len(page)
+        if len(page) < CHANGES_PAGE_SIZE:
+            return applied
+
+
+async def _digest_stats(
+    client: httpx.AsyncClient, redis_client: redis.Redis
+) -> tuple[DigestStats, int | None]:
+    """Bring the stored aggregates up to date; the count is None after a full rebuild."""
+    stats = await load_digest_stats(redis_client)
+    applied = await _apply_changes(client, stats) if stats is not None else None
+    if applied is None:
+        # Aggregates over the whole catalog; allow more than the client default.
+        response = await client.get(f"{API_BASE_URL}/series/stats", timeout=30)
+        response.raise_for_status()
+        stats = DigestStats.from_snapshot(SeriesStats.model_validate(response.json()))
+    await save_digest_stats(redis_client, stats)
+    return stats, applied
+
+
+async def _build_report(client: httpx.AsyncClient, redis_client: redis.Redis) -> dict[str, str]:
+    stats, applied = await _digest_stats(client, redis_client)
+    avg_rating = stats.average_rating
     title = "Weekly TV Digest"
     content_lines = [
         f"Generated at: {datetime.now(timezone.utc).isoformat()}",
-        f"Total series: {total}",
+        f"Total series: {stats.count}",
         f"Average rating: {avg_rating:.2f}" if avg_rating is not None else "Average rating: n/a",
+        (
+            f"Changes since last digest: {applied}"
+            if applied is not None
+            else "Changes since last digest: n/a (full recount)"
+        ),
     ]
+    if stats.years:
+        busiest = ", ".join(f"{year} ({count})" for year, count in stats.years.most_common(3))
+        content_lines.append(f"Busiest years: {busiest}")
     return {"title": title, "content": "\n".join(content_lines)}
 
 
-async def _handle_job(message: dict[str, str], client: httpx.AsyncClient, token: str) -> None:
+async def _fetch_summary_rows(client: httpx.AsyncClient, series_id: int | None) -> list[Series]:
+    if series_id is not None:
+        response = await client.get(f"{API_BASE_URL}/series/{series_id}")
+        response.raise_for_status()
+        return [Series.model_validate(response.json())]
+
+    rows: list[Series] = []
+    while True:
+        response = await client.get(
+            f"{API_BASE_URL}/series",
+            params={"offset": len(rows), "limit": SUMMARY_PAGE_SIZE},
+        )
+        response.raise_for_status()
+        page = response.json()
+        rows.extend(Series.model_validate(row) for row in page)
+        if len(page) < SUMMARY_PAGE_SIZE:
+            return rows
+
+
+async def _run_summary_job(
+    message: dict, client: httpx.AsyncClient, redis_client: redis.Redis
+) -> None:
+    job_id = message["job_id"]
+    await set_job_status(redis_client, job_id, "running")
+    try:
+        rows = await _fetch_summary_rows(client, message.get("payload", {}).get("series_id"))
+        result = await generate_summary(rows)
+    except Exception as exc:
+        await set_job_status(redis_client, job_id, "failed", error=str(exc))
+        raise
+    await set_job_status(redis_client, job_id, "done", result=result.model_dump())
+    logger.info("Summary stored for job %s", job_id)
+
+
+async def _handle_job(
+    message: dict, client: httpx.AsyncClient, token: str, redis_client: redis.Redis
+) -> None:
+    if message.get("job_type") == "summary":
+        await _run_summary_job(message, client, redis_client)
+        return
     if message.get("job_type") != "report_digest":
         logger.warning("Unknown job type: %s", message.get("job_type"))
         return
-    payload = await _build_report(client)
+    payload = await _build_report(client, redis_client)
     response = await client.post(
         f"{API_BASE_URL}/reports",
         json=payload,
         headers={"Authorization": f"Bearer {token}"},
-        timeout=10,
     )
     response.raise_for_status()
     logger.info("Report created for job %s", message.get("job_id"))
@@ -63,17 +151,17 @@ async def worker_loop() -> None:
     username = os.getenv("WORKER_USERNAME", "worker")
     password = os.getenv("WORKER_PASSWORD", "worker-pass")
     redis_client = redis.Redis.from_url(REDIS_URL, decode_responses=True)
-    async with httpx.AsyncClient() as client:
+    async with create_async_client() as client:
         token = await _login(client, username, password)
         while True:
             _, raw = await redis_client.blpop(REDIS_QUEUE)
             message = json.loads(raw)
             try:
-                await _handle_job(message, client, token)
+                await _handle_job(message, client, token, redis_client)
             except httpx.HTTPStatusError as exc:
                 if exc.response.status_code == 401:
                     token = await _login(client, username, password)
-                    await _handle_job(message, client, token)
+                    await _handle_job(message, client, token, redis_client)
                 else:
                     logger.exception("Worker job failed: %s", exc)
             except Exception as exc:
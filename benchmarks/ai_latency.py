@@ -0,0 +1,240 @@
+"""Offline latency benchmark for AI summaries.
+
+Starts the OpenAI-compatible stub from `benchmarks.openai_stub` with a fixed time to
+first token and token rate, points the shared agent at it, and splits the latency of a
+summary into its parts:
+
+- `prompt_build` / `parse`: pure CPU work in `app.ai`, timed per call.
+- `generate_summary` and `stream_summary`: end to end against the stub; `overhead_ms`
+  is the measured time minus the stub's configured model time.
+- `route`: `POST /ai/summary` in-process under concurrency, where the admission gate
+  queues (and may shed) model calls on top of the model time.
+
+The result cache is disabled for every phase so each call reaches the model.
+"""
+
+import asyncio
+import json
+import math
+import statistics
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+import httpx
+import typer
+
+from app import ai
+from app.config import AI_SUMMARY_CHUNK_SIZE, AI_SUMMARY_MAX_PARALLEL
+from app.models import Series
+from app.synthetic import synthetic_series
+from benchmarks.load import BENCH_PASSWORD, BENCH_USERNAME, git_commit, measure, setup_in_process
+from benchmarks.openai_stub import DEFAULT_REPLY, tokenize, free_port, run_stub_in_thread
+
+
+def _summarize(name: str, latencies: list[float], model_ms: float | None = None) -> dict[str, Any]:
+    latencies = sorted(latencies)
+    mean_ms = statistics.fmean(latencies)
+    row: dict[str, Any] = {
+        "phase": name,
+        "iterations": len(latencies),
+        "mean_ms": round(mean_ms, 3),
+        "p50_ms": round(statistics.median(latencies), 3),
+        "max_ms": round(latencies[-1], 3),
+    }
+    if model_ms is not None:
+        row["model_ms"] = round(model_ms, 3)
+        row["overhead_ms"] = round(mean_ms - model_ms, 3)
+    return row
+
+
+def _time_cpu(name: str, fn: Callable[[], Any], iterations: int) -> dict[str, Any]:
+    latencies = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        latencies.append((time.perf_counter() - started) * 1000)
+    return _summarize(name, latencies)
+
+
+def model_time_ms(rows: int, latency_ms: float, tokens_per_second: float) -> float:
+    """Time the stub spends "generating" one summary of `rows` series.
+
+    Catalogs larger than one chunk take waves of map calls plus the reduce call. A wave is
+    as wide as the smaller of `AI_SUMMARY_MAX_PARALLEL` and the admission gate, which
+    takes a slot for every model call.
+    """
+    per_call = latency_ms + 1000 * len(tokenize(DEFAULT_REPLY)) / tokens_per_second
+    shards = math.ceil(rows / AI_SUMMARY_CHUNK_SIZE)
+    if shards <= 1:
+        return per_call
+    wave = min(AI_SUMMARY_MAX_PARALLEL, ai.summary_gate.max_concurrent)
+    return per_call * (math.ceil(shards / wave) + 1)
+
+
+@contextmanager
+def _cache_disabled() -> Iterator[None]:
+    cache = ai.summary_cache
+    saved = cache.max_entries, cache.redis_client
+    cache.max_entries, cache.redis_client = 0, None
+    cache.clear()
+    try:
+        yield
+    finally:
+        cache.max_entries, cache.redis_client = saved
+
+
+@contextmanager
+def _agent_pointed_at(base_url: str) -> Iterator[None]:
+    saved = ai.OLLAMA_BASE_URL
+    ai.OLLAMA_BASE_URL = base_url
+    ai._agent = ai._http_client = None
+    try:
+        yield
+    finally:
+        ai.OLLAMA_BASE_URL = saved
+
+
+async def _time_generate(rows: list[Series], iterations: int, model_ms: float) -> dict[str, Any]:
+    # The first call also opens the pooled connection; report it apart from the steady state.
+    started = time.perf_counter()
+    await ai.generate_summary(rows)
+    cold_ms = (time.perf_counter() - started) * 1000
+    latencies = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        result = await ai.generate_summary(rows)
+        latencies.append((time.perf_counter() - started) * 1000)
+        if result is ai.UNAVAILABLE_SUMMARY:
+            raise RuntimeError("Stub model call failed")
+    return {**_summarize("generate_summary", latencies, model_ms), "cold_ms": round(cold_ms, 3)}
+
+
+async def _time_stream(rows: list[Series], iterations: int, latency_ms: float) -> dict[str, Any]:
+    first_token: list[float] = []
+    totals: list[float] = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        seen_token = False
+        async for item in ai.stream_summary(rows):
+            if not seen_token and not isinstance(item, ai.SummaryResult):
+                first_token.append((time.perf_counter() - started) * 1000)
+                seen_token = True
+        totals.append((time.perf_counter() - started) * 1000)
+    row = _summarize("stream_summary", totals)
+    if first_token:
+        ttft = statistics.fmean(first_token)
+        row["ttft_ms"] = round(ttft, 3)
+        row["ttft_overhead_ms"] = round(ttft - latency_ms, 3)
+    return row
+
+
+async def _time_route(
+    rows: int, requests: int, concurrency: int, seed: int, model_ms: float
+) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        app, engine = setup_in_process(
+            rows, seed, Path(tmp_dir) / "bench.db", BENCH_USERNAME, BENCH_PASSWORD
+        )
+        try:
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=120
+            ) as client:
+                login = await client.post(
+                    "/auth/login", json={"username": BENCH_USERNAME, "password": BENCH_PASSWORD}
+                )
+                login.raise_for_status()
+                headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+                async def _summary(client: httpx.AsyncClient, _: int) -> httpx.Response:
+                    return await client.post("/ai/summary", headers=headers)
+
+                row = await measure(client, "route", _summary, requests, concurrency)
+        finally:
+            app.dependency_overrides.clear()
+            engine.dispose()
+    row["model_ms"] = round(model_ms, 3)
+    row["p50_overhead_ms"] = round(row["p50_ms"] - model_ms, 3)
+    row["gate"] = ai.summary_gate.stats()
+    return row
+
+
+async def run_ai_latency(
+    rows: int = 50,
+    iterations: int = 5,
+    requests: int = 20,
+    concurrency: int = 4,
+    latency_ms: float = 200,
+    tokens_per_second: float = 200,
+    seed: int = 42,
+) -> dict[str, Any]:
+    """Run every phase against a fresh stub and return the JSON-ready report."""
+    series = [
+        Series(id=idx, **row) for idx, row in enumerate(synthetic_series(rows, seed), start=1)
+    ]
+    prompt = ai.build_prompt(series)
+    model_ms = model_time_ms(rows, latency_ms, tokens_per_second)
+    cpu_iterations = max(iterations, 100)
+    results = [
+        _time_cpu("prompt_build", lambda: ai.build_prompt(series), cpu_iterations),
+        _time_cpu("parse", lambda: ai.parse_summary(DEFAULT_REPLY), cpu_iterations),
+    ]
+
+    port = free_port()
+    with run_stub_in_thread(port, latency_ms=latency_ms, tokens_per_second=tokens_per_second):
+        with _agent_pointed_at(f"http://127.0.0.1:{port}/v1"), _cache_disabled():
+            try:
+                results.append(await _time_generate(series, iterations, model_ms))
+                results.append(await _time_stream(series, iterations, latency_ms))
+                results.append(await _time_route(rows, requests, concurrency, seed, model_ms))
+            finally:
+                await ai.close_agent()
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "rows": rows,
+            "prompt_chars": len(prompt),
+            "stub_latency_ms": latency_ms,
+            "stub_tokens_per_second": tokens_per_second,
+            "requests": requests,
+            "concurrency": concurrency,
+        },
+        "results": results,
+    }
+
+
+def main(
+    rows: int = typer.Option(50, min=1, help="Series rows in the summarized catalog."),
+    iterations: int = typer.Option(5, min=1, help="Sequential calls per end-to-end phase."),
+    requests: int = typer.Option(20, min=1, help="Route requests to send."),
+    concurrency: int = typer.Option(4, min=1, help="Concurrent route requests."),
+    latency_ms: float = typer.Option(200, help="Stub time to first token."),
+    tokens_per_second: float = typer.Option(200, min=1, help="Stub token rate."),
+    seed: int = typer.Option(42, help="Random seed for the synthetic catalog."),
+    output: Path | None = typer.Option(None, help="Write the JSON report to this file."),
+) -> None:
+    """Benchmark AI summary latency against a local model stub and print a JSON report."""
+    report = asyncio.run(
+        run_ai_latency(
+            rows=rows,
+            iterations=iterations,
+            requests=requests,
+            concurrency=concurrency,
+            latency_ms=latency_ms,
+            tokens_per_second=tokens_per_second,
+            seed=seed,
+        )
+    )
+    rendered = json.dumps(report, indent=2)
+    if output:
+        output.write_text(rendered + "\n")
+    typer.echo(rendered)
+
+
+if __name__ == "__main__":
+    typer.run(main)
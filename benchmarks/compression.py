@@ -0,0 +1,218 @@
+"""CPU/bandwidth trade-off of HTTP response compression.
+
+Fetches real response bodies from the in-process app (uncompressed), then for every
+available encoding and a few levels reports the compressed size, the time to
+compress and decompress, and the resulting transfer time at the given link speeds
+(compress + wire + decompress, against sending the body as is).
+
+The `route` results time `GET /series?limit=1000` through the compression
+middleware for each encoding, with the bytes that went over the wire.
+"""
+
+import asyncio
+import json
+import statistics
+import tempfile
+import time
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import httpx
+import typer
+
+from app.compression import brotli, http_encodings, stream_compressor, zstandard
+from benchmarks.load import BENCH_PASSWORD, BENCH_USERNAME, git_commit, measure, setup_in_process
+
+LEVELS = {"gzip": (1, 6, 9), "br": (1, 4, 11), "zstd": (1, 3, 19)}
+REPORT_BODY = "\n".join(
+    f"Total series: {1000 + idx}, average rating {idx % 10}.{idx % 7}" for idx in range(200)
+)
+
+
+def _decompress(data: bytes, encoding: str) -> bytes:
+    if encoding == "gzip":
+        return zlib.decompress(data, 16 + zlib.MAX_WBITS)
+    if encoding == "br":
+        return brotli.decompress(data)
+    return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+
+
+def _time_ms(fn, iterations: int) -> tuple[float, Any]:
+    timings, result = [], None
+    for _ in range(iterations):
+        started = time.perf_counter()
+        result = fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), result
+
+
+def _wire_ms(size: int, mbps: float) -> float:
+    return size * 8 / (mbps * 1000)
+
+
+def codec_rows(
+    name: str, body: bytes, encodings: list[str], iterations: int, bandwidths: list[float]
+) -> list[dict[str, Any]]:
+    """Size and timing of every encoding/level for one payload, with identity first."""
+    rows = [
+        {
+            "payload": name,
+            "encoding": "identity",
+            "level": None,
+            "bytes": len(body),
+            "ratio": 1.0,
+            "compress_ms": 0.0,
+            "decompress_ms": 0.0,
+            **{
+                f"transfer_ms_{mbps:g}mbps": round(_wire_ms(len(body), mbps), 3)
+                for mbps in bandwidths
+            },
+        }
+    ]
+    for encoding in encodings:
+        for level in LEVELS[encoding]:
+
+            def _compress() -> bytes:
+                compressor = stream_compressor(encoding, level)
+                return compressor.compress(body, flush=False) + compressor.finish()
+
+            compress_ms, packed = _time_ms(_compress, iterations)
+            decompress_ms, restored = _time_ms(lambda: _decompress(packed, encoding), iterations)
+            if restored != body:
+                raise RuntimeError(f"{encoding} level {level} did not round-trip")
+            cpu_ms = compress_ms + decompress_ms
+            rows.append(
+                {
+                    "payload": name,
+                    "encoding": encoding,
+                    "level": level,
+                    "bytes": len(packed),
+                    "ratio": round(len(body) / len(packed), 2),
+                    "compress_ms": round(compress_ms, 3),
+                    "decompress_ms": round(decompress_ms, 3),
+                    **{
+                        f"transfer_ms_{mbps:g}mbps": round(cpu_ms + _wire_ms(len(packed), mbps), 3)
+                        for mbps in bandwidths
+                    },
+                }
+            )
+    return rows
+
+
+async def _payloads(client: httpx.AsyncClient, headers: dict[str, str]) -> dict[str, bytes]:
+    identity = {**headers, "Accept-Encoding": "identity"}
+    for idx in range(50):
+        created = await client.post(
+            "/reports",
+            json={"title": f"Digest {idx}", "content": REPORT_BODY},
+            headers=headers,
+        )
+        created.raise_for_status()
+    requests = {
+        "series_list": ("/series", {"limit": 1000}),
+        "series_id_title": ("/series", {"limit": 1000, "fields": "id,title"}),
+        "reports": ("/reports", {"limit": 50}),
+        "export_arrow": ("/series/export", {"format": "arrow"}),
+    }
+    bodies = {}
+    for name, (path, params) in requests.items():
+        response = await client.get(path, params=params, headers=identity)
+        response.raise_for_status()
+        bodies[name] = response.content
+    return bodies
+
+
+async def run_compression(
+    catalog_size: int = 1000,
+    iterations: int = 5,
+    requests: int = 50,
+    concurrency: int = 4,
+    bandwidths: tuple[float, ...] = (10, 100),
+    seed: int = 42,
+) -> dict[str, Any]:
+    """Collect payloads, benchmark each codec on them and time the route end to end."""
+    encodings = http_encodings(list(LEVELS))
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        app, engine = setup_in_process(
+            catalog_size, seed, Path(tmp_dir) / "bench.db", BENCH_USERNAME, BENCH_PASSWORD
+        )
+        try:
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=60
+            ) as client:
+                login = await client.post(
+                    "/auth/login", json={"username": BENCH_USERNAME, "password": BENCH_PASSWORD}
+                )
+                login.raise_for_status()
+                headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+                payloads = await _payloads(client, headers)
+                route = []
+                for encoding in ["identity", *encodings]:
+                    wire_bytes = 0
+
+                    async def _list(client: httpx.AsyncClient, _: int) -> httpx.Response:
+                        nonlocal wire_bytes
+                        response = await client.get(
+                            "/series", params={"limit": 1000}, headers={"Accept-Encoding": encoding}
+                        )
+                        wire_bytes = response.num_bytes_downloaded
+                        return response
+
+                    row = await measure(client, f"route_{encoding}", _list, requests, concurrency)
+                    route.append({**row, "wire_bytes": wire_bytes})
+        finally:
+            app.dependency_overrides.clear()
+            engine.dispose()
+
+    codecs = [
+        row
+        for name, body in payloads.items()
+        for row in codec_rows(name, body, encodings, iterations, list(bandwidths))
+    ]
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "catalog_size": catalog_size,
+            "encodings": encodings,
+            "bandwidths_mbps": list(bandwidths),
+            "requests": requests,
+            "concurrency": concurrency,
+        },
+        "codecs": codecs,
+        "route": route,
+    }
+
+
+def main(
+    catalog_size: int = typer.Option(1000, min=1, help="Synthetic series rows to seed."),
+    iterations: int = typer.Option(5, min=1, help="Timed runs per codec and level (median)."),
+    requests: int = typer.Option(50, min=1, help="Route requests per encoding."),
+    concurrency: int = typer.Option(4, min=1, help="Concurrent route requests."),
+    bandwidth: list[float] = typer.Option(
+        [10, 100], "--bandwidth", "-b", help="Link speed in Mbit/s (repeatable)."
+    ),
+    seed: int = typer.Option(42, help="Random seed for the synthetic catalog."),
+    output: Path | None = typer.Option(None, help="Write the JSON report to this file."),
+) -> None:
+    """Benchmark response compression and print a JSON report."""
+    report = asyncio.run(
+        run_compression(
+            catalog_size=catalog_size,
+            iterations=iterations,
+            requests=requests,
+            concurrency=concurrency,
+            bandwidths=tuple(bandwidth),
+            seed=seed,
+        )
+    )
+    rendered = json.dumps(report, indent=2)
+    if output:
+        output.write_text(rendered + "\n")
+    typer.echo(rendered)
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,66 @@
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+import pytest
+from sqlmodel import SQLModel, create_engine
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.models import ReportDB, SeriesDB  # noqa: E402
+from app.synthetic import synthetic_series  # noqa: E402
+
+CATALOG_SEED = 7
+INSERT_CHUNK = 10_000
+
+
+def _bench_sizes() -> list[int]:
+    raw = os.getenv("BENCH_SIZES", "10000,100000,1000000")
+    return [int(value) for value in raw.split(",") if value.strip()]
+
+
+def _chunks(rows: Iterable[dict[str, Any]], size: int) -> Iterator[list[dict[str, Any]]]:
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _synthetic_reports(count: int) -> Iterator[dict[str, Any]]:
+    started = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    for idx in range(count):
+        yield {
+            "title": "Weekly TV Digest",
+            "content": f"Generated at: {started + timedelta(minutes=5 * idx)}\nTotal series: {idx}",
+            "created_at": started + timedelta(minutes=5 * idx),
+            "created_by": "worker",
+        }
+
+
+def pytest_generate_tests(metafunc):
+    if "catalog_size" in metafunc.fixturenames:
+        metafunc.parametrize(
+            "catalog_size",
+            _bench_sizes(),
+            ids=lambda size: f"{size}rows",
+            scope="session",
+        )
+
+
+@pytest.fixture(scope="session")
+def catalog_engine(catalog_size, tmp_path_factory):
+    """SQLite database file with `catalog_size` series and report rows."""
+    path = tmp_path_factory.mktemp("catalog") / f"catalog-{catalog_size}.db"
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        for chunk in _chunks(synthetic_series(catalog_size, CATALOG_SEED), INSERT_CHUNK):
+            connection.execute(SeriesDB.__table__.insert(), chunk)
+        for chunk in _chunks(_synthetic_reports(catalog_size), INSERT_CHUNK):
+            connection.execute(ReportDB.__table__.insert(), chunk)
+    yield engine
+    engine.dispose()
@@ -0,0 +1,279 @@
+"""HTTP load benchmark for the API.
+
+Runs each scenario with a fixed number of requests under a concurrency limit and
+prints throughput plus p50/p95/p99 latency as JSON, so runs can be diffed across
+commits. By default the app is driven in-process over ASGITransport against a
+temporary SQLite catalog; pass --base-url to hit a running server instead.
+"""
+
+import asyncio
+import json
+import random
+import statistics
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+import httpx
+import typer
+
+from app.synthetic import TITLE_NOUNS, synthetic_series
+
+SCENARIOS = ("list", "search", "get", "create", "patch", "refresh", "login", "queue")
+BENCH_USERNAME = "bench-admin"
+BENCH_PASSWORD = "bench-pass"
+
+Operation = Callable[[httpx.AsyncClient, int], Awaitable[httpx.Response]]
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(int(round(pct / 100 * len(sorted_values))) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+async def measure(
+    client: httpx.AsyncClient,
+    name: str,
+    operation: Operation,
+    requests: int,
+    concurrency: int,
+) -> dict[str, Any]:
+    """Run one scenario and summarize its latency distribution."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    errors = 0
+
+    async def _one(idx: int) -> None:
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                response = await operation(client, idx)
+                if response.status_code >= 400:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*[_one(idx) for idx in range(requests)])
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "scenario": name,
+        "requests": requests,
+        "concurrency": concurrency,
+        "errors": errors,
+        "throughput_rps": round(requests / elapsed, 2) if elapsed else 0.0,
+        "mean_ms": round(statistics.fmean(latencies), 3) if latencies else 0.0,
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+    }
+
+
+def _operations(
+    headers: dict[str, str],
+    credentials: dict[str, str],
+    catalog_size: int,
+    seed: int,
+) -> dict[str, Operation]:
+    """Build one request factory per scenario."""
+    rng = random.Random(seed)
+    run_tag = f"{int(time.time())}-{seed}"
+
+    def _random_id() -> int:
+        return rng.randint(1, max(catalog_size, 1))
+
+    async def _list(client, _):
+        return await client.get("/series", params={"limit": 100})
+
+    async def _search(client, _):
+        return await client.get("/series", params={"query": rng.choice(TITLE_NOUNS)})
+
+    async def _get(client, _):
+        return await client.get(f"/series/{_random_id()}")
+
+    async def _create(client, idx):
+        payload = {
+            "title": f"Bench Show {run_tag}-{idx}",
+            "creator": "Bench Creator",
+            "year": rng.randint(1960, 2025),
+            "rating": 7.0,
+        }
+        return await client.post("/series", json=payload)
+
+    async def _patch(client, _):
+        return await client.patch(f"/series/{_random_id()}", json={"rating": rng.randint(0, 10)})
+
+    async def _refresh(client, _):
+        return await client.post(f"/series/{_random_id()}/refresh")
+
+    async def _login(client, _):
+        return await client.post("/auth/login", json=credentials)
+
+    async def _queue(client, _):
+        return await client.post("/reports/queue", headers=headers)
+
+    return {
+        "list": _list,
+        "search": _search,
+        "get": _get,
+        "create": _create,
+        "patch": _patch,
+        "refresh": _refresh,
+        "login": _login,
+        "queue": _queue,
+    }
+
+
+def setup_in_process(catalog_size: int, seed: int, db_path: Path, username: str, password: str):
+    """Point the app at a seeded temporary database and an in-memory Redis."""
+    import fakeredis.aioredis
+    from sqlmodel import Session, SQLModel, create_engine
+
+    from app.db import get_session
+    from app.main import app
+    from app.models import SeriesDB, UserDB
+    from app.queue import get_redis
+    from app.security import hash_password
+
+    engine = create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False})
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(SeriesDB(**row) for row in synthetic_series(catalog_size, seed))
+        session.add(
+            UserDB(
+                username=username,
+                hashed_password=hash_password(password),
+                role="admin",
+            )
+        )
+        session.commit()
+
+    fake_redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+    def get_session_override():
+        with Session(engine) as session:
+            yield session
+
+    async def get_redis_override():
+        yield fake_redis
+
+    app.dependency_overrides[get_session] = get_session_override
+    app.dependency_overrides[get_redis] = get_redis_override
+    return app, engine
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run_load(
+    scenarios: list[str],
+    requests: int = 200,
+    concurrency: int = 10,
+    catalog_size: int = 1000,
+    seed: int = 42,
+    base_url: str | None = None,
+    username: str = BENCH_USERNAME,
+    password: str = BENCH_PASSWORD,
+) -> dict[str, Any]:
+    """Run the selected scenarios and return the JSON-ready report."""
+    unknown = sorted(set(scenarios) - set(SCENARIOS))
+    if unknown:
+        raise ValueError(f"Unknown scenarios: {', '.join(unknown)}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        app = engine = None
+        if base_url:
+            client = httpx.AsyncClient(base_url=base_url, timeout=30)
+        else:
+            app, engine = setup_in_process(
+                catalog_size, seed, Path(tmp_dir) / "bench.db", username, password
+            )
+            client = httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app),
+                base_url="http://bench",
+                timeout=30,
+            )
+        try:
+            async with client:
+                credentials = {"username": username, "password": password}
+                login = await client.post("/auth/login", json=credentials)
+                login.raise_for_status()
+                headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+                operations = _operations(headers, credentials, catalog_size, seed)
+                results = [
+                    await measure(client, name, operations[name], requests, concurrency)
+                    for name in scenarios
+                ]
+        finally:
+            if app is not None:
+                app.dependency_overrides.clear()
+                engine.dispose()
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "target": base_url or "asgi",
+            "catalog_size": catalog_size,
+            "requests_per_scenario": requests,
+            "concurrency": concurrency,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def main(
+    scenario: list[str] = typer.Option(
+        list(SCENARIOS), "--scenario", "-s", help="Scenario to run (repeatable)."
+    ),
+    requests: int = typer.Option(200, min=1, help="Requests per scenario."),
+    concurrency: int = typer.Option(10, min=1, help="Concurrent in-flight requests."),
+    catalog_size: int = typer.Option(1000, min=1, help="Synthetic series rows to seed."),
+    seed: int = typer.Option(42, help="Random seed for the catalog and request mix."),
+    base_url: str | None = typer.Option(
+        None, help="Benchmark a running server instead of the in-process app."
+    ),
+    username: str = typer.Option(BENCH_USERNAME, help="Admin user to log in as."),
+    password: str = typer.Option(BENCH_PASSWORD, help="Password for the admin user."),
+    output: Path | None = typer.Option(None, help="Write the JSON report to this file."),
+) -> None:
+    """Run the HTTP load benchmark and print a JSON report."""
+    report = asyncio.run(
+        run_load(
+            scenario,
+            requests=requests,
+            concurrency=concurrency,
+            catalog_size=catalog_size,
+            seed=seed,
+            base_url=base_url,
+            username=username,
+            password=password,
+        )
+    )
+    rendered = json.dumps(report, indent=2)
+    if output:
+        output.write_text(rendered + "\n")
+    typer.echo(rendered)
+
+
+if __name__ == "__main__":
+    typer.run(main)
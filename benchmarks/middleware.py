@@ -0,0 +1,164 @@
+"""Per-request cost of the API's header middleware.
+
+Builds the same small app three ways and calls it directly as an ASGI callable (no
+HTTP client or socket in the loop), so the numbers are the middleware's own cost:
+
+- `none`: no middleware.
+- `base_http`: trace ID, rate-limit and query-timing headers as `@app.middleware("http")`
+  functions, the way `app/main.py` used to add them.
+- `asgi`: the pure ASGI classes from `app.middleware` that replaced them.
+
+`overhead_us` is the stack's mean minus the `none` mean for the same endpoint.
+"""
+
+import asyncio
+import json
+import statistics
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import typer
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+
+from app.middleware import QueryTimingMiddleware, RateLimitHeadersMiddleware, TraceIdMiddleware
+from app.telemetry import track_queries
+from benchmarks.load import git_commit, percentile
+
+STACKS = ("none", "base_http", "asgi")
+ENDPOINTS = ("/json", "/stream")
+
+
+def _add_base_http(app: FastAPI) -> None:
+    @app.middleware("http")
+    async def query_timing_headers(request, call_next):
+        with track_queries(getattr(request.state, "trace_id", None)) as stats:
+            response = await call_next(request)
+        response.headers["X-DB-Query-Count"] = str(stats.count)
+        response.headers["Server-Timing"] = stats.server_timing()
+        return response
+
+    @app.middleware("http")
+    async def trace_id_header(request, call_next):
+        trace_id = request.headers.get("X-Trace-Id") or str(uuid.uuid4())
+        request.state.trace_id = trace_id
+        response = await call_next(request)
+        response.headers["X-Trace-Id"] = trace_id
+        return response
+
+    @app.middleware("http")
+    async def rate_limit_headers(request, call_next):
+        response = await call_next(request)
+        response.headers["X-RateLimit-Limit"] = "100"
+        response.headers["X-RateLimit-Remaining"] = "99"
+        response.headers["X-RateLimit-Reset"] = str(int(time.time()) + 60)
+        return response
+
+
+def build_app(stack: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/json")
+    async def json_endpoint() -> dict[str, Any]:
+        return {"id": 1, "title": "Andor", "creator": "Tony Gilroy", "year": 2022}
+
+    @app.get("/stream")
+    async def stream_endpoint() -> StreamingResponse:
+        return StreamingResponse(iter([b"chunk\n"] * 10), media_type="text/plain")
+
+    if stack == "base_http":
+        _add_base_http(app)
+    elif stack == "asgi":
+        app.add_middleware(QueryTimingMiddleware)
+        app.add_middleware(TraceIdMiddleware)
+        app.add_middleware(RateLimitHeadersMiddleware, limit=100, window_seconds=60)
+    return app
+
+
+async def _request(app: FastAPI, path: str) -> None:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "server": ("bench", 80),
+        "client": ("127.0.0.1", 12345),
+    }
+    done = False
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict) -> None:
+        nonlocal done
+        if message["type"] == "http.response.body" and not message.get("more_body", False):
+            done = True
+
+    await app(scope, receive, send)
+    if not done:
+        raise RuntimeError(f"{path} did not complete")
+
+
+async def run_middleware_overhead(iterations: int = 2000, warmup: int = 200) -> dict[str, Any]:
+    """Time every stack on every endpoint and return the JSON-ready report."""
+    results = []
+    for endpoint in ENDPOINTS:
+        baseline = None
+        for stack in STACKS:
+            app = build_app(stack)
+            for _ in range(warmup):
+                await _request(app, endpoint)
+            latencies = []
+            for _ in range(iterations):
+                started = time.perf_counter()
+                await _request(app, endpoint)
+                latencies.append((time.perf_counter() - started) * 1e6)
+            latencies.sort()
+            mean_us = statistics.fmean(latencies)
+            baseline = mean_us if baseline is None else baseline
+            results.append(
+                {
+                    "stack": stack,
+                    "endpoint": endpoint,
+                    "iterations": iterations,
+                    "mean_us": round(mean_us, 1),
+                    "p50_us": round(percentile(latencies, 50), 1),
+                    "p99_us": round(percentile(latencies, 99), 1),
+                    "overhead_us": round(mean_us - baseline, 1),
+                }
+            )
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "iterations": iterations,
+            "warmup": warmup,
+        },
+        "results": results,
+    }
+
+
+def main(
+    iterations: int = typer.Option(2000, min=1, help="Timed requests per stack and endpoint."),
+    warmup: int = typer.Option(200, min=0, help="Untimed requests first."),
+    output: Path | None = typer.Option(None, help="Write the JSON report to this file."),
+) -> None:
+    """Benchmark middleware overhead per request and print a JSON report."""
+    report = asyncio.run(run_middleware_overhead(iterations=iterations, warmup=warmup))
+    rendered = json.dumps(report, indent=2)
+    if output:
+        output.write_text(rendered + "\n")
+    typer.echo(rendered)
+
+
+if __name__ == "__main__":
+    typer.run(main)
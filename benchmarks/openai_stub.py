@@ -0,0 +1,153 @@
+"""Minimal OpenAI chat-completions stub for offline AI benchmarks.
+
+Answers `POST /v1/chat/completions` (streaming and non-streaming) with a canned
+summary after a configurable time-to-first-token, then emits tokens at a fixed rate.
+That makes model time predictable, so benchmarks can isolate the app's own overhead.
+
+    uv run python -m benchmarks.openai_stub --port 11500 --latency-ms 800
+    OLLAMA_BASE_URL=http://127.0.0.1:11500/v1 uv run uvicorn app.main:app
+"""
+
+import asyncio
+import json
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, AsyncIterator, Iterator
+
+import typer
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+
+DEFAULT_REPLY = (
+    "Summary: A varied catalog anchored by acclaimed prestige dramas and a few newer "
+    "streaming hits.\n"
+    "Highlights:\n"
+    "- Strong average ratings across the board\n"
+    "- Several recent releases worth catching up on\n"
+    "- A handful of creators appear more than once"
+)
+STARTUP_TIMEOUT_SECONDS = 5.0
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into word-ish tokens that concatenate back to the original."""
+    words = text.split(" ")
+    return [word + " " for word in words[:-1]] + [words[-1]]
+
+
+def create_stub_app(
+    latency_ms: float = 500,
+    tokens_per_second: float = 50,
+    reply: str = DEFAULT_REPLY,
+) -> FastAPI:
+    app = FastAPI(title="OpenAI stub")
+    app.state.requests = 0
+    token_delay = 1 / tokens_per_second if tokens_per_second > 0 else 0
+
+    def _envelope(model: str, **fields: Any) -> dict[str, Any]:
+        return {"id": "chatcmpl-stub", "created": int(time.time()), "model": model, **fields}
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        app.state.requests += 1
+        model = body.get("model", "stub")
+        tokens = tokenize(reply)
+        await asyncio.sleep(latency_ms / 1000)
+
+        if body.get("stream"):
+
+            async def _chunks() -> AsyncIterator[str]:
+                for idx, token in enumerate(tokens):
+                    delta = (
+                        {"role": "assistant", "content": token} if idx == 0 else {"content": token}
+                    )
+                    chunk = _envelope(
+                        model,
+                        object="chat.completion.chunk",
+                        choices=[{"index": 0, "delta": delta, "finish_reason": None}],
+                    )
+                    yield f"data: {json.dumps(chunk)}\n\n"
+                    await asyncio.sleep(token_delay)
+                final = _envelope(
+                    model,
+                    object="chat.completion.chunk",
+                    choices=[{"index": 0, "delta": {}, "finish_reason": "stop"}],
+                )
+                yield f"data: {json.dumps(final)}\n\ndata: [DONE]\n\n"
+
+            return StreamingResponse(_chunks(), media_type="text/event-stream")
+
+        await asyncio.sleep(token_delay * len(tokens))
+        prompt_tokens = sum(
+            len(str(message.get("content", "")).split()) for message in body["messages"]
+        )
+        return _envelope(
+            model,
+            object="chat.completion",
+            choices=[
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": reply},
+                    "finish_reason": "stop",
+                }
+            ],
+            usage={
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": len(tokens),
+                "total_tokens": prompt_tokens + len(tokens),
+            },
+        )
+
+    return app
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def run_stub_in_thread(
+    port: int,
+    latency_ms: float = 500,
+    tokens_per_second: float = 50,
+) -> Iterator[FastAPI]:
+    """Serve the stub on 127.0.0.1:`port` from a background thread.
+
+    Raises RuntimeError if the server has not started within `STARTUP_TIMEOUT_SECONDS`,
+    for example because the port is taken.
+    """
+    app = create_stub_app(latency_ms=latency_ms, tokens_per_second=tokens_per_second)
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + STARTUP_TIMEOUT_SECONDS
+    while not server.started:
+        if not thread.is_alive() or time.monotonic() > deadline:
+            server.should_exit = True
+            raise RuntimeError(f"Model stub did not start on 127.0.0.1:{port}")
+        time.sleep(0.01)
+    try:
+        yield app
+    finally:
+        server.should_exit = True
+        thread.join(timeout=5)
+
+
+def main(
+    port: int = typer.Option(11500, help="Port to listen on."),
+    latency_ms: float = typer.Option(500, help="Delay before the first token."),
+    tokens_per_second: float = typer.Option(50, help="Token emission rate."),
+) -> None:
+    """Run the OpenAI-compatible stub server."""
+    app = create_stub_app(latency_ms=latency_ms, tokens_per_second=tokens_per_second)
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="info")
+
+
+if __name__ == "__main__":
+    typer.run(main)
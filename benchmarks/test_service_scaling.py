@@ -0,0 +1,116 @@
+"""Service-layer scaling benchmarks.
+
+Run with `uv run pytest benchmarks/ --benchmark-json=scaling.json`. Sizes default to
+10k/100k/1M rows and can be narrowed with BENCH_SIZES=10000,100000. Each benchmark
+stores the SQLite EXPLAIN QUERY PLAN of the statements it issues in `extra_info`, so
+full table scans show up next to the timings in the JSON report.
+"""
+
+from itertools import count
+from typing import Any, Callable
+
+from sqlalchemy import event
+from sqlmodel import Session
+
+from app.models import SeriesCreate
+from app.services import reports as report_service
+from app.services import series as series_service
+from app.services.helpers import find_duplicate_series
+
+_unique = count()
+
+
+def _record_query_plans(benchmark, engine, call: Callable[[], Any]) -> None:
+    """Run `call` once, capture its SELECTs and attach their query plans to the benchmark."""
+    statements: list[tuple[str, Any]] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        call()
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+    plans = []
+    with engine.connect() as connection:
+        for statement, parameters in statements:
+            if not statement.lstrip().upper().startswith("SELECT"):
+                continue
+            rows = connection.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", parameters
+            ).fetchall()
+            plans.append({"sql": " ".join(statement.split()), "plan": [row[-1] for row in rows]})
+
+    benchmark.extra_info["query_plan"] = plans
+    benchmark.extra_info["full_scans"] = [
+        detail
+        for plan in plans
+        for detail in plan["plan"]
+        if detail.startswith("SCAN ") and " USING " not in detail
+    ]
+
+
+def test_list_series(benchmark, catalog_engine):
+    with Session(catalog_engine) as session:
+        _record_query_plans(benchmark, catalog_engine, lambda: series_service.list_series(session))
+        rows = benchmark(series_service.list_series, session)
+    assert len(rows) == 100
+
+
+def test_list_series_with_query(benchmark, catalog_engine):
+    with Session(catalog_engine) as session:
+        _record_query_plans(
+            benchmark,
+            catalog_engine,
+            lambda: series_service.list_series(session, query="harbor"),
+        )
+        benchmark(series_service.list_series, session, query="harbor")
+
+
+def test_find_duplicate_series_miss(benchmark, catalog_engine):
+    payload = SeriesCreate(title="Not In Catalog", creator="Nobody", year=1999)
+    with Session(catalog_engine) as session:
+        _record_query_plans(
+            benchmark, catalog_engine, lambda: find_duplicate_series(payload, session)
+        )
+        assert benchmark(find_duplicate_series, payload, session) is None
+
+
+def test_create_series(benchmark, catalog_engine):
+    def _payload() -> SeriesCreate:
+        return SeriesCreate(
+            title=f"Scaling Bench {next(_unique)}",
+            creator="Bench Creator",
+            year=2024,
+            rating=7.5,
+        )
+
+    with Session(catalog_engine) as session:
+        _record_query_plans(
+            benchmark,
+            catalog_engine,
+            lambda: series_service.create_series(_payload(), session),
+        )
+        benchmark.pedantic(
+            lambda: series_service.create_series(_payload(), session),
+            rounds=50,
+            iterations=1,
+        )
+
+
+def test_list_reports(benchmark, catalog_engine):
+    with Session(catalog_engine) as session:
+        _record_query_plans(benchmark, catalog_engine, lambda: report_service.list_reports(session))
+        rows, _ = benchmark(report_service.list_reports, session)
+    assert len(rows) == 50
+
+
+def test_list_reports_summary_deep_page(benchmark, catalog_engine):
+    with Session(catalog_engine) as session:
+        _, cursor = report_service.list_reports(session, limit=500, summary=True)
+        page = lambda: report_service.list_reports(session, cursor=cursor, summary=True)  # noqa: E731
+        _record_query_plans(benchmark, catalog_engine, page)
+        rows, _ = benchmark(page)
+    assert len(rows) == 50
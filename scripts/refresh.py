@@ -7,18 +7,7 @@ import httpx
 import redis.asyncio as redis
 
 from app.config import API_BASE_URL, REDIS_URL
-
-
-async def _with_retries(func, retries: int) -> Any:
-    delay = 0.4
-    for attempt in range(retries + 1):
-        try:
-            return await func()
-        except Exception:
-            if attempt >= retries:
-                raise
-            await asyncio.sleep(delay)
-            delay *= 2
+from app.http_client import IDEMPOTENT_METHODS, create_async_client
 
 
 async def refresh_series(
@@ -26,10 +15,10 @@ async def refresh_series(
     redis_client: redis.Redis,
     http_client: httpx.AsyncClient,
     concurrency: int = 5,
-    retries: int = 2,
     trace_stream: str = "tvdb:refresh:trace",
 ) -> dict[str, int]:
-    response = await http_client.get(f"{api_base}/series", timeout=10)
+    """Refresh every series at most once a day; retries are up to `http_client`'s transport."""
+    response = await http_client.get(f"{api_base}/series")
     response.raise_for_status()
     series_list = response.json()
 
@@ -46,12 +35,9 @@ async def refresh_series(
             return
         stats["attempted"] += 1
 
-        async def _do_request():
-            return await http_client.post(f"{api_base}/series/{series_id}/refresh", timeout=10)
-
         try:
             async with semaphore:
-                response = await _with_retries(_do_request, retries)
+                response = await http_client.post(f"{api_base}/series/{series_id}/refresh")
             response.raise_for_status()
             stats["refreshed"] += 1
             await redis_client.xadd(
@@ -83,14 +69,11 @@ async def main() -> None:
     retries = int(os.getenv("REFRESH_RETRIES", "2"))
 
     redis_client = redis.Redis.from_url(REDIS_URL, decode_responses=True)
-    async with httpx.AsyncClient() as http_client:
-        stats = await refresh_series(
-            api_base,
-            redis_client,
-            http_client,
-            concurrency=concurrency,
-            retries=retries,
-        )
+    # A refresh only stamps today's date, so repeating the POST is safe to retry.
+    async with create_async_client(
+        retries=retries, retry_methods=IDEMPOTENT_METHODS | {"POST"}
+    ) as http_client:
+        stats = await refresh_series(api_base, redis_client, http_client, concurrency=concurrency)
     await redis_client.close()
     print(f"Refresh complete: {stats}")
 
@@ -6,9 +6,39 @@ from typing import Any
 
 import requests
 import streamlit as st
+from requests.adapters import HTTPAdapter
+from st_keyup import st_keyup
 
 API_BASE_DEFAULT = os.getenv("TV_API_BASE", "http://localhost:8000").rstrip("/")
 REQUEST_TIMEOUT = None
+READ_CACHE_TTL_SECONDS = int(os.getenv("TV_UI_CACHE_TTL", "30"))
+HTTP_POOL_SIZE = 10
+PAGE_SIZES = (25, 50, 100, 250)
+SEARCH_DEBOUNCE_MS = 300
+PICKER_LIMIT = 50
+
+
+class ApiError(Exception):
+    """Non-success response from a cached read; raised so the failure is not cached."""
+
+    def __init__(self, response: requests.Response) -> None:
+        super().__init__(f"API returned {response.status_code}: {response.text}")
+        self.status_code = response.status_code
+        self.text = response.text
+
+
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """Shared keep-alive session so reruns reuse pooled connections to the API.
+
+    Auth headers are passed per request, never stored on the session, because every
+    browser session of this Streamlit server shares it.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
 
 
 def inject_imdb_theme() -> None:
@@ -97,30 +127,71 @@ def _clean_base_url(raw_url: str) -> str:
     return raw_url.strip().rstrip("/") or API_BASE_DEFAULT
 
 
-def fetch_series(api_base: str, query: str | None = None) -> list[dict[str, Any]]:
-    """Fetch the list of series from the API."""
+@st.cache_data(ttl=READ_CACHE_TTL_SECONDS, show_spinner=False)
+def _cached_series(
+    api_base: str, query: str | None, offset: int, limit: int
+) -> list[dict[str, Any]]:
+    params: dict[str, Any] = {"offset": offset, "limit": limit}
+    if query:
+        params["query"] = query
+    response = get_http_session().get(
+        f"{api_base}/series", params=params, timeout=REQUEST_TIMEOUT
+    )
+    if response.status_code != 200:
+        raise ApiError(response)
+    payload = response.json()
+    return payload if isinstance(payload, list) else []
+
+
+@st.cache_data(ttl=READ_CACHE_TTL_SECONDS, show_spinner=False)
+def _cached_stats(api_base: str) -> dict[str, Any]:
+    response = get_http_session().get(f"{api_base}/series/stats", timeout=REQUEST_TIMEOUT)
+    if response.status_code != 200:
+        raise ApiError(response)
+    return response.json()
+
+
+def invalidate_reads() -> None:
+    """Drop cached reads after a write so the next rerun shows it."""
+    _cached_series.clear()
+    _cached_stats.clear()
+
+
+def fetch_series_page(
+    api_base: str, query: str | None = None, offset: int = 0, limit: int = 50
+) -> tuple[list[dict[str, Any]], bool]:
+    """Fetch one page of series and whether another page follows.
+
+    One extra row is requested to detect the next page without a count query.
+    """
     try:
-        response = requests.get(
-            f"{api_base}/series",
-            params={"query": query} if query else None,
-            timeout=REQUEST_TIMEOUT,
-        )
+        rows = _cached_series(api_base, query, offset, limit + 1)
     except requests.RequestException as exc:
         st.error(f"Could not reach the API: {exc}")
-        return []
+        return [], False
+    except ApiError as exc:
+        st.error(str(exc))
+        return [], False
+    return rows[:limit], len(rows) > limit
 
-    if response.status_code != 200:
-        st.error(f"API returned {response.status_code}: {response.text}")
-        return []
 
-    payload = response.json()
-    return payload if isinstance(payload, list) else []
+def fetch_stats(api_base: str) -> dict[str, Any] | None:
+    """Fetch catalog-wide aggregates from the API."""
+    try:
+        return _cached_stats(api_base)
+    except requests.RequestException as exc:
+        st.error(f"Could not reach the API: {exc}")
+    except ApiError as exc:
+        st.error(f"Stats failed: {exc}")
+    return None
 
 
 def create_series(api_base: str, payload: dict[str, Any]) -> dict[str, Any] | None:
     """Create a new series via the API."""
     try:
-        response = requests.post(f"{api_base}/series", json=payload, timeout=REQUEST_TIMEOUT)
+        response = get_http_session().post(
+            f"{api_base}/series", json=payload, timeout=REQUEST_TIMEOUT
+        )
     except requests.RequestException as exc:
         st.error(f"Could not reach the API: {exc}")
         return None
@@ -129,13 +200,14 @@ def create_series(api_base: str, payload: dict[str, Any]) -> dict[str, Any] | No
         st.error(f"Create failed ({response.status_code}): {response.text}")
         return None
 
+    invalidate_reads()
     return response.json()
 
 
 def login(api_base: str, username: str, password: str) -> dict[str, Any] | None:
     """Request a JWT token from the API."""
     try:
-        response = requests.post(
+        response = get_http_session().post(
             f"{api_base}/auth/login",
             json={"username": username, "password": password},
             timeout=REQUEST_TIMEOUT,
@@ -154,7 +226,7 @@ def login(api_base: str, username: str, password: str) -> dict[str, Any] | None:
 def register(api_base: str, username: str, password: str, password_confirm: str) -> bool:
     """Register a new viewer account."""
     try:
-        response = requests.post(
+        response = get_http_session().post(
             f"{api_base}/auth/register",
             json={
                 "username": username,
@@ -193,7 +265,7 @@ def password_strength_issues(password: str) -> list[str]:
 def fetch_metrics(api_base: str, token: str) -> dict[str, Any] | None:
     """Fetch admin metrics from the API."""
     try:
-        response = requests.get(
+        response = get_http_session().get(
             f"{api_base}/admin/metrics",
             headers={"Authorization": f"Bearer {token}"},
             timeout=REQUEST_TIMEOUT,
@@ -214,7 +286,7 @@ def fetch_ai_summary(
 ) -> dict[str, Any] | None:
     """Request an AI summary from the API."""
     try:
-        response = requests.post(
+        response = get_http_session().post(
             f"{api_base}/ai/summary",
             headers={"Authorization": f"Bearer {token}"},
             json={"series_id": series_id} if series_id is not None else None,
@@ -234,7 +306,9 @@ def fetch_ai_summary(
 def delete_series(api_base: str, series_id: int) -> bool:
     """Delete a series entry via the API."""
     try:
-        response = requests.delete(f"{api_base}/series/{series_id}", timeout=REQUEST_TIMEOUT)
+        response = get_http_session().delete(
+            f"{api_base}/series/{series_id}", timeout=REQUEST_TIMEOUT
+        )
     except requests.RequestException as exc:
         st.error(f"Could not reach the API: {exc}")
         return False
@@ -243,13 +317,14 @@ def delete_series(api_base: str, series_id: int) -> bool:
         st.error(f"Delete failed ({response.status_code}): {response.text}")
         return False
 
+    invalidate_reads()
     return True
 
 
 def update_series(api_base: str, series_id: int, payload: dict[str, Any]) -> dict[str, Any] | None:
     """Replace a series entry via the API."""
     try:
-        response = requests.put(
+        response = get_http_session().put(
             f"{api_base}/series/{series_id}",
             json=payload,
             timeout=REQUEST_TIMEOUT,
@@ -262,13 +337,14 @@ def update_series(api_base: str, series_id: int, payload: dict[str, Any]) -> dic
         st.error(f"Update failed ({response.status_code}): {response.text}")
         return None
 
+    invalidate_reads()
     return response.json()
 
 
 def patch_series(api_base: str, series_id: int, payload: dict[str, Any]) -> dict[str, Any] | None:
     """Partially update a series entry via the API."""
     try:
-        response = requests.patch(
+        response = get_http_session().patch(
             f"{api_base}/series/{series_id}",
             json=payload,
             timeout=REQUEST_TIMEOUT,
@@ -281,24 +357,71 @@ def patch_series(api_base: str, series_id: int, payload: dict[str, Any]) -> dict
         st.error(f"Patch failed ({response.status_code}): {response.text}")
         return None
 
+    invalidate_reads()
     return response.json()
 
 
-def render_metrics(series: list[dict[str, Any]]) -> None:
-    """Render summary metrics for the dataset."""
-    ratings = [row["rating"] for row in series if row.get("rating") is not None]
-    avg_rating = sum(ratings) / len(ratings) if ratings else None
-    top_rated = max(series, key=lambda row: row.get("rating") or 0, default=None)
+def render_metrics(stats: dict[str, Any] | None) -> None:
+    """Render catalog-wide metrics from the server-side aggregate."""
+    avg_rating = (stats or {}).get("average_rating")
+    top_rated = (stats or {}).get("top_rated")
 
     col_total, col_avg, col_top = st.columns(3)
-    col_total.metric("Total series", len(series))
+    col_total.metric("Total series", stats["count"] if stats else "—")
     col_avg.metric("Avg rating", f"{avg_rating:.1f}" if avg_rating is not None else "—")
-    if top_rated and top_rated.get("rating") is not None:
+    if top_rated:
         col_top.metric("Top rated", f"{top_rated['title']} ({top_rated['rating']})")
     else:
         col_top.metric("Top rated", "—")
 
 
+def reset_page() -> None:
+    """Jump back to the first page when the search or page size changes."""
+    st.session_state["page"] = 0
+
+
+def render_pager(page: int, has_next: bool, shown: int, page_size: int) -> None:
+    """Render previous/next controls for the series table."""
+    col_prev, col_label, col_next = st.columns([1, 2, 1])
+    with col_prev:
+        if st.button("← Previous", disabled=page == 0, key="page-prev"):
+            st.session_state["page"] = page - 1
+            st.rerun()
+    first = page * page_size + 1 if shown else 0
+    col_label.caption(f"Page {page + 1} · rows {first}–{page * page_size + shown}")
+    with col_next:
+        if st.button("Next →", disabled=not has_next, key="page-next"):
+            st.session_state["page"] = page + 1
+            st.rerun()
+
+
+def pick_series(api_base: str, action: str, key: str) -> dict[str, Any] | None:
+    """Search the whole catalog (not just the visible page) for a series to act on."""
+    query = st_keyup(
+        f"Find a series to {action}",
+        placeholder="Title or creator",
+        debounce=SEARCH_DEBOUNCE_MS,
+        key=f"{key}-query",
+    ).strip()
+    matches, more = fetch_series_page(api_base, query=query or None, limit=PICKER_LIMIT)
+    if not matches:
+        st.caption("No matching series." if query else f"No entries to {action} yet.")
+        return None
+
+    options = {row["id"]: row for row in matches}
+    selected_id = st.selectbox(
+        f"Pick a series to {action}",
+        list(options),
+        format_func=lambda series_id: (
+            f"#{series_id} · {options[series_id]['title']} ({options[series_id]['year']})"
+        ),
+        key=key,
+    )
+    if more:
+        st.caption(f"Showing the first {PICKER_LIMIT} matches; type more to narrow them down.")
+    return options[selected_id]
+
+
 def render_table(series: list[dict[str, Any]]) -> None:
     """Render the main data table and export controls."""
     if not series:
@@ -381,7 +504,7 @@ def render_create_form(api_base: str) -> None:
             st.rerun()
 
 
-def render_delete_form(api_base: str, series: list[dict[str, Any]]) -> None:
+def render_delete_form(api_base: str) -> None:
     """Render a delete control for existing entries."""
     st.subheader("Delete an entry")
 
@@ -395,42 +518,22 @@ def render_delete_form(api_base: str, series: list[dict[str, Any]]) -> None:
             st.success(msg_text)
         st.session_state['delete_form_msg'] = None # Clear message after display
 
-    if not series:
-        st.caption("No entries to delete yet.")
+    selected = pick_series(api_base, "delete", key="delete-series")
+    if selected is None:
         return
-
-    options = {row["id"]: row for row in series}
-    selected_id = st.selectbox(
-        "Pick a series to delete",
-        sorted(options.keys()),
-        format_func=lambda series_id: (
-            f"#{series_id} · {options[series_id]['title']} ({options[series_id]['year']})"
-        ),
-        key="delete-series",
-    )
+    selected_id = selected["id"]
     if st.button("Delete selected", type="primary"):
         if delete_series(api_base, selected_id):
             st.session_state['delete_form_msg'] = {'type': 'success', 'text': f"Deleted: #{selected_id}"}
             st.rerun()
 
 
-def render_update_forms(api_base: str, series: list[dict[str, Any]]) -> None:
+def render_update_forms(api_base: str) -> None:
     """Render controls for updating existing entries."""
     st.subheader("Update an entry")
-    if not series:
-        st.caption("No entries to update yet.")
+    selected = pick_series(api_base, "edit", key="edit-series")
+    if selected is None:
         return
-
-    options = {row["id"]: row for row in series}
-    selected_id = st.selectbox(
-        "Pick a series to edit",
-        sorted(options.keys()),
-        format_func=lambda series_id: (
-            f"#{series_id} · {options[series_id]['title']} ({options[series_id]['year']})"
-        ),
-        key="edit-series",
-    )
-    selected = options[selected_id]
     st.caption(f"Editing ID #{selected['id']}")
 
     with st.form("replace-series"):
@@ -646,14 +749,36 @@ def main() -> None:
         "",
         unsafe_allow_html=True,
     )
-    query = st.text_input("Search by title or creator", placeholder="Try: Crown, Gilligan")
-    series = fetch_series(api_base, query=query if query else None)
+    if "page" not in st.session_state:
+        st.session_state["page"] = 0
+    col_search, col_size = st.columns([4, 1])
+    with col_search:
+        # Searches as you type, once typing pauses for SEARCH_DEBOUNCE_MS.
+        query = st_keyup(
+            "Search by title or creator",
+            placeholder="Try: Crown, Gilligan",
+            debounce=SEARCH_DEBOUNCE_MS,
+            key="series-query",
+            on_change=reset_page,
+        ).strip()
+    page_size = col_size.selectbox(
+        "Rows per page", PAGE_SIZES, index=1, key="page-size", on_change=reset_page
+    )
+    page = st.session_state["page"]
+    series, has_next = fetch_series_page(
+        api_base, query=query or None, offset=page * page_size, limit=page_size
+    )
+    if not series and page > 0:
+        # The page emptied under us (e.g. after deletes); step back instead of showing nothing.
+        st.session_state["page"] = page - 1
+        st.rerun()
 
     top_area = st.container()
     with top_area:
         st.subheader("Your series")
-        render_metrics(series)
+        render_metrics(fetch_stats(api_base))
         render_table(series)
+        render_pager(page, has_next, len(series), page_size)
         if "cancel_ai" not in st.session_state:
             st.session_state["cancel_ai"] = False
         if "show_ai" not in st.session_state:
@@ -712,8 +837,8 @@ def main() -> None:
                             st.markdown("\n".join([f"- {item}" for item in highlights]))
 
     render_create_form(api_base)
-    render_update_forms(api_base, series)
-    render_delete_form(api_base, series)
+    render_update_forms(api_base)
+    render_delete_form(api_base)
 
 
 if __name__ == "__main__":
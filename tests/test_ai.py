@@ -1,6 +1,9 @@
+import fakeredis.aioredis
+import pytest
 from fastapi.testclient import TestClient
 
-from app.models import UserDB
+from app.cache import ResultCache
+from app.models import Series, SeriesDB, UserDB
 from app.security import hash_password
 
 
@@ -15,10 +18,16 @@ def test_ai_summary_uses_mocked_generator(client: TestClient, session, monkeypat
     from app.routes import ai as ai_routes
     from app.ai import SummaryResult
 
-    async def _fake_summary(_):
+    summarized = []
+
+    async def _fake_summary(rows):
+        summarized.extend(rows)
         return SummaryResult(summary="ok", highlights=["one", "two"])
 
     monkeypatch.setattr(ai_routes, "generate_summary", _fake_summary)
+    monkeypatch.setattr(ai_routes, "SUMMARY_PAGE_SIZE", 2)
+    for year in range(2001, 2006):
+        session.add(SeriesDB(title=f"Show {year}", creator="Someone", year=year, rating=7.0))
 
     token = _token_for(client, session, "viewer", "viewer-pass", "viewer")
     response = client.post("/ai/summary", headers={"Authorization": f"Bearer {token}"})
@@ -26,3 +35,372 @@ def test_ai_summary_uses_mocked_generator(client: TestClient, session, monkeypat
     payload = response.json()
     assert payload["summary"] == "ok"
     assert payload["highlights"] == ["one", "two"]
+    assert [row.year for row in summarized] == [2001, 2002, 2003, 2004, 2005]
+
+
+def _counting_agent(calls: list[str]):
+    from pydantic_ai import Agent
+    from pydantic_ai.messages import ModelResponse, TextPart
+    from pydantic_ai.models.function import FunctionModel
+
+    def _respond(messages, info):
+        calls.append("call")
+        return ModelResponse(parts=[TextPart("Summary: Solid picks.\nHighlights:\n- Andor")])
+
+    return Agent(FunctionModel(_respond))
+
+
+@pytest.mark.anyio
+async def test_generate_summary_caches_by_catalog_content(monkeypatch):
+    from app import ai
+
+    calls: list[str] = []
+    monkeypatch.setattr(ai, "get_agent", lambda: _counting_agent(calls))
+    ai.summary_cache.clear()
+    rows = [Series(id=1, title="Andor", creator="Tony Gilroy", year=2022, rating=8.4)]
+
+    first = await ai.generate_summary(rows)
+    second = await ai.generate_summary(rows)
+    assert first == second
+    assert first.highlights == ["Andor"]
+    assert len(calls) == 1
+
+    rows[0].rating = 9.0
+    await ai.generate_summary(rows)
+    assert len(calls) == 2
+    stats = ai.summary_cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+
+
+@pytest.mark.anyio
+async def test_result_cache_evicts_and_falls_back_to_redis():
+    redis_client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    cache = ResultCache("test", ttl_seconds=60, max_entries=2, redis_client=redis_client)
+    for key in ("a", "b", "c"):
+        await cache.set(key, f'"{key}"')
+    assert cache.stats()["entries"] == 2
+
+    assert await cache.get("a") == '"a"'
+    assert cache.stats()["redis_hits"] == 1
+
+    other_process = ResultCache("test", ttl_seconds=60, max_entries=2, redis_client=redis_client)
+    assert await other_process.get("c") == '"c"'
+    assert await other_process.get("missing") is None
+    assert other_process.stats()["hit_rate"] == 0.5
+
+
+def test_ai_cache_metrics_requires_admin(client: TestClient, session):
+    token = _token_for(client, session, "admin", "admin-pass", "admin")
+    response = client.get("/admin/metrics/ai-cache", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200
+    assert {"hits", "misses", "hit_rate", "entries"} <= response.json().keys()
+
+
+def test_agent_is_shared_for_app_lifetime():
+    from app import ai
+    from app.main import app
+
+    with TestClient(app):
+        agent = ai.get_agent()
+        assert ai.get_agent() is agent
+        assert ai._http_client is not None
+    assert ai._agent is None
+    assert ai._http_client is None
+
+
+@pytest.mark.anyio
+async def test_generate_summary_map_reduces_large_catalogs(monkeypatch):
+    import asyncio
+
+    from pydantic_ai import Agent
+    from pydantic_ai.messages import ModelResponse, TextPart
+    from pydantic_ai.models.function import FunctionModel
+
+    from app import ai
+
+    prompts: list[str] = []
+    in_flight = peak = 0
+
+    async def _respond(messages, info):
+        nonlocal in_flight, peak
+        prompt = messages[-1].parts[-1].content
+        prompts.append(prompt)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if prompt.startswith("Partial summaries"):
+            return ModelResponse(parts=[TextPart("Summary: Whole catalog.\nHighlights:\n- merged")])
+        first = prompt.splitlines()[1]
+        return ModelResponse(parts=[TextPart(f"Summary: Shard from {first}.\nHighlights:\n- x")])
+
+    monkeypatch.setattr(ai, "get_agent", lambda: Agent(FunctionModel(_respond)))
+    monkeypatch.setattr(ai, "AI_SUMMARY_CHUNK_SIZE", 10)
+    monkeypatch.setattr(ai, "AI_SUMMARY_MAX_PARALLEL", 2)
+    ai.summary_cache.clear()
+    rows = [
+        Series(id=idx, title=f"Show {idx}", creator="Creator", year=2020, rating=7.0)
+        for idx in range(1, 36)
+    ]
+
+    result = await ai.generate_summary(rows)
+
+    assert result.summary == "Whole catalog."
+    assert len(prompts) == 5
+    assert peak == 2
+    reduce_prompt = prompts[-1]
+    assert "of 35 series" in reduce_prompt
+    assert "Part 4: Shard from Show 31 (2020)" in reduce_prompt
+
+
+@pytest.mark.anyio
+async def test_one_failed_shard_fails_the_whole_summary(monkeypatch):
+    from pydantic_ai import Agent
+    from pydantic_ai.messages import ModelResponse, TextPart
+    from pydantic_ai.models.function import FunctionModel
+
+    from app import ai
+
+    prompts: list[str] = []
+
+    def _respond(messages, info):
+        prompt = messages[-1].parts[-1].content
+        prompts.append(prompt)
+        if "Show 1 (2020)" in prompt:
+            raise RuntimeError("model crashed")
+        return ModelResponse(parts=[TextPart("Summary: Shard.\nHighlights:\n- x")])
+
+    monkeypatch.setattr(ai, "get_agent", lambda: Agent(FunctionModel(_respond)))
+    monkeypatch.setattr(ai, "AI_SUMMARY_CHUNK_SIZE", 10)
+    ai.summary_cache.clear()
+    rows = [
+        Series(id=idx, title=f"Show {idx}", creator="Creator", year=2020, rating=7.0)
+        for idx in range(1, 16)
+    ]
+
+    assert await ai.generate_summary(rows) == ai.UNAVAILABLE_SUMMARY
+    streamed = [item async for item in ai.stream_summary(rows)]
+    assert streamed[-1] == ai.UNAVAILABLE_SUMMARY
+    assert all(isinstance(item, ai.SummaryProgress) for item in streamed[:-1])
+    assert not any(prompt.startswith("Partial summaries") for prompt in prompts)
+
+
+@pytest.mark.anyio
+async def test_stream_summary_reports_each_shard_before_the_merge(monkeypatch):
+    from pydantic_ai import Agent
+    from pydantic_ai.messages import ModelResponse, TextPart
+    from pydantic_ai.models.function import FunctionModel
+
+    from app import ai
+
+    def _respond(messages, info):
+        first = messages[-1].parts[-1].content.splitlines()[1]
+        return ModelResponse(parts=[TextPart(f"Summary: From {first}.\nHighlights:\n- x")])
+
+    async def _stream(messages, info):
+        for piece in ("Summary: Whole ", "catalog.\n", "Highlights:\n", "- merged"):
+            yield piece
+
+    model = FunctionModel(_respond, stream_function=_stream)
+    monkeypatch.setattr(ai, "get_agent", lambda: Agent(model))
+    monkeypatch.setattr(ai, "AI_SUMMARY_CHUNK_SIZE", 10)
+    ai.summary_cache.clear()
+    rows = [
+        Series(id=idx, title=f"Show {idx}", creator="Creator", year=2020, rating=7.0)
+        for idx in range(1, 26)
+    ]
+
+    streamed = [item async for item in ai.stream_summary(rows)]
+
+    progress = [item for item in streamed if isinstance(item, ai.SummaryProgress)]
+    assert streamed[:3] == progress
+    assert [item.shards_done for item in progress] == [1, 2, 3]
+    assert {item.shards_total for item in progress} == {3}
+    assert {item.partial for item in progress} == {
+        "From Show 1 (2020) by Creator rating 7.0.",
+        "From Show 11 (2020) by Creator rating 7.0.",
+        "From Show 21 (2020) by Creator rating 7.0.",
+    }
+    assert all(isinstance(item, str) for item in streamed[3:-1])
+    assert streamed[-1] == ai.SummaryResult(summary="Whole catalog.", highlights=["merged"])
+
+
+@pytest.mark.anyio
+async def test_summary_job_round_trip_through_worker(engine, monkeypatch):
+    import json
+
+    from httpx import ASGITransport, AsyncClient
+    from sqlmodel import Session
+
+    from app import worker
+    from app.ai import SummaryResult
+    from app.config import REDIS_QUEUE
+    from app.db import get_session
+    from app.main import app
+    from app.models import SeriesDB
+    from app.queue import get_redis
+    from app.security import create_access_token
+
+    redis_client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+    def get_session_override():
+        with Session(engine) as session:
+            yield session
+
+    async def get_redis_override():
+        yield redis_client
+
+    async def _fake_summary(rows):
+        return SummaryResult(summary=f"{len(rows)} series", highlights=[rows[0].title])
+
+    app.dependency_overrides[get_session] = get_session_override
+    app.dependency_overrides[get_redis] = get_redis_override
+    monkeypatch.setattr(worker, "generate_summary", _fake_summary)
+    monkeypatch.setattr(worker, "SUMMARY_PAGE_SIZE", 2)
+    with Session(engine) as session:
+        session.add(SeriesDB(title="Andor", creator="Tony Gilroy", year=2022, rating=8.4))
+        for year in range(2001, 2005):
+            session.add(SeriesDB(title=f"Show {year}", creator="Someone", year=year, rating=7.0))
+        session.commit()
+    headers = {"Authorization": f"Bearer {create_access_token('viewer', 'viewer')}"}
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        queued = await ac.post("/ai/summary/jobs", headers=headers)
+        assert queued.status_code == 202
+        job_id = queued.json()["job_id"]
+        pending = await ac.get(f"/ai/summary/{job_id}", headers=headers)
+        assert pending.json()["status"] == "queued"
+
+        _, raw = await redis_client.blpop(REDIS_QUEUE)
+        await worker._handle_job(json.loads(raw), ac, token="unused", redis_client=redis_client)
+
+        done = await ac.get(f"/ai/summary/{job_id}", headers=headers)
+        missing = await ac.get("/ai/summary/unknown", headers=headers)
+
+    app.dependency_overrides.clear()
+    assert done.json()["status"] == "done"
+    assert done.json()["result"] == {"summary": "5 series", "highlights": ["Andor"]}
+    assert missing.status_code == 404
+
+
+def test_ai_summary_stream_emits_tokens_then_summary(client: TestClient, session, monkeypatch):
+    import json
+
+    from pydantic_ai import Agent
+    from pydantic_ai.models.function import FunctionModel
+
+    from app import ai
+
+    async def _stream(messages, info):
+        for piece in ("Summary: Tense ", "space drama.\n", "Highlights:\n", "- Andor"):
+            yield piece
+
+    monkeypatch.setattr(ai, "get_agent", lambda: Agent(FunctionModel(stream_function=_stream)))
+    ai.summary_cache.clear()
+    session.add(SeriesDB(title="Andor", creator="Tony Gilroy", year=2022, rating=8.4))
+    token = _token_for(client, session, "viewer", "viewer-pass", "viewer")
+
+    response = client.post("/ai/summary/stream", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+
+    events = []
+    for block in response.text.strip().split("\n\n"):
+        event_line, data_line = block.splitlines()
+        events.append((event_line.removeprefix("event: "), json.loads(data_line[6:])))
+    assert {name for name, _ in events[:-1]} == {"token"}
+    assert "".join(data["text"] for _, data in events[:-1]).startswith("Summary: Tense")
+    assert events[-1] == ("summary", {"summary": "Tense space drama.", "highlights": ["Andor"]})
+
+
+@pytest.mark.anyio
+async def test_admission_gate_queues_then_sheds_load():
+    import asyncio
+
+    from fastapi import HTTPException
+
+    from app.admission import AdmissionGate
+
+    gate = AdmissionGate(max_concurrent=1, max_queue=1, max_wait_seconds=0.05)
+    release = await gate.acquire()
+    waiter = asyncio.create_task(gate.acquire())
+    await asyncio.sleep(0)
+    assert (gate.in_flight, gate.queued) == (1, 1)
+
+    with pytest.raises(HTTPException) as full:
+        await gate.acquire()
+    assert full.value.status_code == 429
+    assert full.value.headers["Retry-After"] == "1"
+
+    with pytest.raises(HTTPException) as timed_out:
+        await waiter
+    assert timed_out.value.status_code == 503
+
+    handed_over = asyncio.create_task(gate.acquire())
+    await asyncio.sleep(0)
+    release()
+    release()
+    (await handed_over)()
+    assert gate.stats()["in_flight"] == 0
+    assert gate.stats()["rejected_queue_full"] == 1
+    assert gate.stats()["rejected_timeout"] == 1
+
+
+def test_ai_summary_rejects_when_gate_is_full(client: TestClient, session, monkeypatch):
+    from app import ai
+    from app.admission import AdmissionGate
+
+    monkeypatch.setattr(ai, "summary_gate", AdmissionGate(0, 0, max_wait_seconds=5))
+    monkeypatch.setattr(ai, "get_agent", lambda: _counting_agent([]))
+    ai.summary_cache.clear()
+    session.add(SeriesDB(title="Andor", creator="Tony Gilroy", year=2022, rating=8.4))
+    token = _token_for(client, session, "viewer", "viewer-pass", "viewer")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    for path in ("/ai/summary", "/ai/summary/stream"):
+        response = client.post(path, headers=headers)
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "5"
+
+
+@pytest.mark.anyio
+async def test_gate_bounds_model_calls_not_requests(monkeypatch):
+    import asyncio
+
+    from pydantic_ai import Agent
+    from pydantic_ai.messages import ModelResponse, TextPart
+    from pydantic_ai.models.function import FunctionModel
+
+    from app import ai
+    from app.admission import AdmissionGate
+
+    in_flight = peak = 0
+
+    async def _respond(messages, info):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return ModelResponse(parts=[TextPart("Summary: Fine.\nHighlights:\n- x")])
+
+    gate = AdmissionGate(max_concurrent=2, max_queue=20, max_wait_seconds=5)
+    monkeypatch.setattr(ai, "summary_gate", gate)
+    monkeypatch.setattr(ai, "get_agent", lambda: Agent(FunctionModel(_respond)))
+    monkeypatch.setattr(ai, "AI_SUMMARY_CHUNK_SIZE", 10)
+    monkeypatch.setattr(ai, "AI_SUMMARY_MAX_PARALLEL", 4)
+    ai.summary_cache.clear()
+    catalogs = [
+        [
+            Series(id=idx, title=f"Show {idx}", creator=creator, year=2020, rating=7.0)
+            for idx in range(1, 41)
+        ]
+        for creator in ("Alpha", "Beta")
+    ]
+
+    results = await asyncio.gather(*map(ai.generate_summary, catalogs))
+
+    assert {result.summary for result in results} == {"Fine."}
+    assert peak == 2
+    assert gate.stats()["admitted"] == 10
@@ -0,0 +1,84 @@
+import math
+import socket
+
+import pytest
+
+from benchmarks.ai_latency import model_time_ms, run_ai_latency
+from benchmarks.compression import run_compression
+from benchmarks.middleware import run_middleware_overhead
+from benchmarks.load import run_load
+from benchmarks.openai_stub import run_stub_in_thread
+
+
+@pytest.mark.anyio
+async def test_load_harness_reports_latency_percentiles():
+    report = await run_load(["list", "get", "create"], requests=5, concurrency=2, catalog_size=10)
+
+    assert report["meta"]["target"] == "asgi"
+    assert [row["scenario"] for row in report["results"]] == ["list", "get", "create"]
+    for row in report["results"]:
+        assert row["errors"] == 0
+        assert row["p50_ms"] <= row["p95_ms"] <= row["p99_ms"]
+
+
+@pytest.mark.anyio
+async def test_ai_latency_benchmark_runs_against_local_stub():
+    report = await run_ai_latency(
+        rows=5, iterations=2, requests=3, concurrency=2, latency_ms=20, tokens_per_second=2000
+    )
+
+    phases = {row.get("phase") or row.get("scenario"): row for row in report["results"]}
+    assert set(phases) == {"prompt_build", "parse", "generate_summary", "stream_summary", "route"}
+    assert phases["generate_summary"]["mean_ms"] >= phases["generate_summary"]["model_ms"]
+    assert phases["stream_summary"]["ttft_ms"] >= 20
+    assert phases["route"]["errors"] == 0
+
+
+@pytest.mark.anyio
+async def test_ai_latency_model_time_counts_gated_shard_waves():
+    from app import ai
+
+    per_call = model_time_ms(1, latency_ms=150, tokens_per_second=2000)
+    rows = 8 * ai.AI_SUMMARY_CHUNK_SIZE
+    wave = min(ai.AI_SUMMARY_MAX_PARALLEL, ai.summary_gate.max_concurrent)
+    assert model_time_ms(rows, 150, 2000) == per_call * (math.ceil(8 / wave) + 1)
+
+    report = await run_ai_latency(
+        rows=rows, iterations=1, requests=1, concurrency=1, latency_ms=150, tokens_per_second=2000
+    )
+    generate = next(row for row in report["results"] if row.get("phase") == "generate_summary")
+    # Miscounting even one wave of map calls would show up as a whole call of overhead.
+    assert 0 <= generate["overhead_ms"] < per_call
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_model_stub_fails_fast_when_its_port_is_taken():
+    with socket.socket() as taken:
+        taken.bind(("127.0.0.1", 0))
+        taken.listen()
+        with pytest.raises(RuntimeError, match="did not start"):
+            with run_stub_in_thread(taken.getsockname()[1]):
+                pass
+
+
+@pytest.mark.anyio
+async def test_compression_benchmark_compares_encodings():
+    report = await run_compression(catalog_size=50, iterations=1, requests=2, concurrency=1)
+
+    payloads = {row["payload"] for row in report["codecs"]}
+    assert {"series_list", "series_id_title", "reports"} <= payloads
+    gzip = [row for row in report["codecs"] if row["encoding"] == "gzip"]
+    assert all(row["ratio"] > 1 for row in gzip)
+    route = {row["scenario"]: row for row in report["route"]}
+    assert route["route_gzip"]["wire_bytes"] < route["route_identity"]["wire_bytes"]
+
+
+@pytest.mark.anyio
+async def test_middleware_benchmark_covers_every_stack():
+    report = await run_middleware_overhead(iterations=20, warmup=2)
+
+    rows = {(row["stack"], row["endpoint"]): row for row in report["results"]}
+    assert set(rows) == {
+        (stack, path) for stack in ("none", "base_http", "asgi") for path in ("/json", "/stream")
+    }
+    assert rows[("none", "/json")]["overhead_us"] == 0
@@ -0,0 +1,124 @@
+import json
+import os
+import subprocess
+import sys
+
+from sqlalchemy import func
+from sqlmodel import Session, select
+from typer.testing import CliRunner
+
+from app import cli as cli_module
+from app.models import ReportDB, SeriesCreate, SeriesDB
+from app.services import reports as report_service
+from app.services.helpers import find_existing_series_keys
+from app.synthetic import synthetic_series
+from app.telemetry import track_queries
+
+runner = CliRunner()
+
+
+def test_synthetic_series_is_deterministic_and_unique():
+    first = list(synthetic_series(2000, seed=5))
+    second = list(synthetic_series(2000, seed=5))
+    assert first == second
+    assert first != list(synthetic_series(2000, seed=6))
+
+    identities = {(row["title"], row["creator"], row["year"]) for row in first}
+    assert len(identities) == len(first)
+    assert all(1950 <= row["year"] <= 2025 for row in first)
+    assert all(row["rating"] is None or 0 <= row["rating"] <= 10 for row in first)
+
+
+def test_synthetic_series_does_not_depend_on_hash_seed():
+    script = "import json; from app.synthetic import synthetic_series; "
+    script += "print(json.dumps(list(synthetic_series(2000, seed=5))))"
+    outputs = [
+        subprocess.run(
+            [sys.executable, "-c", script],
+            env={**os.environ, "PYTHONHASHSEED": hash_seed},
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+        for hash_seed in ("1", "2")
+    ]
+    assert json.loads(outputs[0]) == json.loads(outputs[1]) == list(synthetic_series(2000, seed=5))
+
+
+def test_seed_synthetic_bulk_inserts_rows(engine, monkeypatch):
+    monkeypatch.setattr(cli_module, "engine", engine)
+    monkeypatch.setattr(cli_module, "create_db_and_tables", lambda: None)
+
+    result = runner.invoke(
+        cli_module.cli, ["seed-synthetic", "--count", "250", "--seed", "1", "--chunk-size", "100"]
+    )
+    assert result.exit_code == 0, result.output
+    assert "Inserted 250 synthetic series (0 skipped)" in result.output
+    with Session(engine) as session:
+        assert session.exec(select(func.count()).select_from(SeriesDB)).one() == 250
+
+
+def test_seed_synthetic_does_not_duplicate_an_existing_catalog(engine, monkeypatch):
+    monkeypatch.setattr(cli_module, "engine", engine)
+    monkeypatch.setattr(cli_module, "create_db_and_tables", lambda: None)
+    args = ["seed-synthetic", "--seed", "1", "--chunk-size", "100"]
+
+    assert runner.invoke(cli_module.cli, [*args, "--count", "250"]).exit_code == 0
+    refused = runner.invoke(cli_module.cli, [*args, "--count", "250"])
+    assert refused.exit_code == 1
+    assert "--clear-existing or --append" in refused.output
+
+    appended = runner.invoke(cli_module.cli, [*args, "--count", "300", "--append"])
+    assert appended.exit_code == 0, appended.output
+    assert "Inserted 50 synthetic series (250 skipped)" in appended.output
+    with Session(engine) as session:
+        assert session.exec(select(func.count()).select_from(SeriesDB)).one() == 300
+
+
+def test_seed_search_skips_existing_rows_in_one_query(engine, monkeypatch):
+    monkeypatch.setattr(cli_module, "create_db_and_tables", lambda: None)
+    monkeypatch.setattr(cli_module, "session_context", lambda: Session(engine))
+
+    first = runner.invoke(cli_module.cli, ["seed-search"])
+    assert first.exit_code == 0, first.output
+    assert "6 new, 0 skipped" in first.output
+
+    with track_queries() as stats:
+        second = runner.invoke(cli_module.cli, ["seed-search"])
+    assert second.exit_code == 0, second.output
+    assert "0 new, 6 skipped" in second.output
+    assert stats.count == 1
+
+
+def test_find_existing_series_keys_batches_lookups(session):
+    session.add(SeriesDB(title="Andor", creator="Tony Gilroy", year=2022, rating=8.4))
+    session.commit()
+    payloads = [
+        SeriesCreate(title=f"Show {idx}", creator="Someone", year=2020) for idx in range(700)
+    ]
+    payloads.append(SeriesCreate(title="Andor", creator="Tony Gilroy", year=2022))
+
+    with track_queries() as stats:
+        existing = find_existing_series_keys(payloads, session)
+    assert existing == {("Andor", "Tony Gilroy", 2022)}
+    assert stats.count == 3
+
+
+def test_compress_reports_backfills_plain_rows(engine, monkeypatch):
+    monkeypatch.setattr(cli_module, "create_db_and_tables", lambda: None)
+    monkeypatch.setattr(cli_module, "session_context", lambda: Session(engine))
+    body = "Weekly digest: 120 series, average rating 7.9.\n" * 50
+    with Session(engine) as session:
+        session.add_all(
+            ReportDB(title=f"Digest {idx}", content=body, created_by="worker") for idx in range(3)
+        )
+        session.add(ReportDB(title="Tiny", content="short", created_by="worker"))
+        session.commit()
+
+    result = runner.invoke(cli_module.cli, ["compress-reports", "--batch-size", "2"])
+    assert result.exit_code == 0, result.output
+    assert "Compressed 3 of 4 plain reports with zlib" in result.output
+
+    with Session(engine) as session:
+        assert report_service.get_report(1, session).content == body
+        assert session.get(ReportDB, 4).content_encoding is None
@@ -0,0 +1,103 @@
+import logging
+
+import httpx
+import pytest
+
+from app import http_client
+from app.http_client import IDEMPOTENT_METHODS, RetryPolicy, create_async_client, create_client
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(http_client, "HTTP_CLIENT_RETRY_BACKOFF_SECONDS", 0)
+
+
+def _flaky(failures: list):
+    """Handler that raises or returns each of `failures` in turn, then answers 200."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        if len(calls) <= len(failures):
+            outcome = failures[len(calls) - 1]
+            if isinstance(outcome, Exception):
+                raise outcome
+            return httpx.Response(outcome)
+        return httpx.Response(200, json={"ok": True})
+
+    return handler, calls
+
+
+def test_backoff_is_jittered_and_capped():
+    policy = RetryPolicy(retries=5, backoff_seconds=0.4, methods=IDEMPOTENT_METHODS)
+    delays = [policy.delay(3) for _ in range(50)]
+    assert all(0 <= delay <= 3.2 for delay in delays)
+    assert len(set(delays)) > 1
+    assert policy.delay(20) <= http_client.MAX_BACKOFF_SECONDS
+
+
+@pytest.mark.anyio
+async def test_connect_errors_and_503s_are_retried():
+    handler, calls = _flaky([httpx.ConnectError("refused"), 503])
+    async with create_async_client(retries=2, transport=httpx.MockTransport(handler)) as client:
+        response = await client.get("http://api/series")
+    assert response.status_code == 200
+    assert calls == ["GET", "GET", "GET"]
+
+
+@pytest.mark.anyio
+async def test_post_is_only_retried_when_opted_in():
+    handler, calls = _flaky([503])
+    async with create_async_client(retries=2, transport=httpx.MockTransport(handler)) as client:
+        response = await client.post("http://api/reports")
+    assert response.status_code == 503
+    assert calls == ["POST"]
+
+    handler, calls = _flaky([503])
+    async with create_async_client(
+        retries=2,
+        retry_methods=IDEMPOTENT_METHODS | {"POST"},
+        transport=httpx.MockTransport(handler),
+    ) as client:
+        response = await client.post("http://api/series/1/refresh")
+    assert response.status_code == 200
+    assert calls == ["POST", "POST"]
+
+
+def test_retries_give_up_and_requests_are_timed(caplog):
+    handler, calls = _flaky([httpx.ReadTimeout("slow")] * 3)
+    with create_client(retries=1, transport=httpx.MockTransport(handler)) as client:
+        with pytest.raises(httpx.ReadTimeout):
+            client.get("http://api/health")
+        assert calls == ["GET", "GET"]
+
+        with caplog.at_level(logging.DEBUG, logger="tv_db.http"):
+            client.get("http://api/health")
+    assert any("GET http://api/health -> 200 in" in record.message for record in caplog.records)
+
+
+def test_connect_timeouts_are_retried_for_any_method():
+    handler, calls = _flaky([httpx.ConnectTimeout("no answer")])
+    with create_client(retries=1, transport=httpx.MockTransport(handler)) as client:
+        assert client.post("http://api/reports").status_code == 200
+    assert calls == ["POST", "POST"]
+
+
+@pytest.mark.anyio
+async def test_closing_the_client_closes_the_wrapped_transport():
+    class _Recording(httpx.MockTransport):
+        closed = False
+
+        def close(self) -> None:
+            self.closed = True
+
+        async def aclose(self) -> None:
+            self.closed = True
+
+    sync_inner = _Recording(_flaky([])[0])
+    with create_client(transport=sync_inner):
+        pass
+    async_inner = _Recording(_flaky([])[0])
+    async with create_async_client(transport=async_inner):
+        pass
+    assert sync_inner.closed and async_inner.closed
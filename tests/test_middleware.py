@@ -0,0 +1,116 @@
+import asyncio
+import zlib
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.responses import StreamingResponse
+
+from app.middleware import (
+    CompressionMiddleware,
+    RateLimitHeadersMiddleware,
+    TraceIdMiddleware,
+    negotiate_encoding,
+)
+
+
+def test_negotiate_encoding_honours_q_values_and_server_order():
+    offered = ["zstd", "br", "gzip"]
+    assert negotiate_encoding("gzip, br", offered) == "br"
+    assert negotiate_encoding("gzip;q=1.0, br;q=0.5", offered) == "gzip"
+    assert negotiate_encoding("*;q=0.1, zstd;q=0", offered) == "br"
+    assert negotiate_encoding("identity", offered) is None
+    assert negotiate_encoding("", offered) is None
+
+
+def test_large_json_responses_are_gzipped(client: TestClient):
+    for idx in range(60):
+        client.post(
+            "/series", json={"title": f"Show {idx}", "creator": "Someone", "year": 2000 + idx % 20}
+        )
+
+    response = client.get("/series", params={"limit": 1000}, headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert int(response.headers["content-length"]) == response.num_bytes_downloaded
+    assert response.num_bytes_downloaded < len(response.content)
+    assert len(response.json()) == 60
+    assert "X-Trace-Id" in response.headers
+
+    small = client.get("/health", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+    plain = client.get("/series", params={"limit": 1000}, headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+
+
+async def _call(app, accept_encoding: str, headers: list | None = None) -> list[dict]:
+    sent: list[dict] = []
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(b"accept-encoding", accept_encoding.encode()), *(headers or [])],
+    }
+
+    async def receive() -> dict:
+        await asyncio.Event().wait()  # the client never disconnects
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict) -> None:
+        sent.append(message)
+
+    await app(scope, receive, send)
+    return sent
+
+
+@pytest.mark.anyio
+async def test_streamed_bodies_are_compressed_chunk_by_chunk():
+    chunks = [b"batch %d " % idx * 200 for idx in range(3)]
+
+    async def stream_app(scope, receive, send):
+        response = StreamingResponse(iter(chunks), media_type="application/octet-stream")
+        await response(scope, receive, send)
+
+    app = CompressionMiddleware(stream_app, ["gzip"], minimum_size=1024, levels={"gzip": 6})
+    sent = await _call(app, "gzip")
+
+    start, bodies = sent[0], [message for message in sent[1:] if message.get("body")]
+    headers = dict(start["headers"])
+    assert headers[b"content-encoding"] == b"gzip"
+    assert b"content-length" not in headers
+    assert len(bodies) >= len(chunks)
+    # Every chunk is flushed, so the client can decode what it has received so far.
+    decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    assert decoder.decompress(bodies[0]["body"]) == chunks[0]
+    payload = b"".join(message.get("body", b"") for message in sent[1:])
+    assert zlib.decompress(payload, 16 + zlib.MAX_WBITS) == b"".join(chunks)
+
+
+@pytest.mark.anyio
+async def test_event_streams_are_not_compressed():
+    async def sse_app(scope, receive, send):
+        response = StreamingResponse(iter([b"data: x\n\n" * 200]), media_type="text/event-stream")
+        await response(scope, receive, send)
+
+    app = CompressionMiddleware(sse_app, ["gzip"], minimum_size=10, levels={"gzip": 6})
+    sent = await _call(app, "gzip")
+    assert b"content-encoding" not in dict(sent[0]["headers"])
+
+
+@pytest.mark.anyio
+async def test_header_middleware_passes_streamed_chunks_straight_through():
+    chunks = [b"one", b"two", b"three"]
+    seen_trace_ids = []
+
+    async def stream_app(scope, receive, send):
+        seen_trace_ids.append(scope["state"]["trace_id"])
+        response = StreamingResponse(iter(chunks), media_type="text/plain")
+        await response(scope, receive, send)
+
+    app = RateLimitHeadersMiddleware(TraceIdMiddleware(stream_app), limit=10, window_seconds=60)
+    sent = await _call(app, "identity", headers=[(b"x-trace-id", b"abc")])
+
+    headers = dict(sent[0]["headers"])
+    assert headers[b"x-trace-id"] == b"abc"
+    assert headers[b"x-ratelimit-limit"] == b"10"
+    assert seen_trace_ids == ["abc"]
+    assert [message["body"] for message in sent[1:] if message.get("body")] == chunks
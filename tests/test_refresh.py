@@ -24,8 +24,8 @@ async def test_refresh_series_idempotent(engine):
 
     redis_client = fakeredis.aioredis.FakeRedis(decode_responses=True)
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
-        first = await refresh_series("http://test", redis_client, ac, concurrency=2, retries=0)
-        second = await refresh_series("http://test", redis_client, ac, concurrency=2, retries=0)
+        first = await refresh_series("http://test", redis_client, ac, concurrency=2)
+        second = await refresh_series("http://test", redis_client, ac, concurrency=2)
 
     app.dependency_overrides.clear()
     assert first["refreshed"] == 1
@@ -1,6 +1,11 @@
+from datetime import datetime, timezone
+
+import fakeredis.aioredis
+import pytest
 from fastapi.testclient import TestClient
+from sqlmodel import Session
 
-from app.models import UserDB
+from app.models import ReportDB, UserDB
 from app.security import hash_password
 
 
@@ -28,3 +33,128 @@ def test_list_reports_requires_admin(client: TestClient, session):
     token = _token_for(client, session, "admin", "secret", "admin")
     response = client.get("/reports", headers={"Authorization": f"Bearer {token}"})
     assert response.status_code == 200
+
+
+def test_list_reports_pages_with_cursor_and_summary_mode(client: TestClient, session):
+    token = _token_for(client, session, "admin", "secret", "admin")
+    headers = {"Authorization": f"Bearer {token}"}
+    same_instant = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    session.add_all(
+        ReportDB(
+            title=f"Digest {idx}", content="x" * 500, created_by="worker", created_at=same_instant
+        )
+        for idx in range(5)
+    )
+    session.commit()
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2, "summary": True, **({"cursor": cursor} if cursor else {})}
+        response = client.get("/reports", params=params, headers=headers)
+        assert response.status_code == 200
+        assert all("content" not in row for row in response.json())
+        seen += [row["id"] for row in response.json()]
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    assert seen == sorted(seen, reverse=True)
+    assert len(seen) == len(set(seen)) == 5
+
+    full = client.get("/reports", params={"limit": 1}, headers=headers).json()
+    assert full[0]["content"] == "x" * 500
+
+    bad = client.get("/reports", params={"cursor": "not-a-cursor"}, headers=headers)
+    assert bad.status_code == 400
+
+
+def test_large_report_content_is_stored_compressed(client: TestClient, session):
+    token = _token_for(client, session, "admin", "secret", "admin")
+    headers = {"Authorization": f"Bearer {token}"}
+    content = "Catalog digest\n" + "Total series: 42, average rating 8.1\n" * 200
+
+    created = client.post("/reports", json={"title": "Digest", "content": content}, headers=headers)
+    assert created.status_code == 201
+    assert created.json()["content"] == content
+
+    row = session.get(ReportDB, created.json()["id"])
+    assert row.content == ""
+    assert row.content_encoding == "zlib"
+    assert len(row.content_compressed) < len(content) // 10
+
+    fetched = client.get(f"/reports/{row.id}", headers=headers)
+    assert fetched.json()["content"] == content
+    assert client.get("/reports/9999", headers=headers).status_code == 404
+
+
+def test_list_reports_projects_fields_and_keeps_paging(client: TestClient, session):
+    token = _token_for(client, session, "admin", "secret", "admin")
+    headers = {"Authorization": f"Bearer {token}"}
+    content = "Total series: 42\n" * 100
+    for idx in range(3):
+        client.post(
+            "/reports", json={"title": f"Digest {idx}", "content": content}, headers=headers
+        )
+
+    response = client.get(
+        "/reports", params={"limit": 2, "fields": "content,title"}, headers=headers
+    )
+    assert response.status_code == 200
+    assert response.json() == [
+        {"title": "Digest 2", "content": content},
+        {"title": "Digest 1", "content": content},
+    ]
+    cursor = response.headers["X-Next-Cursor"]
+    rest = client.get(
+        "/reports", params={"fields": "title", "cursor": cursor}, headers=headers
+    ).json()
+    assert rest == [{"title": "Digest 0"}]
+
+    bad = client.get("/reports", params={"fields": "title,secret"}, headers=headers)
+    assert bad.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_digest_job_applies_only_changes_since_last_digest(engine):
+    from httpx import ASGITransport, AsyncClient
+
+    from app import worker
+    from app.db import get_session
+    from app.main import app
+    from app.security import create_access_token
+
+    redis_client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+    def get_session_override():
+        with Session(engine) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = get_session_override
+    token = create_access_token("worker", "worker")
+    job = {"job_id": "digest", "job_type": "report_digest"}
+    shows = [
+        {"title": "Andor", "creator": "Tony Gilroy", "year": 2022, "rating": 8.0},
+        {"title": "Silo", "creator": "Graham Yost", "year": 2023, "rating": 7.0},
+        {"title": "Severance", "creator": "Dan Erickson", "year": 2022, "rating": 9.0},
+    ]
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        ids = [(await ac.post("/series", json=show)).json()["id"] for show in shows]
+        await worker._handle_job(job, ac, token, redis_client)
+
+        await ac.patch(f"/series/{ids[0]}", json={"rating": 10.0})
+        await ac.delete(f"/series/{ids[1]}")
+        await worker._handle_job(job, ac, token, redis_client)
+
+        headers = {"Authorization": f"Bearer {create_access_token('admin', 'admin')}"}
+        first, second = reversed((await ac.get("/reports", headers=headers)).json())
+        stats = (await ac.get("/series/stats")).json()
+
+    app.dependency_overrides.clear()
+    assert "Total series: 3" in first["content"]
+    assert "full recount" in first["content"]
+    assert "Total series: 2" in second["content"]
+    assert "Average rating: 9.50" in second["content"]
+    assert "Changes since last digest: 2" in second["content"]
+    assert "Busiest years: 2022 (2)" in second["content"]
+    assert stats["average_rating"] == 9.5
@@ -1,3 +1,9 @@
+import asyncio
+
+import fakeredis.aioredis
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
 from fastapi.testclient import TestClient
 
 
@@ -71,6 +77,29 @@ def test_patch_series_returns_404_for_missing_id(client: TestClient):
     assert response.json()["detail"] == "Series not found"
 
 
+def test_batch_get_returns_series_in_request_order_with_misses(client: TestClient):
+    first = client.post(
+        "/series", json={"title": "Andor", "creator": "Tony Gilroy", "year": 2022}
+    ).json()
+    second = client.post(
+        "/series", json={"title": "Silo", "creator": "Graham Yost", "year": 2023}
+    ).json()
+
+    response = client.post("/series/batch-get", json={"ids": [second["id"], 999, first["id"], 999]})
+    assert response.status_code == 200
+    body = response.json()
+    assert [item and item["title"] for item in body["items"]] == ["Silo", None, "Andor", None]
+    assert body["missing"] == [999]
+
+
+def test_batch_get_rejects_empty_and_oversized_requests(client: TestClient):
+    from app.config import SERIES_BATCH_GET_MAX_IDS
+
+    assert client.post("/series/batch-get", json={"ids": []}).status_code == 422
+    too_many = list(range(1, SERIES_BATCH_GET_MAX_IDS + 2))
+    assert client.post("/series/batch-get", json={"ids": too_many}).status_code == 422
+
+
 def test_delete_series(client: TestClient):
     payload = {"title": "Dark", "creator": "Baran bo Odar", "year": 2017, "rating": 8.8}
     created = client.post("/series", json=payload).json()
@@ -165,6 +194,22 @@ def test_list_series_filters_by_query(client: TestClient):
     assert body[0]["title"] == "The Bear"
 
 
+def test_series_fields_projection(client: TestClient):
+    created = client.post(
+        "/series", json={"title": "Andor", "creator": "Tony Gilroy", "year": 2022}
+    ).json()
+
+    listed = client.get("/series", params={"fields": "title,id"})
+    assert listed.status_code == 200
+    assert listed.json() == [{"id": created["id"], "title": "Andor"}]
+    assert "X-Change-Seq" in listed.headers
+
+    single = client.get(f"/series/{created['id']}", params={"fields": "year"})
+    assert single.json() == {"year": 2022}
+    assert client.get("/series/999", params={"fields": "year"}).status_code == 404
+    assert client.get("/series", params={"fields": "title,nope"}).status_code == 400
+
+
 def test_refresh_series_updates_timestamp(client: TestClient):
     payload = {"title": "Silo", "creator": "Graham Yost", "year": 2023, "rating": 8.2}
     created = client.post("/series", json=payload).json()
@@ -184,3 +229,241 @@ def test_trace_id_header_present(client: TestClient):
     response = client.get("/health")
     assert response.status_code == 200
     assert "X-Trace-Id" in response.headers
+
+
+def test_query_count_headers_present(client: TestClient):
+    payload = {"title": "Andor", "creator": "Tony Gilroy", "year": 2022, "rating": 8.4}
+    response = client.post("/series", json=payload)
+    assert response.status_code == 201
+    assert int(response.headers["X-DB-Query-Count"]) >= 2
+    assert response.headers["Server-Timing"].startswith("db;dur=")
+
+    health = client.get("/health")
+    assert health.headers["X-DB-Query-Count"] == "0"
+
+
+def test_slow_query_log_redacts_parameters(client: TestClient, monkeypatch, caplog):
+    from app import telemetry
+
+    monkeypatch.setattr(telemetry, "SLOW_QUERY_MS", 0)
+    with caplog.at_level("WARNING", logger="tv_db.sql"):
+        client.get("/series", params={"query": "secret-title"}, headers={"X-Trace-Id": "abc"})
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert any("trace_id=abc" in message for message in messages)
+    assert not any("secret-title" in message for message in messages)
+
+
+def test_series_writes_are_recorded_in_change_log(client: TestClient):
+    payload = {"title": "Dark", "creator": "Baran bo Odar", "year": 2017, "rating": 8.8}
+    created = client.post("/series", json=payload).json()
+    client.post("/series", json=payload)  # duplicate: no change
+    client.patch(f"/series/{created['id']}", json={"rating": 9.0})
+    client.post(f"/series/{created['id']}/refresh")
+    client.delete(f"/series/{created['id']}")
+
+    changes = client.get("/series/changes").json()
+    assert [change["op"] for change in changes] == ["create", "update", "refresh", "delete"]
+    assert [change["seq"] for change in changes] == sorted(change["seq"] for change in changes)
+    assert changes[0]["previous"] is None and changes[0]["current"]["rating"] == 8.8
+    assert changes[1]["previous"]["rating"] == 8.8 and changes[1]["current"]["rating"] == 9.0
+    assert changes[3]["current"] is None and changes[3]["series_id"] == created["id"]
+
+    later = client.get("/series/changes", params={"since": changes[1]["seq"]}).json()
+    assert [change["op"] for change in later] == ["refresh", "delete"]
+
+
+def test_series_stats_reports_aggregates_at_sequence(client: TestClient):
+    assert client.get("/series/stats").json() == {
+        "seq": 0,
+        "count": 0,
+        "rated_count": 0,
+        "rating_sum": 0.0,
+        "average_rating": None,
+        "years": {},
+        "top_rated": None,
+    }
+    client.post(
+        "/series", json={"title": "Andor", "creator": "Tony Gilroy", "year": 2022, "rating": 8.0}
+    )
+    client.post("/series", json={"title": "Silo", "creator": "Graham Yost", "year": 2023})
+    client.post(
+        "/series",
+        json={"title": "Severance", "creator": "Dan Erickson", "year": 2022, "rating": 9.0},
+    )
+
+    stats = client.get("/series/stats").json()
+    assert stats["seq"] == client.get("/series/changes").json()[-1]["seq"]
+    assert stats["count"] == 3
+    assert stats["rated_count"] == 2
+    assert stats["average_rating"] == 8.5
+    assert stats["years"] == {"2022": 2, "2023": 1}
+    assert stats["top_rated"]["title"] == "Severance"
+
+
+def test_change_feed_keeps_a_local_mirror_in_sync(client: TestClient):
+    shows = [
+        {"title": "Andor", "creator": "Tony Gilroy", "year": 2022, "rating": 8.4},
+        {"title": "Silo", "creator": "Graham Yost", "year": 2023, "rating": 8.2},
+    ]
+    ids = [client.post("/series", json=show).json()["id"] for show in shows]
+    listing = client.get("/series")
+    mirror = {row["id"]: row for row in listing.json()}
+    since = int(listing.headers["X-Change-Seq"])
+
+    client.patch(f"/series/{ids[0]}", json={"rating": 9.1})
+    client.delete(f"/series/{ids[1]}")
+    client.post("/series", json={"title": "Dark", "creator": "Baran bo Odar", "year": 2017})
+
+    while True:
+        page = client.get("/series/changes", params={"since": since, "limit": 2}).json()
+        for change in page:
+            if change["current"] is None:
+                mirror.pop(change["series_id"], None)
+            else:
+                mirror[change["series_id"]] = change["current"]
+        if not page:
+            break
+        since = page[-1]["seq"]
+
+    assert mirror == {row["id"]: row for row in client.get("/series").json()}
+
+
+def test_change_feed_returns_gone_for_pruned_cursor(client: TestClient, session):
+    from datetime import datetime, timedelta, timezone
+
+    from app.services.changes import prune_changes
+
+    client.post("/series", json={"title": "Andor", "creator": "Tony Gilroy", "year": 2022})
+    client.post("/series", json={"title": "Silo", "creator": "Graham Yost", "year": 2023})
+    assert prune_changes(session, before=datetime.now(timezone.utc) + timedelta(minutes=1)) == 2
+
+    gone = client.get("/series/changes", params={"since": 0})
+    assert gone.status_code == 410
+    head = int(client.get("/series").headers["X-Change-Seq"])
+    assert client.get("/series/changes", params={"since": head}).json() == []
+
+
+def test_export_streams_arrow_ipc(client: TestClient):
+    client.post("/series", json={"title": "Andor", "creator": "Tony Gilroy", "year": 2022})
+    client.post(
+        "/series", json={"title": "Silo", "creator": "Graham Yost", "year": 2023, "rating": 8.1}
+    )
+
+    response = client.get("/series/export", params={"format": "arrow"})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.apache.arrow.stream"
+    table = pa.ipc.open_stream(response.content).read_all()
+    assert table.column_names == ["id", "title", "creator", "year", "rating", "last_refreshed_at"]
+    assert table.column("title").to_pylist() == ["Andor", "Silo"]
+    assert table.column("rating").to_pylist() == [None, 8.1]
+
+
+def test_export_writes_one_parquet_row_group_per_batch(session):
+    from app.models import SeriesCreate
+    from app.services import series as series_service
+    from app.services.export import export_series
+
+    for year in range(2000, 2005):
+        series_service.create_series(
+            SeriesCreate(title=f"Show {year}", creator="Someone", year=year), session
+        )
+
+    chunks = list(export_series(session, "parquet", batch_size=2))
+    parquet = pq.ParquetFile(pa.BufferReader(b"".join(chunks)))
+    assert parquet.metadata.num_row_groups == 3
+    assert parquet.read().column("year").to_pylist() == list(range(2000, 2005))
+
+
+def test_export_rejects_unknown_format(client: TestClient):
+    assert client.get("/series/export", params={"format": "csv"}).status_code == 422
+
+
+async def _wait_for_listeners(client, channel: str, count: int) -> None:
+    for _ in range(100):
+        if dict(await client.pubsub_numsub(channel)).get(channel, 0) >= count:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("event listeners never subscribed")
+
+
+@pytest.mark.anyio
+async def test_series_events_fan_out_across_processes():
+    from app.events import EventBroker
+    from app.models import SeriesChange
+
+    server = fakeredis.FakeServer()
+    api_one = EventBroker("test:events", max_queue=10)
+    api_two = EventBroker("test:events", max_queue=10)
+    await api_one.start(fakeredis.aioredis.FakeRedis(server=server, decode_responses=True))
+    await api_two.start(fakeredis.aioredis.FakeRedis(server=server, decode_responses=True))
+    try:
+        await _wait_for_listeners(api_one._redis, "test:events", 2)
+        subscription = api_two.subscribe()
+        change = SeriesChange(seq=7, series_id=3, op="delete", changed_at="2025-01-01T00:00:00")
+        # Services publish from worker threads after committing.
+        await asyncio.to_thread(api_one.publish, change)
+
+        received = await asyncio.wait_for(subscription.queue.get(), 1)
+        assert received == change
+    finally:
+        await api_one.stop()
+        await api_two.stop()
+
+
+@pytest.mark.anyio
+async def test_series_event_publish_tasks_are_held_and_failures_logged(caplog, monkeypatch):
+    from app.events import EventBroker
+    from app.models import SeriesChange
+
+    broker = EventBroker("test:events", max_queue=10)
+    await broker.start(fakeredis.aioredis.FakeRedis(decode_responses=True))
+
+    async def _broken_publish(channel, payload):
+        raise ValueError("bad payload")
+
+    monkeypatch.setattr(broker._redis, "publish", _broken_publish)
+    try:
+        change = SeriesChange(seq=1, series_id=1, op="create", changed_at="2025-01-01T00:00:00")
+        broker.publish(change)
+        assert len(broker._publishing) == 1
+        await asyncio.gather(*broker._publishing, return_exceptions=True)
+        await asyncio.sleep(0)
+        assert broker._publishing == set()
+        assert "Publishing a series event failed." in caplog.text
+    finally:
+        await broker.stop()
+
+
+@pytest.mark.anyio
+async def test_series_events_stream_replays_then_follows_live_changes(session):
+    from app.config import SERIES_EVENTS_CHANNEL
+    from app.events import series_events
+    from app.models import SeriesCreate
+    from app.routes.series import series_event_stream
+    from app.services import series as series_service
+
+    redis_client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    await series_events.start(redis_client)
+    try:
+        await _wait_for_listeners(redis_client, SERIES_EVENTS_CHANNEL, 1)
+        missed = series_service.create_series(
+            SeriesCreate(title="Andor", creator="Tony Gilroy", year=2022), session
+        )
+        response = await series_event_stream(session=session, since=None, last_event_id="0")
+        events = response.body_iterator
+
+        replayed = await anext(events)
+        assert replayed.startswith("id: 1\nevent: create\n")
+        assert f'"series_id":{missed.id}' in replayed
+
+        live = series_service.create_series(
+            SeriesCreate(title="Silo", creator="Graham Yost", year=2023), session
+        )
+        followed = await asyncio.wait_for(anext(events), 1)
+        assert followed.startswith("id: 2\nevent: create\n")
+        assert f'"series_id":{live.id}' in followed
+        await events.aclose()
+        assert not series_events._subscribers
+    finally:
+        await series_events.stop()